@@ -2,6 +2,18 @@ import streamlit as st
 import pandas as pd
 from datetime import datetime
 import json
+import profiling
+from applications import ApplicationIndex
+from blobs import BlobStore
+from candidates import CandidateIndex
+from catalog import InternshipCatalog
+from columnar import open_snapshot
+from images import Thumbnailer
+from importer import INTERNSHIP_TYPES, detect_format, import_internships
+from records import Education, Project
+from render import badges, metric_card, theme_css
+from storage import CatalogStore
+from skills import SkillCounter, registry
 
 # Page configuration
 st.set_page_config(
@@ -22,6 +34,10 @@ if 'courses' not in st.session_state:
     st.session_state.courses = []
 if 'skills' not in st.session_state:
     st.session_state.skills = []
+if 'skill_counter' not in st.session_state:
+    st.session_state.skill_counter = SkillCounter()
+if 'recommendations' not in st.session_state:
+    st.session_state.recommendations = None
 if 'psychometric_completed' not in st.session_state:
     st.session_state.psychometric_completed = False
 if 'personality_type' not in st.session_state:
@@ -34,97 +50,24 @@ if 'projects' not in st.session_state:
     st.session_state.projects = []
 if 'education' not in st.session_state:
     st.session_state.education = []
-if 'application_status' not in st.session_state:
-    st.session_state.application_status = {}
+if 'new_page' not in st.session_state:
+    st.session_state.new_page = 0
+if 'shortlisted_page' not in st.session_state:
+    st.session_state.shortlisted_page = 0
+if 'rejected_page' not in st.session_state:
+    st.session_state.rejected_page = 0
+if 'browse_results' not in st.session_state:
+    st.session_state.browse_results = None
+if 'browse_page' not in st.session_state:
+    st.session_state.browse_page = 0
+if 'candidate_query' not in st.session_state:
+    st.session_state.candidate_query = None
+if 'candidate_page' not in st.session_state:
+    st.session_state.candidate_page = 0
 
 # Custom CSS for styling with theme support
 def apply_theme():
-    if st.session_state.dark_mode:
-        bg_color = "#0a1929"
-        card_bg = "#1a2332"
-        text_color = "#e0e0e0"
-        border_color = "#2d3748"
-        accent_color = "#3b82f6"
-    else:
-        bg_color = "#fafafa"
-        card_bg = "#ffffff"
-        text_color = "#1a1a1a"
-        border_color = "#e0e0e0"
-        accent_color = "#1f77b4"
-    
-    st.markdown(f"""
-        <style>
-        .stApp {{
-            background-color: {bg_color};
-        }}
-        .main-header {{
-            font-size: 2.5rem;
-            font-weight: bold;
-            color: {accent_color};
-            text-align: center;
-            margin-bottom: 2rem;
-        }}
-        .metric-card {{
-            padding: 1.5rem;
-            border-radius: 1rem;
-            background-color: {card_bg};
-            border: 2px solid {border_color};
-            margin-bottom: 1rem;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-            text-align: center;
-        }}
-        .metric-value {{
-            font-size: 3rem;
-            font-weight: bold;
-            color: {accent_color};
-            margin: 0.5rem 0;
-        }}
-        .metric-label {{
-            font-size: 1.1rem;
-            color: {text_color};
-            font-weight: 500;
-        }}
-        .internship-card {{
-            padding: 1.5rem;
-            border-radius: 0.5rem;
-            background-color: {card_bg};
-            border: 1px solid {border_color};
-            margin-bottom: 1rem;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .skill-badge {{
-            display: inline-block;
-            padding: 0.3rem 0.8rem;
-            margin: 0.2rem;
-            border-radius: 1rem;
-            background-color: #e3f2fd;
-            color: #1976d2;
-            font-size: 0.9rem;
-        }}
-        .theme-toggle {{
-            position: fixed;
-            top: 1rem;
-            right: 1rem;
-            z-index: 999;
-        }}
-        .candidate-card {{
-            padding: 1rem;
-            border-radius: 0.5rem;
-            background-color: {card_bg};
-            border: 1px solid {border_color};
-            margin-bottom: 1rem;
-        }}
-        .candidate-card.greyed {{
-            opacity: 0.5;
-            background-color: #f5f5f5;
-        }}
-        .status-message {{
-            color: #666;
-            font-style: italic;
-            margin-top: 0.5rem;
-        }}
-        </style>
-    """, unsafe_allow_html=True)
+    st.markdown(theme_css(st.session_state.dark_mode), unsafe_allow_html=True)
 
 apply_theme()
 
@@ -176,6 +119,11 @@ SAMPLE_INTERNSHIPS = [
     }
 ]
 
+CARDS_PER_PAGE = 10
+SORT_OPTIONS = ["Best match", "Stipend: high to low", "Stipend: low to high"]
+# Keyboard triage: one key per application on the page ("R" is reserved by Streamlit)
+TRIAGE_KEYS = {"s": "shortlisted", "x": "rejected"}
+
 COURSE_SKILL_MAP = {
     "Data Structures and Algorithms": ["Python", "Problem Solving", "Algorithms"],
     "Web Development": ["HTML", "CSS", "JavaScript", "React"],
@@ -185,6 +133,8 @@ COURSE_SKILL_MAP = {
     "Digital Marketing": ["SEO", "Content Writing", "Social Media", "Analytics"],
     "Business Analytics": ["Excel", "Statistics", "Data Analysis", "SQL"]
 }
+# Curated skill vocabulary offered in the pickers alongside the skills postings require
+COURSE_SKILLS = list(dict.fromkeys(skill for skills in COURSE_SKILL_MAP.values() for skill in skills))
 
 PSYCHOMETRIC_QUESTIONS = [
     {"q": "I enjoy solving complex logical problems", "trait": "analytical"},
@@ -199,6 +149,14 @@ PSYCHOMETRIC_QUESTIONS = [
     {"q": "I like experimenting with new ideas", "trait": "creative"}
 ]
 
+PERSONALITY_TYPES = [
+    "Analytical Thinker",
+    "People Person",
+    "Tech Enthusiast",
+    "Creative Innovator",
+    "Organized Planner"
+]
+
 SAMPLE_CANDIDATES = [
     {
         "id": 1,
@@ -232,35 +190,209 @@ SAMPLE_CANDIDATES = [
     }
 ]
 
+# (internship id, candidate id) pairs
+SAMPLE_APPLICATIONS = [(1, 1), (1, 2), (1, 3), (2, 1), (2, 3), (3, 2)]
+
+@st.cache_resource
+def get_store():
+    """Open the shared SQLite store, seeding it with the sample data on first run"""
+    store = CatalogStore()
+    store.seed(SAMPLE_INTERNSHIPS, SAMPLE_CANDIDATES, SAMPLE_APPLICATIONS)
+    return store
+
+@st.cache_resource
+def get_blob_store():
+    """Open the on-disk store for uploaded photos and resumes"""
+    return BlobStore()
+
+@st.cache_resource
+def get_thumbnailer():
+    """Background worker pool that resizes uploaded photos"""
+    return Thumbnailer(get_blob_store())
+
+@st.cache_resource
+def load_catalog():
+    """Load the internship catalog and its derived indexes once per process"""
+    catalog = InternshipCatalog(curated_skills=COURSE_SKILLS)
+    snapshot = open_snapshot(get_store(), "internships")
+    if snapshot is not None:
+        # Most postings come from the mapped snapshot; sync() then reads only newer ones from SQLite.
+        catalog.load_snapshot(snapshot)
+    return catalog
+
+def get_catalog():
+    """Get the shared catalog, caught up with any newly saved postings; call once per run and pass it on"""
+    catalog = load_catalog()
+    catalog.sync(get_store())
+    return catalog
+
+@st.cache_resource
+def get_course_skill_ids():
+    """Skill IDs taught by each course, as registered by the catalog"""
+    skill_registry = load_catalog().registry
+    return {course: skill_registry.known_ids(skills) for course, skills in COURSE_SKILL_MAP.items()}
+
+def get_skill_options(catalog):
+    """Sorted skill vocabulary for the skill pickers, from courses and the catalog's postings"""
+    return catalog.skill_options()
+
+@st.cache_resource
+def get_learning_resources():
+    """Suggested course for each skill in the gap analysis"""
+    return {
+        "Python": "Python for Beginners - Coursera",
+        "JavaScript": "JavaScript Essentials - Udemy",
+        "React": "React Complete Guide - freeCodeCamp",
+        "Machine Learning": "ML Specialization - Coursera",
+        "SQL": "SQL Masterclass - DataCamp",
+        "SEO": "SEO Fundamentals - Moz Academy",
+        "Content Writing": "Content Writing Masterclass - Udemy",
+        "Social Media": "Social Media Marketing - HubSpot",
+        "Analytics": "Google Analytics Course - Google",
+        "HR Management": "HR Management Basics - Coursera"
+    }
+
+def build_internship_options(catalog):
+    return {f"{title} - {company}": position
+            for position, (title, company) in enumerate(zip(catalog.values("title"), catalog.values("company")))}
+
+@st.cache_resource
+def load_candidate_index():
+    """Load candidate profiles and their bitmap indexes once per process"""
+    # Candidates register their skills, so the catalog goes first and curated skills keep the lowest IDs.
+    load_catalog()
+    index = CandidateIndex()
+    snapshot = open_snapshot(get_store(), "candidates")
+    if snapshot is not None:
+        index.load_snapshot(snapshot)
+    return index
+
+def get_candidate_index():
+    """Get the shared candidate index, caught up with any newly saved profiles; call once per run"""
+    index = load_candidate_index()
+    index.sync(get_store())
+    return index
+
+@st.cache_resource
+def load_application_index():
+    """Load application statuses and their per-status indexes once per process"""
+    return ApplicationIndex()
+
+def get_application_index():
+    """Get the shared application index, caught up with status changes from every session; call once per run"""
+    index = load_application_index()
+    index.sync(get_store())
+    return index
+
+def set_application_status(keys, status):
+    # The rerun that follows the click syncs the application index.
+    get_store().set_application_status(keys, status)
+
+def apply_bulk_triage(keys, status=None):
+    """Apply the bulk form in one transaction: selected rows get status, or each row its triage key"""
+    if status:
+        changes = [(key, status) for key in st.session_state.bulk_selection]
+    else:
+        typed = st.session_state.triage_keys.replace(" ", "").lower()
+        changes = [(key, TRIAGE_KEYS[k]) for key, k in zip(keys, typed) if k in TRIAGE_KEYS]
+    get_store().update_application_statuses(changes)
+
+def applied_ago(timestamp):
+    days = (datetime.now() - datetime.fromisoformat(timestamp)).days
+    if days <= 0:
+        return "Applied today"
+    return f"Applied {days} day{'s' if days > 1 else ''} ago"
+
+def candidate_match(candidate, internship):
+    """Percent of a posting's required skills the candidate has, as the browse cards score students"""
+    if not internship.skill_ids:
+        return 0
+    matched = registry.mask(candidate.skill_ids) & registry.mask(internship.skill_ids)
+    return round(matched.bit_count() * 100 / len(internship.skill_ids))
+
 def recalculate_skills():
-    """Recalculate skills based on current courses"""
-    new_skills = []
+    """Rebuild skills from scratch based on current courses"""
+    course_skill_ids = get_course_skill_ids()
+    counter = SkillCounter()
     for course in st.session_state.courses:
-        if course in COURSE_SKILL_MAP:
-            new_skills.extend(COURSE_SKILL_MAP[course])
-    st.session_state.skills = list(set(new_skills))
-
-def get_recommended_internships():
-    """Get internships matching student's skills"""
-    if not st.session_state.skills:
-        return SAMPLE_INTERNSHIPS
-    
-    recommendations = []
-    for internship in SAMPLE_INTERNSHIPS:
-        matched_skills = set(internship['required_skills']) & set(st.session_state.skills)
-        if matched_skills:
-            recommendations.append(internship)
-    
-    return recommendations if recommendations else SAMPLE_INTERNSHIPS
+        counter.add(course_skill_ids.get(course, ()))
+    st.session_state.skill_counter = counter
+    st.session_state.skills = registry.names(counter)
+    st.session_state.recommendations = None
+
+def get_skill_counter():
+    """Session skill counter, rebuilt if it has drifted from the skill list"""
+    if len(st.session_state.skill_counter) != len(st.session_state.skills):
+        recalculate_skills()
+    return st.session_state.skill_counter
+
+def add_course(course):
+    """Add a course and derive only the skills it contributes"""
+    counter = get_skill_counter()
+    st.session_state.courses.append(course)
+    skill_ids = get_course_skill_ids().get(course, ())
+    return apply_skill_delta(counter.add(skill_ids))
+
+def remove_course(index):
+    """Remove a course and drop the skills no other course provides"""
+    counter = get_skill_counter()
+    course = st.session_state.courses.pop(index)
+    skill_ids = get_course_skill_ids().get(course, ())
+    return apply_skill_delta(counter.remove(skill_ids))
+
+def apply_skill_delta(delta):
+    """Update the skill list and patch cached recommendations from a change delta"""
+    skills = st.session_state.skills
+    if delta.removed:
+        removed = set(registry.names(delta.removed))
+        skills = [s for s in skills if s not in removed]
+    st.session_state.skills = skills + registry.names(delta.added)
+    
+    state = st.session_state.recommendations
+    if state is not None:
+        # No sync here: if the catalog has moved on, the next run rebuilds the counts anyway.
+        catalog = load_catalog()
+        catalog.patch_match_counts(state["counts"], delta.added, 1)
+        catalog.patch_match_counts(state["counts"], delta.removed, -1)
+        state["skills"] = tuple(st.session_state.skills)
+        state["internships"] = None
+    return delta
+
+@profiling.timed("recommendation")
+def get_recommended_internships(catalog):
+    """Get positions of internships matching student's skills"""
+    skills = tuple(st.session_state.skills)
+    state = st.session_state.recommendations
+    if state is None or state["version"] != catalog.version or state["skills"] != skills:
+        state = {
+            "version": catalog.version,
+            "skills": skills,
+            "counts": catalog.match_counts(skills),
+            "internships": None
+        }
+        st.session_state.recommendations = state
+    if state["internships"] is None:
+        state["internships"] = catalog.recommend_from_counts(state["counts"])
+    return state["internships"]
+
+@profiling.timed("scoring")
+def get_skill_scores(catalog):
+    """Score the student's skills against every internship in one pass"""
+    return catalog.score(st.session_state.skills)
+
+def toggle_state(key):
+    st.session_state[key] = not st.session_state[key]
+
+def remove_item(key, index):
+    st.session_state[key].pop(index)
 
 def theme_toggle():
     """Theme toggle button"""
     col1, col2 = st.columns([6, 1])
     with col2:
         theme_icon = "🌙" if not st.session_state.dark_mode else "☀️"
-        if st.button(theme_icon, key="theme_toggle"):
-            st.session_state.dark_mode = not st.session_state.dark_mode
-            st.rerun()
+        # A callback flips the theme before the rerun, so one script run picks it up.
+        st.button(theme_icon, key="theme_toggle", on_click=toggle_state, args=("dark_mode",))
 
 def landing_page():
     theme_toggle()
@@ -392,13 +524,16 @@ def student_dashboard():
     st.markdown(f'<h1 class="main-header">👋 Welcome, {st.session_state.user_data.get("name", "Student")}!</h1>', unsafe_allow_html=True)
     
     # Sidebar toggle button
-    if st.button("☰ Toggle Navigation" if st.session_state.sidebar_visible else "☰ Show Navigation"):
-        st.session_state.sidebar_visible = not st.session_state.sidebar_visible
-        st.rerun()
+    st.button("☰ Toggle Navigation" if st.session_state.sidebar_visible else "☰ Show Navigation",
+              on_click=toggle_state, args=("sidebar_visible",))
     
     # Sidebar navigation
     if st.session_state.sidebar_visible:
         with st.sidebar:
+            photo = st.session_state.user_data.get("photo")
+            thumbnail = get_thumbnailer().thumbnail(photo, "small") if photo else None
+            if thumbnail:
+                st.image(thumbnail, width=64)
             st.markdown("### 📚 Navigation")
             page = st.radio("Go to:", [
                 "Dashboard",
@@ -415,51 +550,41 @@ def student_dashboard():
                 st.session_state.logged_in = False
                 st.session_state.page = "landing"
                 st.rerun()
+            
+            show_debug_panel()
     else:
         page = "Dashboard"
     
-    if page == "Dashboard":
-        show_student_dashboard_home()
-    elif page == "Add Courses":
-        show_add_courses()
-    elif page == "Psychometric Test":
-        show_psychometric_test()
-    elif page == "Browse Internships":
-        show_browse_internships()
-    elif page == "Skill Gap Analysis":
-        show_skill_gap_analysis()
-    elif page == "Resume Builder":
-        show_resume_builder()
-    elif page == "Personal Settings":
-        show_personal_settings()
+    profiling.annotate(page=page)
+    with profiling.timer("dispatch"):
+        if page == "Dashboard":
+            show_student_dashboard_home()
+        elif page == "Add Courses":
+            show_add_courses()
+        elif page == "Psychometric Test":
+            show_psychometric_test()
+        elif page == "Browse Internships":
+            show_browse_internships()
+        elif page == "Skill Gap Analysis":
+            show_skill_gap_analysis()
+        elif page == "Resume Builder":
+            show_resume_builder()
+        elif page == "Personal Settings":
+            show_personal_settings()
 
 def show_student_dashboard_home():
+    catalog = get_catalog()
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        st.markdown(f'''
-        <div class="metric-card">
-            <div class="metric-label">Courses Completed</div>
-            <div class="metric-value">{len(st.session_state.courses)}</div>
-        </div>
-        ''', unsafe_allow_html=True)
+        st.markdown(metric_card("Courses Completed", len(st.session_state.courses)), unsafe_allow_html=True)
     
     with col2:
-        st.markdown(f'''
-        <div class="metric-card">
-            <div class="metric-label">Skills Identified</div>
-            <div class="metric-value">{len(st.session_state.skills)}</div>
-        </div>
-        ''', unsafe_allow_html=True)
+        st.markdown(metric_card("Skills Identified", len(st.session_state.skills)), unsafe_allow_html=True)
     
     with col3:
-        recommended = len(get_recommended_internships())
-        st.markdown(f'''
-        <div class="metric-card">
-            <div class="metric-label">Recommended Internships</div>
-            <div class="metric-value">{recommended}</div>
-        </div>
-        ''', unsafe_allow_html=True)
+        recommended = len(get_recommended_internships(catalog))
+        st.markdown(metric_card("Recommended Internships", recommended), unsafe_allow_html=True)
     
     st.markdown("---")
     
@@ -468,7 +593,7 @@ def show_student_dashboard_home():
     with col1:
         st.markdown("### 🎯 Your Skills")
         if st.session_state.skills:
-            skills_html = "".join([f'<span class="skill-badge">{skill}</span>' for skill in st.session_state.skills])
+            skills_html = badges(tuple(st.session_state.skills))
             st.markdown(skills_html, unsafe_allow_html=True)
         else:
             st.info("No skills added yet. Add courses to identify your skills!")
@@ -483,10 +608,13 @@ def show_student_dashboard_home():
     st.markdown("---")
     st.markdown("### 🌟 Top Recommended Internships")
     
-    recommended_internships = get_recommended_internships()
-    for internship in recommended_internships[:3]:
-        display_internship_card(internship)
+    recommended_internships = get_recommended_internships(catalog)
+    scores = get_skill_scores(catalog)
+    for position in catalog.top_k(recommended_internships, scores.percent, 3):
+        display_internship_card(catalog, position, scores)
 
+@st.fragment
+@profiling.timed("render:add_courses")
 def show_add_courses():
     st.markdown("### 📚 Add Your Completed Courses")
     
@@ -502,10 +630,8 @@ def show_add_courses():
     with col2:
         if st.button("➕ Add Course", use_container_width=True):
             if course and course not in st.session_state.courses:
-                st.session_state.courses.append(course)
-                recalculate_skills()
+                add_course(course)
                 st.success(f"Added {course}!")
-                st.rerun()
             elif course in st.session_state.courses:
                 st.warning("Course already added!")
     
@@ -519,13 +645,10 @@ def show_add_courses():
             with col1:
                 st.markdown(f"**{i+1}. {course}**")
                 skills = COURSE_SKILL_MAP.get(course, [])
-                skills_html = "".join([f'<span class="skill-badge">{skill}</span>' for skill in skills])
+                skills_html = badges(tuple(skills))
                 st.markdown(skills_html, unsafe_allow_html=True)
             with col2:
-                if st.button("🗑️", key=f"del_{i}"):
-                    st.session_state.courses.pop(i)
-                    recalculate_skills()
-                    st.rerun()
+                st.button("🗑️", key=f"del_{i}", on_click=remove_course, args=(i,))
     else:
         st.info("No courses added yet. Start adding courses to identify your skills!")
 
@@ -575,60 +698,143 @@ def show_psychometric_test():
         st.success("Test completed successfully!")
         st.rerun()
 
+@st.fragment
+@profiling.timed("render:browse_internships")
 def show_browse_internships():
     st.markdown("### 🔍 Browse Internships")
     
+    catalog = get_catalog()
+    query = st.text_input("Search", placeholder="Search by title, company or description", label_visibility="collapsed")
+    
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        location_filter = st.multiselect("Location", ["Bangalore", "Mumbai", "Delhi", "Remote"])
+        location_filter = st.multiselect("Location", catalog.derived("location_options", InternshipCatalog.location_options))
     
     with col2:
-        type_filter = st.multiselect("Type", ["Remote", "On-site", "Hybrid"])
+        type_filter = st.multiselect("Type", INTERNSHIP_TYPES)
     
     with col3:
-        skill_filter = st.multiselect("Skills", list(set([s for skills in COURSE_SKILL_MAP.values() for s in skills])))
+        skill_filter = st.multiselect("Skills", get_skill_options(catalog))
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        top = max(-(-int(catalog.stipend_range()[1]) // 1000) * 1000, 1000)
+        stipend_filter = st.slider("Monthly stipend (₹)", 0, top, (0, top), step=1000)
+        if stipend_filter == (0, top):
+            stipend_filter = None
+    
+    with col2:
+        sort_by = st.selectbox("Sort by", SORT_OPTIONS)
     
     st.markdown("---")
     
-    filtered_internships = get_recommended_internships()
+    filters = (tuple(location_filter), tuple(type_filter), tuple(skill_filter), stipend_filter)
+    results = get_browse_results(catalog, query.strip(), filters, sort_by)
+    total = len(results["positions"])
+    
+    st.markdown(f"### Found {total} Internships")
+    
+    page_count = max(1, -(-total // CARDS_PER_PAGE))
+    page = min(st.session_state.browse_page, page_count - 1)
+    
+    for position in get_ranked_page(catalog, results, page):
+        display_internship_card(catalog, position, results["scores"])
+    
+    show_page_controls("browse_page", page, page_count)
+
+@profiling.timed("filtering")
+def get_browse_results(catalog, query, filters, sort_by=SORT_OPTIONS[0]):
+    """Search, filter and score internships, reusing the session's results until inputs change"""
+    key = (catalog.version, tuple(st.session_state.skills), query, filters, sort_by)
+    results = st.session_state.browse_results
+    if results is not None and results["key"] == key:
+        return results
+    
+    location_filter, type_filter, skill_filter, stipend_filter = filters
+    scores = get_skill_scores(catalog)
+    if query:
+        positions, rank_values = catalog.search_text(query)
+    else:
+        positions, rank_values = get_recommended_internships(catalog), scores.percent
     
     if location_filter:
-        filtered_internships = [i for i in filtered_internships if any(loc in i["location"] for loc in location_filter)]
+        positions = positions[catalog.location_mask(location_filter)[positions]]
     
     if type_filter:
-        filtered_internships = [i for i in filtered_internships if i["type"] in type_filter]
+        matching_ids = get_store().filter_internship_ids(types=type_filter)
+        positions = positions[catalog.id_mask(matching_ids)[positions]]
     
     if skill_filter:
-        filtered_internships = [i for i in filtered_internships if any(s in i["required_skills"] for s in skill_filter)]
-    
-    st.markdown(f"### Found {len(filtered_internships)} Internships")
-    
-    for internship in filtered_internships:
-        display_internship_card(internship)
+        # The picker offers canonical names, so match through the registry rather than stored spellings.
+        positions = positions[catalog.skill_mask(skill_filter)[positions]]
+    
+    if stipend_filter:
+        positions = positions[catalog.stipend_mask(*stipend_filter)[positions]]
+    
+    if sort_by != SORT_OPTIONS[0]:
+        # Equal stipends tie, so top_k() keeps them in catalog order in both directions.
+        rank_values = catalog.stipend_ranks(descending=sort_by == SORT_OPTIONS[1])
+    
+    results = {
+        "key": key,
+        "positions": positions,
+        "scores": scores,
+        "rank_values": rank_values,
+        "ranked": []
+    }
+    st.session_state.browse_results = results
+    st.session_state.browse_page = 0
+    return results
+
+@profiling.timed("ranking")
+def get_ranked_page(catalog, results, page):
+    """Positions for one page, ranked by relevance or match score with heap-based top-K selection"""
+    start = page * CARDS_PER_PAGE
+    end = min(start + CARDS_PER_PAGE, len(results["positions"]))
+    if len(results["ranked"]) < end:
+        k = max(end, 2 * len(results["ranked"]))
+        results["ranked"] = catalog.top_k(results["positions"], results["rank_values"], k)
+    return results["ranked"][start:end]
+
+def change_page(key, step):
+    st.session_state[key] = max(0, st.session_state[key] + step)
+
+def show_page_controls(key, page, page_count):
+    """Previous/Next buttons that move the page number stored under key"""
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col1:
+        st.button("⬅️ Previous", key=f"{key}_prev", on_click=change_page, args=(key, -1),
+                  disabled=page == 0, use_container_width=True)
+    with col2:
+        st.markdown(f'<p style="text-align: center;">Page {page + 1} of {page_count}</p>', unsafe_allow_html=True)
+    with col3:
+        st.button("Next ➡️", key=f"{key}_next", on_click=change_page, args=(key, 1),
+                  disabled=page >= page_count - 1, use_container_width=True)
 
-def display_internship_card(internship):
+@profiling.timed("render:internship_card")
+def display_internship_card(catalog, position, scores):
+    internship = catalog[position]
     st.markdown('<div class="internship-card">', unsafe_allow_html=True)
     
     col1, col2 = st.columns([3, 1])
     
     with col1:
-        st.markdown(f"### {internship['title']}")
-        st.markdown(f"**{internship['company']}** • {internship['location']} • {internship['type']}")
-        st.markdown(f"💰 {internship['stipend']}")
-        st.markdown(f"_{internship['description']}_")
+        st.markdown(f"### {internship.title}")
+        st.markdown(f"**{internship.company}** • {internship.location} • {internship.type}")
+        st.markdown(f"💰 {internship.stipend}")
+        st.markdown(f"_{internship.description}_")
         
-        skills_html = "".join([f'<span class="skill-badge">{skill}</span>' for skill in internship['required_skills']])
+        skills_html = badges(internship.required_skills)
         st.markdown(skills_html, unsafe_allow_html=True)
     
     with col2:
-        if st.button("Apply on LinkedIn", key=f"apply_{internship['id']}", use_container_width=True):
+        if st.button("Apply on LinkedIn", key=f"apply_{internship.id}", use_container_width=True):
             st.success("Redirecting to LinkedIn...")
         
         if st.session_state.skills:
-            matched = len(set(internship['required_skills']) & set(st.session_state.skills))
-            total = len(internship['required_skills'])
-            match_pct = (matched / total) * 100
+            match_pct = scores.percent[position]
             st.metric("Skill Match", f"{match_pct:.0f}%")
     
     st.markdown('</div>', unsafe_allow_html=True)
@@ -642,41 +848,33 @@ def show_skill_gap_analysis():
     
     st.markdown("Select an internship to compare your skills:")
     
-    internship_options = {f"{i['title']} - {i['company']}": i for i in SAMPLE_INTERNSHIPS}
+    catalog = get_catalog()
+    internship_options = catalog.derived("internship_options", build_internship_options)
     selected_internship_name = st.selectbox("Choose Internship", list(internship_options.keys()))
-    selected_internship = internship_options[selected_internship_name]
+    row = internship_options[selected_internship_name]
+    selected_internship = catalog[row]
     
     st.markdown("---")
     
     st.markdown(f"### Analysis for: {selected_internship['title']}")
     
-    your_skills = set(st.session_state.skills)
-    required_skills = set(selected_internship['required_skills'])
+    your_mask = registry.mask(registry.known_ids(st.session_state.skills))
+    required_mask = registry.mask(selected_internship['skill_ids'])
     
-    matched_skills = your_skills & required_skills
-    missing_skills = required_skills - your_skills
-    extra_skills = your_skills - required_skills
+    matched_skills = registry.names(registry.ids_in_mask(your_mask & required_mask))
+    missing_skills = registry.names(registry.ids_in_mask(required_mask & ~your_mask))
+    extra_skills = registry.names(registry.ids_in_mask(your_mask & ~required_mask))
     
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        st.markdown(f'''
-        <div class="metric-card">
-            <div class="metric-label">Matched Skills</div>
-            <div class="metric-value" style="color: #4caf50;">{len(matched_skills)}</div>
-        </div>
-        ''', unsafe_allow_html=True)
+        st.markdown(metric_card("Matched Skills", len(matched_skills), "#4caf50"), unsafe_allow_html=True)
         if matched_skills:
             for skill in matched_skills:
                 st.markdown(f"✅ {skill}")
     
     with col2:
-        st.markdown(f'''
-        <div class="metric-card">
-            <div class="metric-label">Skills to Learn</div>
-            <div class="metric-value" style="color: #ff9800;">{len(missing_skills)}</div>
-        </div>
-        ''', unsafe_allow_html=True)
+        st.markdown(metric_card("Skills to Learn", len(missing_skills), "#ff9800"), unsafe_allow_html=True)
         if missing_skills:
             for skill in missing_skills:
                 st.markdown(f"⚠️ {skill}")
@@ -684,17 +882,14 @@ def show_skill_gap_analysis():
             st.success("You have all required skills!")
     
     with col3:
-        st.markdown(f'''
-        <div class="metric-card">
-            <div class="metric-label">Additional Skills</div>
-            <div class="metric-value" style="color: #2196f3;">{len(extra_skills)}</div>
-        </div>
-        ''', unsafe_allow_html=True)
+        st.markdown(metric_card("Additional Skills", len(extra_skills), "#2196f3"), unsafe_allow_html=True)
         if extra_skills:
             for skill in extra_skills:
                 st.markdown(f"➕ {skill}")
     
-    match_percentage = (len(matched_skills) / len(required_skills) * 100) if required_skills else 0
+    # Only the selected posting is shown, so it is scored on its own rather than with the whole catalog.
+    required = len(selected_internship['skill_ids'])
+    match_percentage = len(matched_skills) * 100 / required if required else 0.0
     st.markdown(f"### Overall Match: {match_percentage:.0f}%")
     st.progress(match_percentage / 100)
     
@@ -702,18 +897,7 @@ def show_skill_gap_analysis():
         st.markdown("---")
         st.markdown("### 📚 Recommended Learning Resources")
         
-        learning_map = {
-            "Python": "Python for Beginners - Coursera",
-            "JavaScript": "JavaScript Essentials - Udemy",
-            "React": "React Complete Guide - freeCodeCamp",
-            "Machine Learning": "ML Specialization - Coursera",
-            "SQL": "SQL Masterclass - DataCamp",
-            "SEO": "SEO Fundamentals - Moz Academy",
-            "Content Writing": "Content Writing Masterclass - Udemy",
-            "Social Media": "Social Media Marketing - HubSpot",
-            "Analytics": "Google Analytics Course - Google",
-            "HR Management": "HR Management Basics - Coursera"
-        }
+        learning_map = get_learning_resources()
         
         for skill in missing_skills:
             resource = learning_map.get(skill, f"{skill} Tutorial - Online")
@@ -748,6 +932,41 @@ def show_resume_builder():
     
     st.markdown("---")
     
+    show_education_section()
+    
+    st.markdown("---")
+    
+    show_projects_section()
+    
+    st.markdown("---")
+    
+    st.markdown("#### Professional Summary")
+    summary = st.text_area(
+        "Write a brief summary (will be customized based on resume type)",
+        value=f"Motivated student with skills in {', '.join(st.session_state.skills[:3])} seeking opportunities.",
+        height=100
+    )
+    
+    st.markdown("---")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        if st.button("📥 Generate PDF", use_container_width=True):
+            st.success(f"Resume generated for {resume_type}! (In production, this would download a PDF)")
+    
+    with col2:
+        if st.button("💾 Save Draft", use_container_width=True):
+            st.success("Resume draft saved!")
+    
+    with col3:
+        if st.button("👁️ Preview", use_container_width=True):
+            show_resume_preview(resume_name, resume_email, resume_phone, resume_linkedin, 
+                              resume_type, summary)
+
+@st.fragment
+@profiling.timed("render:education_section")
+def show_education_section():
     st.markdown("#### Education Details")
     
     col1, col2 = st.columns(2)
@@ -761,14 +980,13 @@ def show_resume_builder():
     
     if st.button("➕ Add Education", key="add_edu"):
         if edu_degree and edu_college:
-            st.session_state.education.append({
-                "degree": edu_degree,
-                "college": edu_college,
-                "year": edu_year,
-                "marks": edu_marks
-            })
+            st.session_state.education.append(Education(
+                degree=edu_degree,
+                college=edu_college,
+                year=edu_year,
+                marks=edu_marks
+            ))
             st.success("Education added!")
-            st.rerun()
     
     if st.session_state.education:
         st.markdown("#### Your Education")
@@ -778,12 +996,11 @@ def show_resume_builder():
                 st.markdown(f"**{edu['degree']}** - {edu['college']}")
                 st.markdown(f"Year: {edu['year']} | Marks: {edu['marks']}")
             with col2:
-                if st.button("🗑️", key=f"del_edu_{i}"):
-                    st.session_state.education.pop(i)
-                    st.rerun()
-    
-    st.markdown("---")
-    
+                st.button("🗑️", key=f"del_edu_{i}", on_click=remove_item, args=("education", i))
+
+@st.fragment
+@profiling.timed("render:projects_section")
+def show_projects_section():
     st.markdown("#### Projects")
     
     col1, col2 = st.columns(2)
@@ -804,14 +1021,13 @@ def show_resume_builder():
     
     if st.button("➕ Add Project", key="add_project"):
         if project_name and project_desc:
-            st.session_state.projects.append({
-                "name": project_name,
-                "description": project_desc,
-                "tags": project_tags,
-                "skills": project_skills
-            })
+            st.session_state.projects.append(Project.create(
+                project_name,
+                project_desc,
+                tags=project_tags,
+                skills=project_skills
+            ))
             st.success("Project added!")
-            st.rerun()
     
     if st.session_state.projects:
         st.markdown("#### Your Projects")
@@ -819,40 +1035,12 @@ def show_resume_builder():
             with st.expander(f"{proj['name']}"):
                 st.markdown(f"**Description:** {proj['description']}")
                 if proj['tags']:
-                    tags_html = "".join([f'<span class="skill-badge">{tag}</span>' for tag in proj['tags']])
+                    tags_html = badges(tuple(proj['tags']))
                     st.markdown(f"**Tags:** {tags_html}", unsafe_allow_html=True)
                 if proj['skills']:
-                    skills_html = "".join([f'<span class="skill-badge">{skill}</span>' for skill in proj['skills']])
+                    skills_html = badges(tuple(proj['skills']))
                     st.markdown(f"**Skills:** {skills_html}", unsafe_allow_html=True)
-                if st.button("🗑️ Remove", key=f"del_proj_{i}"):
-                    st.session_state.projects.pop(i)
-                    st.rerun()
-    
-    st.markdown("---")
-    
-    st.markdown("#### Professional Summary")
-    summary = st.text_area(
-        "Write a brief summary (will be customized based on resume type)",
-        value=f"Motivated student with skills in {', '.join(st.session_state.skills[:3])} seeking opportunities.",
-        height=100
-    )
-    
-    st.markdown("---")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        if st.button("📥 Generate PDF", use_container_width=True):
-            st.success(f"Resume generated for {resume_type}! (In production, this would download a PDF)")
-    
-    with col2:
-        if st.button("💾 Save Draft", use_container_width=True):
-            st.success("Resume draft saved!")
-    
-    with col3:
-        if st.button("👁️ Preview", use_container_width=True):
-            show_resume_preview(resume_name, resume_email, resume_phone, resume_linkedin, 
-                              resume_type, summary)
+                st.button("🗑️ Remove", key=f"del_proj_{i}", on_click=remove_item, args=("projects", i))
 
 def show_resume_preview(name, email, phone, linkedin, resume_type, summary):
     """Show resume preview in a modal-like expander"""
@@ -883,7 +1071,7 @@ def show_resume_preview(name, email, phone, linkedin, resume_type, summary):
         else:
             relevant_skills = st.session_state.skills
         
-        skills_html = "".join([f'<span class="skill-badge">{skill}</span>' for skill in relevant_skills])
+        skills_html = badges(tuple(relevant_skills))
         st.markdown(skills_html, unsafe_allow_html=True)
         st.markdown("---")
         
@@ -922,8 +1110,19 @@ def show_personal_settings():
     with col2:
         st.markdown("#### Professional Information")
         new_linkedin = st.text_input("LinkedIn Profile", value=st.session_state.user_data.get("linkedin", ""))
+        photo = st.session_state.user_data.get("photo")
+        if photo:
+            thumbnail = get_thumbnailer().thumbnail(photo, "medium")
+            if thumbnail:
+                st.image(thumbnail, width=160)
+            elif get_thumbnailer().pending(photo.digest):
+                st.caption("Preparing photo preview...")
         new_photo = st.file_uploader("Upload Photograph", type=["jpg", "png", "jpeg"])
         resume_pdf = st.file_uploader("Upload Resume PDF", type=["pdf"])
+        resume = st.session_state.user_data.get("resume")
+        if resume:
+            st.download_button(f"📄 {resume.name}", lambda: get_blob_store().read(resume.digest),
+                               file_name=resume.name, mime=resume.content_type)
     
     st.markdown("---")
     
@@ -947,7 +1146,10 @@ def show_personal_settings():
             st.session_state.user_data["dob"] = new_dob
             st.session_state.user_data["linkedin"] = new_linkedin
             if new_photo:
-                st.session_state.user_data["photo"] = new_photo
+                st.session_state.user_data["photo"] = get_blob_store().put(new_photo, new_photo.name, new_photo.type)
+                get_thumbnailer().submit(st.session_state.user_data["photo"])
+            if resume_pdf:
+                st.session_state.user_data["resume"] = get_blob_store().put(resume_pdf, resume_pdf.name, resume_pdf.type)
             st.success("✅ Settings saved successfully!")
     
     with col2:
@@ -967,9 +1169,8 @@ def recruiter_dashboard():
     st.markdown(f"### Welcome, {st.session_state.user_data.get('name', 'Recruiter')}!")
     
     # Sidebar toggle button
-    if st.button("☰ Toggle Navigation" if st.session_state.sidebar_visible else "☰ Show Navigation"):
-        st.session_state.sidebar_visible = not st.session_state.sidebar_visible
-        st.rerun()
+    st.button("☰ Toggle Navigation" if st.session_state.sidebar_visible else "☰ Show Navigation",
+              on_click=toggle_state, args=("sidebar_visible",))
     
     if st.session_state.sidebar_visible:
         with st.sidebar:
@@ -977,6 +1178,7 @@ def recruiter_dashboard():
             page = st.radio("Go to:", [
                 "Dashboard",
                 "Post Internship",
+                "Bulk Import",
                 "Search Candidates",
                 "Manage Applications"
             ])
@@ -986,51 +1188,71 @@ def recruiter_dashboard():
                 st.session_state.logged_in = False
                 st.session_state.page = "landing"
                 st.rerun()
+            
+            show_debug_panel()
     else:
         page = "Dashboard"
     
-    if page == "Dashboard":
-        show_recruiter_dashboard_home()
-    elif page == "Post Internship":
-        show_post_internship()
-    elif page == "Search Candidates":
-        show_search_candidates()
-    elif page == "Manage Applications":
-        show_manage_applications()
+    profiling.annotate(page=page)
+    with profiling.timer("dispatch"):
+        if page == "Dashboard":
+            show_recruiter_dashboard_home()
+        elif page == "Post Internship":
+            show_post_internship()
+        elif page == "Bulk Import":
+            show_bulk_import()
+        elif page == "Search Candidates":
+            show_search_candidates()
+        elif page == "Manage Applications":
+            show_manage_applications()
+
+def show_debug_panel():
+    """Profiling panel for recent reruns, hidden unless profiling is on and the URL has ?debug=1"""
+    if not profiling.ENABLED or st.query_params.get("debug") != "1":
+        return
+    
+    with st.expander("🛠️ Debug: Rerun Profile"):
+        runs = profiling.recent_runs()
+        if not runs:
+            st.caption("No reruns recorded yet")
+            return
+        st.dataframe(pd.DataFrame([{
+            "kind": run["kind"],
+            "page": run.get("page", ""),
+            "ms": run["timings"][run["kind"]]["ms"],
+            "retained_kb": run.get("memory", {}).get("retained_kb"),
+            "peak_kb": run.get("memory", {}).get("peak_kb"),
+        } for run in reversed(runs)]), hide_index=True)
+        st.markdown("**Last rerun**")
+        st.dataframe(pd.DataFrame([
+            {"section": name, "ms": timing["ms"], "calls": timing["count"]}
+            for name, timing in runs[-1]["timings"].items()
+        ]), hide_index=True)
 
 def show_recruiter_dashboard_home():
+    store = get_store()
+    # Applications are triaged in one queue shared by all recruiters, as in Manage Applications,
+    # so they are counted over every posting; only the posting count is the recruiter's own.
+    posted, _ = store.dashboard_stats(st.session_state.user_data.get("email", ""))
+    totals, this_week = store.dashboard_stats()
+    
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        st.markdown('''
-        <div class="metric-card">
-            <div class="metric-label">Posted Internships</div>
-            <div class="metric-value">5</div>
-        </div>
-        ''', unsafe_allow_html=True)
+        st.markdown(metric_card("Posted Internships", posted.get("internships", 0)), unsafe_allow_html=True)
     
     with col2:
-        st.markdown('''
-        <div class="metric-card">
-            <div class="metric-label">Total Applications</div>
-            <div class="metric-value">47</div>
-        </div>
-        ''', unsafe_allow_html=True)
+        st.markdown(metric_card("Total Applications", totals.get("applications", 0)), unsafe_allow_html=True)
     
     with col3:
-        st.markdown('''
-        <div class="metric-card">
-            <div class="metric-label">Matched Candidates</div>
-            <div class="metric-value">23</div>
-        </div>
-        ''', unsafe_allow_html=True)
+        st.markdown(metric_card("Shortlisted Candidates", totals.get("status:shortlisted", 0)), unsafe_allow_html=True)
     
     st.markdown("---")
     st.markdown("### 📊 Recent Activity")
     
-    st.info("🎯 15 new applications received this week")
-    st.success("✅ 3 internships filled successfully")
-    st.warning("⚠️ 2 internship postings expiring soon")
+    st.info(f"🎯 {this_week.get('applications', 0)} new applications received this week")
+    st.success(f"✅ {this_week.get('moved:shortlisted', 0)} candidates shortlisted this week")
+    st.warning(f"⚠️ {totals.get('status:pending', 0)} applications waiting for review")
 
 def show_post_internship():
     st.markdown("### 📢 Post New Internship")
@@ -1041,7 +1263,7 @@ def show_post_internship():
         job_title = st.text_input("Job Title")
         company = st.text_input("Company Name")
         location = st.text_input("Location")
-        job_type = st.selectbox("Type", ["Remote", "On-site", "Hybrid"])
+        job_type = st.selectbox("Type", INTERNSHIP_TYPES)
     
     with col2:
         stipend = st.text_input("Stipend (e.g., ₹15,000/month)")
@@ -1052,7 +1274,7 @@ def show_post_internship():
     st.markdown("#### Required Skills")
     skills = st.multiselect(
         "Select required skills",
-        list(set([s for skills in COURSE_SKILL_MAP.values() for s in skills]))
+        get_skill_options(get_catalog())
     )
     
     st.markdown("#### Job Description")
@@ -1060,51 +1282,130 @@ def show_post_internship():
     
     if st.button("📤 Post Internship", use_container_width=True):
         if all([job_title, company, location, stipend, skills, description]):
+            internship = {
+                "title": job_title,
+                "company": company,
+                "location": location,
+                "type": job_type,
+                "stipend": stipend,
+                "required_skills": registry.normalize(skills),
+                "description": description,
+                "linkedin_url": "",
+                "duration": duration,
+                "start_date": str(start_date),
+                "openings": openings,
+                "posted_by": st.session_state.user_data.get("email", "")
+            }
+            get_store().add_internship(internship)
             st.success("✅ Internship posted successfully!")
         else:
             st.error("Please fill all required fields")
 
+def show_bulk_import():
+    st.markdown("### 📦 Bulk Import Internships")
+    st.markdown(
+        "Upload a CSV, JSONL or JSON array file with `title`, `company`, `location`, `type`, `stipend`, "
+        "`required_skills` and `description` columns. Skills may be separated by `;`, `|` or `,`."
+    )
+    
+    upload = st.file_uploader("Postings file", type=["csv", "jsonl", "ndjson", "json"])
+    chunk_size = st.number_input("Rows per transaction", min_value=100, max_value=100000, value=5000, step=100)
+    
+    if st.button("📥 Import", use_container_width=True, disabled=upload is None):
+        progress = st.empty()
+        report = import_internships(
+            upload, get_store(),
+            fmt=detect_format(upload.name),
+            chunk_size=int(chunk_size),
+            progress=lambda r: progress.info(f"⏳ {r.summary()}"),
+            posted_by=st.session_state.user_data.get("email", "")
+        )
+        progress.empty()
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Imported", f"{report.imported:,}")
+        with col2:
+            st.metric("Rejected", f"{report.rejected:,}")
+        with col3:
+            st.metric("Rows / second", f"{report.rows_per_second:,.0f}")
+        
+        if report.imported:
+            st.success(f"✅ {report.summary()}")
+        if report.reject_samples:
+            st.markdown("#### Rejected Rows")
+            st.dataframe(pd.DataFrame(report.reject_samples), use_container_width=True, hide_index=True)
+
+@st.fragment
+@profiling.timed("render:search_candidates")
 def show_search_candidates():
     st.markdown("### 🔍 Search Candidates")
     
+    index = get_candidate_index()
+    
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        skill_search = st.multiselect("Required Skills", ["Python", "JavaScript", "SQL", "Machine Learning"])
+        skill_search = st.multiselect("Required Skills", get_skill_options(get_catalog()))
+        skill_mode = st.radio("Skills to match", ["All", "Any"], horizontal=True, key="skill_mode")
     
     with col2:
-        personality_search = st.multiselect("Personality Type", [
-            "Analytical Thinker",
-            "People Person",
-            "Tech Enthusiast",
-            "Creative Innovator"
-        ])
+        personality_search = st.multiselect("Personality Type", sorted(set(PERSONALITY_TYPES) | set(index.personalities())))
     
     with col3:
         course_search = st.multiselect("Courses", list(COURSE_SKILL_MAP.keys()))
+        course_mode = st.radio("Courses to match", ["Any", "All"], horizontal=True, key="course_mode")
     
     if st.button("🔎 Search", use_container_width=True):
-        st.markdown("---")
-        st.markdown("### 👥 Matched Candidates")
+        st.session_state.candidate_query = (
+            tuple(skill_search),
+            tuple(personality_search),
+            tuple(course_search),
+            skill_mode == "All",
+            course_mode == "All"
+        )
+        st.session_state.candidate_page = 0
+    
+    if st.session_state.candidate_query is None:
+        return
+    
+    skills, personalities, courses, match_all_skills, match_all_courses = st.session_state.candidate_query
+    results = index.search(
+        skills, personalities, courses,
+        match_all_skills=match_all_skills,
+        match_all_courses=match_all_courses,
+        page=st.session_state.candidate_page,
+        per_page=CARDS_PER_PAGE
+    )
+    
+    st.markdown("---")
+    st.markdown(f"### 👥 Matched Candidates ({results.total})")
+    
+    if not results.total:
+        st.info("No candidates match these filters")
+        return
+    
+    for candidate, score in zip(results.candidates, results.scores):
+        col1, col2, col3 = st.columns([3, 1, 1])
         
-        for candidate in SAMPLE_CANDIDATES:
-            col1, col2, col3 = st.columns([3, 1, 1])
-            
-            with col1:
-                st.markdown(f"#### {candidate['name']}")
-                st.markdown(f"📧 {candidate['email']}")
-                skills_html = "".join([f'<span class="skill-badge">{skill}</span>' for skill in candidate['skills']])
-                st.markdown(skills_html, unsafe_allow_html=True)
-                st.markdown(f"**Personality:** {candidate['personality']}")
-            
-            with col2:
-                st.metric("Match Score", f"{candidate['match']}%")
-            
-            with col3:
-                if st.button("👁️ View Profile", key=f"view_{candidate['id']}", use_container_width=True):
-                    show_candidate_profile(candidate)
-            
-            st.markdown("---")
+        with col1:
+            st.markdown(f"#### {candidate.name}")
+            st.markdown(f"📧 {candidate.email}")
+            skills_html = badges(candidate.skills)
+            st.markdown(skills_html, unsafe_allow_html=True)
+            st.markdown(f"**Personality:** {candidate.personality}")
+        
+        with col2:
+            st.metric("Match Score", f"{score:.0f}%" if score is not None else "—")
+        
+        with col3:
+            if st.button("👁️ View Profile", key=f"view_{candidate.id}", use_container_width=True):
+                show_candidate_profile(candidate)
+        
+        st.markdown("---")
+    
+    page_count = -(-results.total // CARDS_PER_PAGE)
+    show_page_controls("candidate_page", st.session_state.candidate_page, page_count)
 
 def show_candidate_profile(candidate):
     """Display candidate profile in an expander"""
@@ -1125,7 +1426,7 @@ def show_candidate_profile(candidate):
         
         st.markdown("---")
         st.markdown("#### Skills")
-        skills_html = "".join([f'<span class="skill-badge">{skill}</span>' for skill in candidate['skills']])
+        skills_html = badges(tuple(candidate['skills']))
         st.markdown(skills_html, unsafe_allow_html=True)
         
         st.markdown("---")
@@ -1138,85 +1439,121 @@ def show_candidate_profile(candidate):
             if st.button("📧 Contact Candidate", key=f"contact_{candidate['id']}", use_container_width=True):
                 st.success("Email sent to candidate!")
 
+@st.fragment
+@profiling.timed("render:manage_applications")
 def show_manage_applications():
     st.markdown("### 📋 Manage Applications")
     
+    store = get_store()
+    index = get_application_index()
+    candidates = get_candidate_index()
+    internships = get_catalog()
     tabs = st.tabs(["New Applications", "Shortlisted", "Rejected"])
     
     with tabs[0]:
-        st.markdown("#### 🆕 New Applications (12)")
+        total = index.count("pending")
+        st.markdown(f"#### 🆕 New Applications ({total})")
         
-        for i, candidate in enumerate(SAMPLE_CANDIDATES):
-            candidate_id = f"new_{candidate['id']}"
-            status = st.session_state.application_status.get(candidate_id, "pending")
-            
-            if status == "pending":
-                st.markdown('<div class="candidate-card">', unsafe_allow_html=True)
-            else:
-                st.markdown('<div class="candidate-card greyed">', unsafe_allow_html=True)
-            
-            col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
+        if not total:
+            st.info("No new applications")
+        else:
+            page_count = -(-total // CARDS_PER_PAGE)
+            page = min(st.session_state.new_page, page_count - 1)
+            applications = index.page(store, "pending", page, CARDS_PER_PAGE)
+            keys = [(a["internship_id"], a["candidate_id"]) for a in applications]
+            labels = {key: f"{candidates.get(key[1])['name']} - {internships.get(key[0])['title']}" for key in keys}
             
-            with col1:
-                st.markdown(f"**{candidate['name']}** - Software Development Intern")
-                st.markdown("Applied 2 days ago")
-                skills_html = "".join([f'<span class="skill-badge">{skill}</span>' for skill in candidate['skills'][:3]])
-                st.markdown(skills_html, unsafe_allow_html=True)
+            with st.form("bulk_triage", clear_on_submit=True):
+                col1, col2 = st.columns([3, 1])
+                with col1:
+                    st.multiselect("Select applications", keys, format_func=labels.get, key="bulk_selection")
+                with col2:
+                    st.text_input("Triage keys", key="triage_keys", placeholder="e.g. ssx-s",
+                                  help="One key per application on this page, top to bottom: "
+                                       "s = shortlist, x = reject, anything else = skip. Press Enter to apply.")
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.form_submit_button("⌨️ Apply Keys", on_click=apply_bulk_triage, args=(keys,),
+                                          use_container_width=True)
+                with col2:
+                    st.form_submit_button("✅ Shortlist Selected", on_click=apply_bulk_triage, args=(keys, "shortlisted"),
+                                          shortcut="Shift+S", use_container_width=True)
+                with col3:
+                    st.form_submit_button("❌ Reject Selected", on_click=apply_bulk_triage, args=(keys, "rejected"),
+                                          shortcut="Shift+X", use_container_width=True)
             
-            if status == "pending":
+            for position, (application, key) in enumerate(zip(applications, keys)):
+                candidate, internship = candidates.get(key[1]), internships.get(key[0])
+                button_key = f"{key[0]}_{key[1]}"
+                
+                st.markdown('<div class="candidate-card">', unsafe_allow_html=True)
+                
+                col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
+                
+                with col1:
+                    st.markdown(f"**{position + 1}. {candidate['name']}** - {internship['title']}")
+                    st.markdown(f"{applied_ago(application['applied_at'])} | Match: {candidate_match(candidate, internship)}%")
+                    skills_html = badges(tuple(candidate['skills'][:3]))
+                    st.markdown(skills_html, unsafe_allow_html=True)
+                
                 with col2:
-                    if st.button("👁️ View", key=f"view_app_{candidate_id}", use_container_width=True):
+                    if st.button("👁️ View", key=f"view_app_{button_key}", use_container_width=True):
                         show_candidate_profile(candidate)
                 
                 with col3:
-                    if st.button("✅ Shortlist", key=f"short_{candidate_id}", use_container_width=True):
-                        st.session_state.application_status[candidate_id] = "shortlisted"
-                        st.rerun()
+                    st.button("✅ Shortlist", key=f"short_{button_key}", on_click=set_application_status,
+                              args=([key], "shortlisted"), use_container_width=True)
                 
                 with col4:
-                    if st.button("❌ Reject", key=f"reject_{candidate_id}", use_container_width=True):
-                        st.session_state.application_status[candidate_id] = "rejected"
-                        st.rerun()
-            else:
-                with col2:
-                    st.markdown("")
-                with col3:
-                    if status == "shortlisted":
-                        st.markdown('<div class="status-message">✅ Added to shortlist</div>', unsafe_allow_html=True)
-                    elif status == "rejected":
-                        st.markdown('<div class="status-message">❌ Rejected for now</div>', unsafe_allow_html=True)
+                    st.button("❌ Reject", key=f"reject_{button_key}", on_click=set_application_status,
+                              args=([key], "rejected"), use_container_width=True)
+                
+                st.markdown('</div>', unsafe_allow_html=True)
+                st.markdown("---")
             
-            st.markdown('</div>', unsafe_allow_html=True)
-            st.markdown("---")
+            show_page_controls("new_page", page, page_count)
     
     with tabs[1]:
         st.markdown("#### ⭐ Shortlisted Candidates")
         
-        shortlisted = [k for k, v in st.session_state.application_status.items() if v == "shortlisted"]
+        total = index.count("shortlisted")
         
-        if shortlisted:
-            st.markdown(f"**Total Shortlisted: {len(shortlisted)}**")
+        if total:
+            st.markdown(f"**Total Shortlisted: {total}**")
             
-            for candidate in SAMPLE_CANDIDATES[:len(shortlisted)]:
+            page_count = -(-total // CARDS_PER_PAGE)
+            page = min(st.session_state.shortlisted_page, page_count - 1)
+            for application in index.page(store, "shortlisted", page, CARDS_PER_PAGE):
+                candidate, internship = candidates.get(application["candidate_id"]), internships.get(application["internship_id"])
                 col1, col2 = st.columns([4, 1])
                 with col1:
-                    st.markdown(f"**{candidate['name']}**")
-                    st.markdown(f"📧 {candidate['email']} | Match: {candidate['match']}%")
+                    st.markdown(f"**{candidate['name']}** - {internship['title']}")
+                    st.markdown(f"📧 {candidate['email']} | Match: {candidate_match(candidate, internship)}%")
                 with col2:
-                    if st.button("📥 View CV", key=f"cv_short_{candidate['id']}", use_container_width=True):
+                    if st.button("📥 View CV", key=f"cv_short_{application['internship_id']}_{candidate['id']}", use_container_width=True):
                         st.success("Viewing CV...")
                 st.markdown("---")
+            
+            show_page_controls("shortlisted_page", page, page_count)
         else:
             st.info("No shortlisted candidates yet")
     
     with tabs[2]:
         st.markdown("#### 🚫 Rejected Applications")
         
-        rejected = [k for k, v in st.session_state.application_status.items() if v == "rejected"]
+        total = index.count("rejected")
         
-        if rejected:
-            st.markdown(f"**Total Rejected: {len(rejected)}**")
+        if total:
+            st.markdown(f"**Total Rejected: {total}**")
             st.info("Previously rejected applications are archived here")
+            
+            page_count = -(-total // CARDS_PER_PAGE)
+            page = min(st.session_state.rejected_page, page_count - 1)
+            for application in index.page(store, "rejected", page, CARDS_PER_PAGE):
+                candidate, internship = candidates.get(application["candidate_id"]), internships.get(application["internship_id"])
+                st.markdown(f"**{candidate['name']}** - {internship['title']}")
+            
+            show_page_controls("rejected_page", page, page_count)
         else:
             st.info("No rejected applications yet")
 
@@ -1238,4 +1575,5 @@ def main():
             recruiter_dashboard()
 
 if __name__ == "__main__":
-    main()
+    with profiling.timer("rerun"):
+        main()
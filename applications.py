@@ -0,0 +1,69 @@
+import threading
+from itertools import islice
+
+from storage import APPLICATION_STATUSES
+
+
+def _pack(internship_id, candidate_id):
+    return internship_id << 32 | candidate_id
+
+
+def _unpack(key):
+    return key >> 32, key & 0xFFFFFFFF
+
+
+class ApplicationIndex:
+    """Application keys in one ordered set per status; rows are read from the store a page at a time"""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.store_version = None
+        # Insertion-ordered dicts of packed (internship, candidate) keys act as ordered sets:
+        # O(1) moves between statuses, and a small int per application instead of its row.
+        self._by_status = {status: {} for status in APPLICATION_STATUSES}
+
+    def __len__(self):
+        return sum(len(keys) for keys in self._by_status.values())
+
+    def _move(self, key, status):
+        for keys in self._by_status.values():
+            if key in keys:
+                del keys[key]
+                break
+        self._by_status.setdefault(status, {})[key] = None
+
+    def apply(self, rows):
+        """Add new applications and move changed ones to their new status; rows start with
+        (internship_id, candidate_id, status)"""
+        with self.lock:
+            for internship_id, candidate_id, status, *_ in rows:
+                self._move(_pack(internship_id, candidate_id), status)
+
+    def sync(self, store):
+        """Pull application writes made since the last sync, by this or any other session"""
+        version = store.application_version()
+        if version == self.store_version:
+            return
+        with self.lock:
+            if version != self.store_version:
+                for internship_id, candidate_id, status, row_version in store.application_statuses(
+                        after_version=self.store_version or 0):
+                    self._move(_pack(internship_id, candidate_id), status)
+                    version = max(version, row_version)
+                self.store_version = version
+
+    def count(self, status):
+        return len(self._by_status.get(status, ()))
+
+    def counts(self):
+        return {status: len(keys) for status, keys in self._by_status.items()}
+
+    def page_keys(self, status, page=0, per_page=10):
+        """(internship_id, candidate_id) keys of one page of a status, in the order they reached it"""
+        with self.lock:
+            keys = self._by_status.get(status, {})
+            return [_unpack(key) for key in islice(keys, page * per_page, (page + 1) * per_page)]
+
+    def page(self, store, status, page=0, per_page=10):
+        """One page of applications with a status, their rows read from the store"""
+        return store.applications_by_key(status, self.page_keys(status, page, per_page))
@@ -0,0 +1,167 @@
+"""Headless benchmark of every page in app.py using Streamlit's AppTest.
+
+Usage: python benchmark.py [--sizes 1000,100000,1000000] [--repeat 5] [--out bench_results.json]
+                           [--baseline previous.json --tolerance 0.25]
+
+Each catalog size runs in its own process against its own database, so the
+process-wide caches and peak RSS are per size. Exits 1 when --baseline is
+given and any page's p90 rerun latency regressed by more than --tolerance.
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+import datagen
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+DEFAULT_SIZES = (1000, 100000, 1000000)
+
+STUDENT_PAGES = ("Dashboard", "Add Courses", "Psychometric Test", "Browse Internships",
+                 "Skill Gap Analysis", "Resume Builder", "Personal Settings")
+RECRUITER_PAGES = ("Dashboard", "Post Internship", "Bulk Import", "Search Candidates", "Manage Applications")
+
+STUDENT_COURSES = ["Machine Learning", "Web Development", "Database Management"]
+STUDENT_SKILLS = ["Python", "Machine Learning", "Statistics", "NumPy", "HTML", "CSS", "JavaScript", "React",
+                  "SQL", "Database Design", "MySQL"]
+
+
+def populate(store, size, seed=0, chunk_size=10000):
+    """Fill an empty store with size postings, size // 10 candidates and as many applications"""
+    if not store.is_empty():
+        return 0.0
+    started = time.perf_counter()
+    candidates = max(size // 10, 3)
+    datagen.write_store(store, datagen.Generator(seed), size, candidates, candidates, chunk_size)
+    return time.perf_counter() - started
+
+
+def _timed_run(action):
+    started = time.perf_counter()
+    at = action()
+    elapsed = time.perf_counter() - started
+    if at.exception:
+        raise RuntimeError("; ".join(e.value for e in at.exception))
+    return elapsed
+
+
+def percentiles(samples):
+    """Latency percentiles in milliseconds for durations given in seconds"""
+    values = np.array(samples) * 1000
+    return {"p50_ms": round(float(np.percentile(values, 50)), 2),
+            "p90_ms": round(float(np.percentile(values, 90)), 2),
+            "p99_ms": round(float(np.percentile(values, 99)), 2),
+            "max_ms": round(float(values.max()), 2),
+            "runs": len(samples)}
+
+
+def _drive(at, pages, repeat, prefix, results):
+    for page in pages:
+        navigate = _timed_run(lambda: at.sidebar.radio[0].set_value(page).run())
+        reruns = [_timed_run(at.run) for _ in range(repeat)]
+        results[f"{prefix}/{page}"] = dict(percentiles(reruns), navigate_ms=round(navigate * 1000, 2))
+
+
+def _session(user_type, **state):
+    from streamlit.testing.v1 import AppTest
+    at = AppTest.from_file(APP_PATH, default_timeout=3600)
+    at.session_state["logged_in"] = user_type is not None
+    at.session_state["user_type"] = user_type
+    for key, value in state.items():
+        at.session_state[key] = value
+    return at
+
+
+def run_size(size, repeat, seed):
+    """Benchmark all pages against one catalog size; runs inside a worker process"""
+    from storage import CatalogStore
+    populate_s = populate(CatalogStore(), size, seed)
+    result = {"size": size, "populate_s": round(populate_s, 2), "pages": {}}
+
+    landing = _session(None)
+    result["cold_start_s"] = round(_timed_run(landing.run), 3)
+    result["pages"]["landing"] = percentiles([_timed_run(landing.run) for _ in range(repeat)])
+
+    student = _session("student", user_data={"name": "Bench Student", "email": "student@example.com"},
+                       courses=list(STUDENT_COURSES), skills=list(STUDENT_SKILLS))
+    result["student_first_run_s"] = round(_timed_run(student.run), 3)
+    _drive(student, STUDENT_PAGES, repeat, "student", result["pages"])
+
+    recruiter = _session("recruiter", user_data={"name": "Bench Recruiter", "email": "recruiter@example.com"})
+    result["recruiter_first_run_s"] = round(_timed_run(recruiter.run), 3)
+    _drive(recruiter, RECRUITER_PAGES, repeat, "recruiter", result["pages"])
+
+    # ru_maxrss is in KiB on Linux.
+    result["peak_rss_mb"] = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    return result
+
+
+def compare(results, baseline, tolerance):
+    """Pages whose p90 latency grew by more than tolerance over the baseline"""
+    previous = {(r["size"], page): stats for r in baseline for page, stats in r["pages"].items()}
+    regressions = []
+    for r in results:
+        for page, stats in r["pages"].items():
+            before = previous.get((r["size"], page))
+            if before and stats["p90_ms"] > before["p90_ms"] * (1 + tolerance):
+                regressions.append(f"{r['size']} {page}: p90 {before['p90_ms']}ms -> {stats['p90_ms']}ms")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark app.py pages headlessly with AppTest")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="comma-separated catalog sizes")
+    parser.add_argument("--repeat", type=int, default=5, help="reruns measured per page")
+    parser.add_argument("--seed", type=int, default=0, help="fixture random seed")
+    parser.add_argument("--db-dir", help="keep fixture databases here and reuse them (default: temporary)")
+    parser.add_argument("--out", default="bench_results.json", help="JSON results file")
+    parser.add_argument("--baseline", help="previous results file to compare p90 latencies against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed p90 slowdown before failing")
+    parser.add_argument("--worker", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker is not None:
+        print(json.dumps(run_size(args.worker, args.repeat, args.seed)))
+        return 0
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        db_dir = args.db_dir or tmp
+        os.makedirs(db_dir, exist_ok=True)
+        for size in (int(s) for s in args.sizes.split(",")):
+            env = dict(os.environ,
+                       INTERNMATCH_DB=os.path.join(db_dir, f"bench-{size}-{args.seed}.db"),
+                       INTERNMATCH_BLOBS=os.path.join(tmp, "blobs"))
+            print(f"benchmarking {size:,} postings...", file=sys.stderr)
+            out = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--worker", str(size),
+                 "--repeat", str(args.repeat), "--seed", str(args.seed)],
+                env=env, stdout=subprocess.PIPE, check=True, text=True
+            ).stdout
+            result = json.loads(out.strip().splitlines()[-1])
+            results.append(result)
+            slowest = max(result["pages"].items(), key=lambda item: item[1]["p90_ms"])
+            print(f"  cold start {result['cold_start_s']}s, peak RSS {result['peak_rss_mb']} MB, "
+                  f"slowest p90 {slowest[0]} {slowest[1]['p90_ms']}ms", file=sys.stderr)
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"wrote {args.out}", file=sys.stderr)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+import hashlib
+import mmap
+import os
+import tempfile
+from collections import namedtuple
+from contextlib import contextmanager
+
+BLOB_ROOT = os.environ.get("INTERNMATCH_BLOBS", os.path.join(os.path.dirname(os.path.abspath(__file__)), "blobs"))
+CHUNK_SIZE = 1 << 20
+
+# Small handle kept in session state in place of the uploaded bytes.
+BlobRef = namedtuple("BlobRef", ["digest", "size", "name", "content_type"])
+
+
+class BlobStore:
+    """Files on disk addressed by the SHA-256 of their content, so each is stored once"""
+
+    def __init__(self, root=BLOB_ROOT, chunk_size=CHUNK_SIZE):
+        self.root = root
+        self.chunk_size = chunk_size
+        os.makedirs(os.path.join(root, "tmp"), exist_ok=True)
+
+    def path(self, digest, variant=None):
+        """Location of a blob, or of a file derived from it such as a thumbnail"""
+        name = f"{digest}.{variant}" if variant else digest
+        return os.path.join(self.root, digest[:2], digest[2:4], name)
+
+    def exists(self, digest, variant=None):
+        return os.path.exists(self.path(digest, variant))
+
+    def put(self, source, name="", content_type=""):
+        """Stream a file object to disk in chunks while hashing it, and return its handle"""
+        if hasattr(source, "seek"):
+            source.seek(0)
+        sha = hashlib.sha256()
+        size = 0
+        with tempfile.NamedTemporaryFile(dir=os.path.join(self.root, "tmp"), delete=False) as tmp:
+            for chunk in iter(lambda: source.read(self.chunk_size), b""):
+                sha.update(chunk)
+                tmp.write(chunk)
+                size += len(chunk)
+        digest = sha.hexdigest()
+        path = self.path(digest)
+        if os.path.exists(path):
+            os.unlink(tmp.name)
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Atomic, so concurrent uploads of the same file leave one complete copy.
+            os.replace(tmp.name, path)
+        return BlobRef(digest, size, name, content_type)
+
+    def put_variant(self, digest, variant, data):
+        """Save bytes derived from a blob next to it, keyed by the source content hash"""
+        path = self.path(digest, variant)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=os.path.join(self.root, "tmp"), delete=False) as tmp:
+            tmp.write(data)
+        os.replace(tmp.name, path)
+        return path
+
+    @contextmanager
+    def open(self, digest, variant=None):
+        """Memory-mapped read-only view of a blob; pages are loaded only as they are read"""
+        with open(self.path(digest, variant), "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                yield memoryview(b"")
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    yield view
+                finally:
+                    view.release()
+
+    def read(self, digest, variant=None):
+        with self.open(digest, variant) as view:
+            return view.tobytes()
@@ -0,0 +1,192 @@
+import functools
+import threading
+from collections import namedtuple
+
+import numpy as np
+
+from records import Candidate
+from skills import registry as default_registry
+
+CandidatePage = namedtuple("CandidatePage", ["candidates", "scores", "total"])
+
+
+def personality_key(personality):
+    """Personality type without its description, e.g. 'Analytical Thinker'"""
+    return (personality or "").split(" - ")[0].strip()
+
+
+class CandidateIndex:
+    """Candidate profiles with bitmap indexes on skills, personality and courses
+
+    Profiles loaded from a snapshot stay in its mapped columns and become
+    records only when a search returns them.
+    """
+
+    RECORD_CACHE = 1024
+
+    def __init__(self, candidates=(), registry=default_registry):
+        self.registry = registry
+        self.lock = threading.RLock()
+        self.store_version = None
+        self.last_id = 0
+        self._table = None
+        self._base_ids = np.empty(0, dtype=np.int64)
+        self._base_keys = {}
+        self._base_record = functools.lru_cache(maxsize=self.RECORD_CACHE)(self._load_record)
+        self._tail = []
+        self._tail_rows = {}
+        self._postings = {}
+        self._bitmaps = {}
+        self.add_many(candidates)
+
+    def __len__(self):
+        return len(self._base_ids) + len(self._tail)
+
+    def __getitem__(self, row):
+        base = len(self._base_ids)
+        if row < base:
+            return self._base_record(row)
+        return self._tail[row - base]
+
+    def _load_record(self, row):
+        return Candidate.from_dict(self._table.row(row), self.registry)
+
+    def get(self, candidate_id, default=None):
+        """Candidate by ID"""
+        row = self._tail_rows.get(candidate_id)
+        if row is None:
+            ids = self._base_ids
+            found = int(np.searchsorted(ids, candidate_id))
+            if found < len(ids) and ids[found] == candidate_id:
+                row = found
+        return default if row is None else self[row]
+
+    def add_many(self, candidates):
+        """Index a batch of candidate profiles"""
+        with self.lock:
+            for candidate in candidates:
+                if not isinstance(candidate, Candidate):
+                    candidate = Candidate.from_dict(candidate, self.registry)
+                row = len(self)
+                keys = [("skill", skill_id) for skill_id in candidate.skill_ids]
+                keys.append(("personality", personality_key(candidate.personality)))
+                keys.extend(("course", course) for course in dict.fromkeys(candidate.courses))
+                for key in keys:
+                    self._postings.setdefault(key, []).append(row)
+                    self._bitmaps.pop(key, None)
+                self._tail_rows[candidate.id] = row
+                self._tail.append(candidate)
+                self.last_id = candidate.id
+
+    def load_snapshot(self, table):
+        """Fill an empty index from a columnar snapshot; postings are read from its columns when first used"""
+        with self.lock:
+            if len(self):
+                raise ValueError("only an empty index can load a snapshot")
+            keys = {}
+            for field, name in (("skill", "skills"), ("course", "courses")):
+                for string_id in np.unique(table.lists(name)[1]).tolist():
+                    value = table.string(string_id)
+                    if field == "skill":
+                        value = self.registry.id(value)
+                    keys.setdefault((field, value), []).append(string_id)
+            for string_id in np.unique(table.column("personality")).tolist():
+                keys.setdefault(("personality", personality_key(table.string(string_id))), []).append(string_id)
+            self._base_keys = keys
+            self._base_ids = table.column("id")
+            self._table = table
+            self.last_id = int(self._base_ids[-1]) if len(table) else 0
+
+    def _base_rows(self, key):
+        """Snapshot rows having a key, found by scanning its column"""
+        string_ids = self._base_keys.get(key)
+        if not string_ids:
+            return []
+        field = key[0]
+        if field == "personality":
+            return np.flatnonzero(np.isin(self._table.column("personality"), string_ids))
+        return self._table.rows_containing("skills" if field == "skill" else "courses", string_ids)
+
+    def _skill_key(self, name):
+        """Registry ID of a searched skill; a skill nobody has keeps its folded name, which matches no row"""
+        skill_id = self.registry.lookup(name)
+        return self.registry.key(name) if skill_id is None else skill_id
+
+    def sync(self, store):
+        """Pull candidates saved since the last sync, by this or any other process"""
+        version = store.candidate_version()
+        if version == self.store_version:
+            return
+        with self.lock:
+            if version != self.store_version:
+                self.add_many(store.candidates(after_id=self.last_id))
+                self.store_version = version
+
+    def personalities(self):
+        keys = set(self._postings) | set(self._base_keys)
+        return sorted(value for field, value in keys if field == "personality" and value)
+
+    def bitmap(self, field, value, size):
+        """Packed bitmap of the candidate rows having the given value"""
+        key = (field, value)
+        bitmap = self._bitmaps.get(key)
+        if bitmap is None or len(bitmap) < size:
+            with self.lock:
+                bitmap = self._bitmaps.get(key)
+                if bitmap is None:
+                    bits = np.zeros(len(self), dtype=bool)
+                    bits[self._base_rows(key)] = True
+                    bits[self._postings.get(key, [])] = True
+                    bitmap = np.packbits(bits)
+                if len(bitmap) < size:
+                    # Untouched keys have no bits for rows added since they were built.
+                    bitmap = np.concatenate([bitmap, np.zeros(size - len(bitmap), dtype=np.uint8)])
+                self._bitmaps[key] = bitmap
+        return bitmap[:size]
+
+    def _combine(self, field, values, match_all, size):
+        combined = None
+        for value in values:
+            bitmap = self.bitmap(field, value, size)
+            if combined is None:
+                combined = bitmap.copy()
+            elif match_all:
+                np.bitwise_and(combined, bitmap, out=combined)
+            else:
+                np.bitwise_or(combined, bitmap, out=combined)
+        return combined
+
+    def search(self, skills=(), personalities=(), courses=(), match_all_skills=True,
+               match_all_courses=False, page=0, per_page=10):
+        """Filter candidates with bitmap operations and rank them by skill match"""
+        count = len(self)
+        size = (count + 7) // 8
+        wanted = list(dict.fromkeys(map(self._skill_key, skills)))
+
+        mask = np.full(size, 0xFF, dtype=np.uint8)
+        for field, values, match_all in (
+            ("skill", wanted, match_all_skills),
+            ("personality", [personality_key(p) for p in personalities], False),
+            ("course", courses, match_all_courses),
+        ):
+            if values:
+                np.bitwise_and(mask, self._combine(field, values, match_all, size), out=mask)
+        rows = np.flatnonzero(np.unpackbits(mask, count=count))
+
+        matched = np.zeros(len(rows), dtype=np.int64)
+        for skill in wanted:
+            matched += np.unpackbits(self.bitmap("skill", skill, size), count=count)[rows]
+
+        total = len(rows)
+        start, end = page * per_page, min((page + 1) * per_page, total)
+        if start >= end:
+            return CandidatePage([], [], total)
+        # Rank by matched skills, then by row so ties keep insertion order.
+        keys = (len(wanted) - matched) * count + rows
+        top = np.argpartition(keys, end - 1)[:end] if end < total else np.arange(total)
+        top = top[np.argsort(keys[top])][start:end]
+        return CandidatePage(
+            [self[row] for row in rows[top].tolist()],
+            [float(matched[i]) * 100 / len(wanted) if wanted else None for i in top],
+            total,
+        )
@@ -0,0 +1,330 @@
+import functools
+import math
+import threading
+from array import array
+
+import numpy as np
+
+from locations import REMOTE, location_keys, parse_location
+from records import Internship
+from scoring import SkillMatrix, top_k
+from search import TextIndex
+from skills import registry as default_registry
+from stipends import parse_stipend
+
+
+class InternshipCatalog:
+    """In-memory internship catalog addressed by position, with skill, location and stipend indexes
+
+    Postings loaded from a snapshot stay in its mapped columns and become
+    records only when looked up; postings added afterwards are kept as records.
+    """
+
+    RECORD_CACHE = 4096
+
+    def __init__(self, internships=(), registry=default_registry, curated_skills=()):
+        self.registry = registry
+        # Registered before any posting's skills, so curated skills keep the lowest IDs.
+        self.curated_skill_ids = list(registry.ids(curated_skills))
+        self.lock = threading.RLock()
+        self.store_version = None
+        self.last_id = 0
+        self._table = None
+        self._base_ids = np.empty(0, dtype=np.int64)
+        self._base_stipends = np.empty(0, dtype=np.float64)
+        self._base_locations = np.empty(0, dtype=np.int64)
+        self._base_record = functools.lru_cache(maxsize=self.RECORD_CACHE)(self._load_record)
+        self._tail = []
+        self._tail_positions = {}
+        self._locations = {}
+        self.location_index = {}
+        self.cities = set()
+        self.locations = array("q")
+        self.stipends = array("d")
+        self.skill_matrix = SkillMatrix()
+        self.text_index = TextIndex()
+        self.version = 0
+        self._derived = {}
+        # Skill ID -> positions requiring it: CSR over the snapshot rows, then lists for later rows.
+        self._base_skill_positions = (np.zeros(1, dtype=np.int64), np.empty(0, dtype=np.int64))
+        self._skill_positions = {}
+        self.add_many(internships)
+
+    def __len__(self):
+        return len(self._base_ids) + len(self._tail)
+
+    def __getitem__(self, position):
+        """Posting at a catalog position"""
+        base = len(self._base_ids)
+        if position < base:
+            return self._base_record(position)
+        return self._tail[position - base]
+
+    def _load_record(self, position):
+        return Internship.from_dict(self._table.row(position), self.registry)
+
+    def position_of(self, internship_id):
+        """Catalog position of a posting ID, or None if it is not loaded"""
+        position = self._tail_positions.get(internship_id)
+        if position is None:
+            ids = self._base_ids
+            found = int(np.searchsorted(ids, internship_id))
+            if found < len(ids) and ids[found] == internship_id:
+                position = found
+        return position
+
+    def get(self, internship_id, default=None):
+        """Posting by ID"""
+        position = self.position_of(internship_id)
+        return default if position is None else self[position]
+
+    def positions_of(self, internship_ids):
+        """Catalog positions of posting IDs, ascending; unknown IDs are skipped"""
+        ids = np.fromiter(internship_ids, dtype=np.int64)
+        base = self._base_ids
+        found = np.minimum(np.searchsorted(base, ids), max(len(base) - 1, 0))
+        hit = base[found] == ids if len(base) else np.zeros(len(ids), dtype=bool)
+        tail = [self._tail_positions[i] for i in ids[~hit].tolist() if i in self._tail_positions]
+        return np.sort(np.concatenate([found[hit], np.array(tail, dtype=np.int64)]))
+
+    def id_mask(self, internship_ids):
+        """Boolean mask by position of the given posting IDs"""
+        mask = np.zeros(len(self), dtype=bool)
+        mask[self.positions_of(internship_ids)] = True
+        return mask
+
+    def values(self, field):
+        """One field of every posting in catalog order, decoded without building records"""
+        table = self._table
+        values = [table.string(i) for i in table.column(field).tolist()] if table is not None else []
+        return values + [internship[field] for internship in self._tail]
+
+    def add(self, internship):
+        """Add a posting and index its required skills"""
+        self.add_many([internship])
+
+    def add_many(self, internships, index_text=True):
+        """Add a batch of postings, invalidating derived data once"""
+        with self.lock:
+            for internship in internships:
+                if not isinstance(internship, Internship):
+                    internship = Internship.from_dict(internship, self.registry)
+                position = len(self)
+                for skill_id in internship.skill_ids:
+                    self._skill_positions.setdefault(skill_id, array("q")).append(position)
+                self._tail_positions[internship.id] = position
+                self._tail.append(internship)
+                self.locations.append(self._location_code(internship.location))
+                self.stipends.append(monthly_stipend(internship))
+                self.skill_matrix.add_row(internship.skill_ids)
+                if index_text:
+                    self.text_index.add(document_text(internship))
+                self.last_id = internship.id
+            self._changed()
+
+    def load_snapshot(self, table):
+        """Fill an empty catalog from a columnar snapshot, indexing its columns in place"""
+        with self.lock:
+            if len(self):
+                raise ValueError("only an empty catalog can load a snapshot")
+            terms = [table.string(i) for i in table.column("text.terms").tolist()]
+            self.text_index.load(table.column("text.doc_lengths"), terms, table.column("text.offsets"),
+                                 table.column("text.rows"), table.column("text.tfs"))
+            indices, offsets = self._skill_rows(table)
+            self.skill_matrix.load(indices, offsets)
+            rows = np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+            skill_offsets = np.zeros(self.skill_matrix.width + 1, dtype=np.int64)
+            np.cumsum(np.bincount(indices, minlength=self.skill_matrix.width), out=skill_offsets[1:])
+            self._base_skill_positions = (skill_offsets, rows[np.argsort(indices, kind="stable")])
+            string_ids, codes = np.unique(table.column("location"), return_inverse=True)
+            lookup = np.array([self._location_code(table.string(i)) for i in string_ids.tolist()], dtype=np.int64)
+            self._base_locations = lookup[codes]
+            self._base_stipends = table.column("stipend_monthly")
+            self._base_ids = table.column("id")
+            self._table = table
+            self.last_id = int(self._base_ids[-1]) if len(table) else 0
+            self._changed()
+
+    def _skill_rows(self, table):
+        """Skill matrix CSR from the required_skills column, with string ids mapped to skill IDs"""
+        offsets, values = table.lists("required_skills")
+        string_ids, inverse = np.unique(values, return_inverse=True)
+        lookup = np.array([self.registry.id(table.string(i)) for i in string_ids.tolist()], dtype=np.int64)
+        indices = lookup[inverse]
+        if len(np.unique(lookup)) < len(lookup):
+            # Aliases of one skill listed on the same posting count once, as they do for records.
+            rows = np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+            _, first = np.unique(rows * (int(lookup.max()) + 1) + indices, return_index=True)
+            keep = np.sort(first)
+            indices = indices[keep]
+            offsets = np.concatenate([[0], np.cumsum(np.bincount(rows[keep], minlength=len(offsets) - 1))])
+        return indices, offsets
+
+    def _location_code(self, text):
+        """Small integer for a location string, indexing its keys the first time it is seen"""
+        code = self._locations.get(text)
+        if code is None:
+            code = self._locations[text] = len(self._locations)
+            location = parse_location(text)
+            for key in location_keys(location):
+                self.location_index.setdefault(key, set()).add(code)
+            if location.city:
+                self.cities.add(location.city)
+        return code
+
+    def _changed(self):
+        self.version += 1
+        self._derived = {}
+
+    def sync(self, store):
+        """Pull postings saved since the last sync, by this or any other process"""
+        version = store.catalog_version()
+        if version == self.store_version:
+            return
+        with self.lock:
+            if version != self.store_version:
+                new_internships = store.internships(after_id=self.last_id)
+                if new_internships:
+                    self.add_many(new_internships)
+                self.store_version = version
+
+    def derived(self, name, build):
+        """Value built from the catalog once per version, shared by all sessions"""
+        derived = self._derived
+        if name not in derived:
+            derived[name] = build(self)
+        return derived[name]
+
+    def skill_options(self):
+        """Curated skills plus every skill a posting requires, sorted for pickers"""
+        def build(catalog):
+            with catalog.lock:
+                indices = catalog.skill_matrix.compile()[0]
+            skill_ids = set(catalog.curated_skill_ids) | set(np.unique(indices).tolist())
+            return sorted(catalog.registry.names(skill_ids), key=str.casefold)
+        return self.derived("skill_options", build)
+
+    def location_options(self):
+        """Cities present in the catalog, plus Remote when any posting is remote"""
+        options = sorted(self.cities)
+        if REMOTE in self.location_index:
+            options.append(REMOTE)
+        return options
+
+    def location_mask(self, keys):
+        """Boolean mask by position of postings at any of the given canonical location keys"""
+        codes = set()
+        for key in keys:
+            codes |= self.location_index.get(key, set())
+        locations = self.derived("locations", lambda c: np.concatenate(
+            [c._base_locations, np.asarray(c.locations, dtype=np.int64)]))
+        return np.isin(locations, list(codes))
+
+    def _stipend_index(self):
+        """Monthly stipend by position, known positions sorted by amount, and those amounts"""
+        def build(catalog):
+            values = np.concatenate([catalog._base_stipends, np.asarray(catalog.stipends, dtype=np.float64)])
+            known = np.flatnonzero(~np.isnan(values))
+            order = known[np.argsort(values[known], kind="stable")]
+            return values, order, values[order]
+        return self.derived("stipend_index", build)
+
+    def stipend_range(self):
+        """Lowest and highest known monthly stipend, in INR"""
+        _, _, values = self._stipend_index()
+        return (float(values[0]), float(values[-1])) if len(values) else (0.0, 0.0)
+
+    def stipend_positions(self, low=None, high=None):
+        """Positions with a monthly stipend in [low, high], in stipend order, found by binary search"""
+        _, order, values = self._stipend_index()
+        start = 0 if low is None else np.searchsorted(values, low, side="left")
+        end = len(values) if high is None else np.searchsorted(values, high, side="right")
+        return order[start:end]
+
+    def stipend_mask(self, low=None, high=None):
+        """Boolean mask by position of postings with a monthly stipend in [low, high]"""
+        mask = np.zeros(len(self), dtype=bool)
+        mask[self.stipend_positions(low, high)] = True
+        return mask
+
+    def stipend_ranks(self, descending=False):
+        """Values for top_k() that order by stipend; equal stipends tie and unknown ones come last"""
+        def build(catalog):
+            values, order, amounts = catalog._stipend_index()
+            # Dense rank along the sorted amounts: it steps up wherever the amount does.
+            dense = np.concatenate([[0], np.cumsum(amounts[1:] != amounts[:-1])]) if len(order) else order
+            highest_first = np.full(len(values), -1.0)
+            lowest_first = highest_first.copy()
+            highest_first[order] = dense
+            lowest_first[order] = (dense[-1] if len(order) else 0) - dense
+            return lowest_first, highest_first
+        return self.derived("stipend_ranks", build)[1 if descending else 0]
+
+    def skill_positions(self, skill_id):
+        """Positions of postings requiring a skill, ascending"""
+        offsets, rows = self._base_skill_positions
+        base = rows[offsets[skill_id]:offsets[skill_id + 1]] if skill_id + 1 < len(offsets) else rows[:0]
+        tail = self._skill_positions.get(skill_id)
+        if tail is None:
+            return base
+        return np.concatenate([base, np.array(tail, dtype=np.int64)])
+
+    def skill_mask(self, skills):
+        """Boolean mask by position of postings requiring any of the given skills, matched by canonical name"""
+        mask = np.zeros(len(self), dtype=bool)
+        for skill_id in self.registry.known_ids(skills):
+            positions = self.skill_positions(skill_id)
+            # Postings added by another session since len() was read are left out.
+            mask[positions[:np.searchsorted(positions, len(mask))]] = True
+        return mask
+
+    def patch_match_counts(self, counts, skill_ids, step):
+        """Adjust per-position matched-skill counts in place as skills are gained (+1) or lost (-1)"""
+        for skill_id in skill_ids:
+            positions = self.skill_positions(skill_id)
+            # Postings added since the counts were built wait for the rebuild the new version triggers.
+            # A skill lists each position once, so a plain fancy-index add is safe and much faster than np.add.at.
+            counts[positions[:np.searchsorted(positions, len(counts))]] += step
+        return counts
+
+    def match_counts(self, skills):
+        """Matched-skill count of every posting, by position; a small int per posting keeps sessions light"""
+        return self.patch_match_counts(np.zeros(len(self), dtype=np.int16), set(self.registry.known_ids(skills)), 1)
+
+    def recommend_from_counts(self, counts):
+        """Positions with a nonzero match count in catalog order, or all if none"""
+        positions = np.flatnonzero(counts)
+        return positions if len(positions) else np.arange(len(counts))
+
+    def recommend(self, skills):
+        """Positions of postings matching any of the given skills, or all if none match"""
+        return self.recommend_from_counts(self.match_counts(skills))
+
+    def score(self, skills):
+        """Skill match percent, matched and missing counts for every posting"""
+        with self.lock:
+            compiled = self.skill_matrix.compile()
+        return self.skill_matrix.score(self.registry.known_ids(skills), compiled)
+
+    def search_text(self, query):
+        """Positions matching a keyword query, in catalog order, with BM25 scores by position"""
+        relevance = self.text_index.search(query)
+        return np.flatnonzero(relevance), relevance
+
+    def top_k(self, positions, values, k):
+        """The k positions with the highest values, ties kept in catalog order"""
+        return top_k(np.asarray(positions).tolist(), values, k)
+
+
+def document_text(internship):
+    """Text indexed for keyword search"""
+    return f"{internship['title']} {internship['company']} {internship['description']}"
+
+
+def monthly_stipend(internship):
+    """Monthly stipend in INR from the stored parse, or NaN when unknown"""
+    value = internship.get("stipend_monthly")
+    if value is None:
+        stipend = parse_stipend(internship["stipend"])
+        value = stipend.monthly_inr if stipend else None
+    return math.nan if value is None else float(value)
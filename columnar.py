@@ -0,0 +1,278 @@
+"""Read-only columnar snapshots of postings and candidates, memory-mapped at startup.
+
+Usage: python columnar.py [--db internmatch.db] [--out snapshot/]
+
+A snapshot file is a JSON header followed by 64-byte aligned sections:
+fixed-width numeric columns, string columns as uint32 ids into one interned
+string table, and list columns (skills, courses) in CSR form. Readers map the
+file read-only and view every section in place with numpy, so processes
+opening the same snapshot share its pages through the OS page cache.
+Rows saved after the snapshot are still read from SQLite by sync().
+"""
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+
+import numpy as np
+
+from catalog import document_text
+from search import TextIndex
+
+SNAPSHOT_DIR = os.environ.get(
+    "INTERNMATCH_SNAPSHOT", os.path.join(os.path.dirname(os.path.abspath(__file__)), "snapshot")
+)
+MAGIC = b"IMCOL001"
+ALIGN = 64
+NULL = 0xFFFFFFFF
+
+# Column name -> kind; "int" and "float" are fixed width, "str" is a string id, "list" is CSR.
+INTERNSHIP_SCHEMA = {
+    "id": "int", "title": "str", "company": "str", "location": "str", "type": "str", "stipend": "str",
+    "description": "str", "linkedin_url": "str", "duration": "str", "start_date": "str", "openings": "int",
+    "stipend_amount": "float", "stipend_currency": "str", "stipend_period": "str", "stipend_monthly": "float",
+    "posted_by": "str", "required_skills": "list",
+}
+CANDIDATE_SCHEMA = {
+    "id": "int", "name": "str", "email": "str", "personality": "str", "match": "int", "resume_url": "str",
+    "skills": "list", "courses": "list",
+}
+SCHEMAS = {"internships": INTERNSHIP_SCHEMA, "candidates": CANDIDATE_SCHEMA}
+DTYPES = {"int": "<i8", "float": "<f8", "str": "<u4"}
+
+
+class TableWriter:
+    """Accumulates rows column by column and writes them as one snapshot file"""
+
+    def __init__(self, kind):
+        self.kind = kind
+        self.schema = SCHEMAS[kind]
+        self.rows = 0
+        self._strings = {}
+        self._columns = {}
+        self._extra = []
+        for name, column_kind in self.schema.items():
+            if column_kind == "list":
+                self._columns[name] = (array("q", [0]), array("I"))
+            else:
+                self._columns[name] = array({"int": "q", "float": "d", "str": "I"}[column_kind])
+
+    def intern(self, value):
+        """String table id for a value, adding it on first use"""
+        if value is None:
+            return NULL
+        string_id = self._strings.get(value)
+        if string_id is None:
+            string_id = self._strings[value] = len(self._strings)
+        return string_id
+
+    def append(self, row):
+        for name, column_kind in self.schema.items():
+            value = row.get(name)
+            if column_kind == "list":
+                offsets, values = self._columns[name]
+                # Repeats within a row are dropped so readers can index list columns without de-duplicating.
+                values.extend(dict.fromkeys(self.intern(item) for item in value or ()))
+                offsets.append(len(values))
+            elif column_kind == "str":
+                self._columns[name].append(self.intern(value))
+            elif column_kind == "float":
+                self._columns[name].append(np.nan if value is None else value)
+            else:
+                self._columns[name].append(value or 0)
+        self.rows += 1
+
+    def extend(self, rows):
+        for row in rows:
+            self.append(row)
+
+    def add_section(self, name, dtype, data):
+        """Store an extra array, such as a saved index, alongside the columns"""
+        self._extra.append((name, dtype, data))
+
+    def _sections(self):
+        for name, column_kind in self.schema.items():
+            if column_kind == "list":
+                offsets, values = self._columns[name]
+                yield f"{name}.offsets", "<i8", offsets
+                yield f"{name}.values", "<u4", values
+            else:
+                yield name, DTYPES[column_kind], self._columns[name]
+        yield from self._extra
+        encoded = [s.encode("utf-8") for s in self._strings]
+        offsets = array("q", [0])
+        for data in encoded:
+            offsets.append(offsets[-1] + len(data))
+        yield "strings.offsets", "<i8", offsets
+        yield "strings.data", "|u1", b"".join(encoded)
+
+    def write(self, path, meta=None):
+        """Write the snapshot atomically, so readers never map a half-written file"""
+        sections = list(self._sections())
+        layout, offset = {}, 0
+        for name, dtype, data in sections:
+            size = len(data) * np.dtype(dtype).itemsize if not isinstance(data, bytes) else len(data)
+            layout[name] = {"dtype": dtype, "offset": offset, "count": len(data)}
+            offset += -(-size // ALIGN) * ALIGN
+        header = json.dumps({"kind": self.kind, "rows": self.rows, "meta": meta or {},
+                             "sections": layout}).encode("utf-8")
+        start = -(-(len(MAGIC) + 8 + len(header)) // ALIGN) * ALIGN
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=directory, delete=False) as tmp:
+            tmp.write(MAGIC + struct.pack("<Q", len(header)) + header)
+            for name, dtype, data in sections:
+                tmp.seek(start + layout[name]["offset"])
+                tmp.write(data if isinstance(data, bytes) else np.asarray(data, dtype=dtype).tobytes())
+            tmp.truncate(start + offset)
+        os.replace(tmp.name, path)
+
+
+class Table:
+    """A snapshot file mapped read-only; columns are numpy views into the mapping"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a columnar snapshot")
+        header_length = struct.unpack_from("<Q", self._map, len(MAGIC))[0]
+        header_end = len(MAGIC) + 8 + header_length
+        header = json.loads(self._map[len(MAGIC) + 8:header_end])
+        self.kind = header["kind"]
+        self.rows = header["rows"]
+        self.meta = header["meta"]
+        self.schema = SCHEMAS[self.kind]
+        start = -(-header_end // ALIGN) * ALIGN
+        self._sections = {
+            name: np.frombuffer(self._map, dtype=s["dtype"], count=s["count"], offset=start + s["offset"])
+            for name, s in header["sections"].items()
+        }
+        self._decoded = {}
+
+    def __len__(self):
+        return self.rows
+
+    def column(self, name):
+        """Zero-copy view of a numeric or string-id column"""
+        return self._sections[name]
+
+    def lists(self, name):
+        """CSR offsets and string ids of a list column"""
+        return self._sections[f"{name}.offsets"], self._sections[f"{name}.values"]
+
+    def rows_containing(self, name, string_ids):
+        """Rows whose list column holds any of the given string ids, ascending"""
+        offsets, values = self.lists(name)
+        hits = np.flatnonzero(np.isin(values, string_ids))
+        return np.unique(np.searchsorted(offsets, hits, side="right") - 1)
+
+    def string(self, string_id):
+        """Decode an interned string once; every row that uses it shares the same object"""
+        if string_id == NULL:
+            return None
+        value = self._decoded.get(string_id)
+        if value is None:
+            data, offsets = self._sections["strings.data"], self._sections["strings.offsets"]
+            start, end = int(offsets[string_id]), int(offsets[string_id + 1])
+            value = self._decoded[string_id] = bytes(data[start:end]).decode("utf-8")
+        return value
+
+    def row(self, position):
+        """One row as the dict CatalogStore would return"""
+        row = {}
+        for name, column_kind in self.schema.items():
+            if column_kind == "list":
+                offsets, values = self.lists(name)
+                row[name] = [self.string(i) for i in values[offsets[position]:offsets[position + 1]].tolist()]
+            elif column_kind == "str":
+                row[name] = self.string(int(self._sections[name][position]))
+            else:
+                value = self._sections[name][position].item()
+                row[name] = None if column_kind == "float" and value != value else value
+        return row
+
+    def close(self):
+        self._sections = {}
+        self._map.close()
+
+
+def snapshot_path(kind, directory=SNAPSHOT_DIR):
+    return os.path.join(directory, f"{kind}.col")
+
+
+def export(store, kind, path, chunk_size=10000):
+    """Write every saved posting or candidate to a snapshot, paging through the store"""
+    fetch = store.internships if kind == "internships" else store.candidates
+    version = store.catalog_version() if kind == "internships" else store.candidate_version()
+    writer = TableWriter(kind)
+    # Postings also carry their keyword index, so loading skips tokenizing every description.
+    text_index = TextIndex() if kind == "internships" else None
+    last_id = 0
+    while True:
+        rows = fetch(after_id=last_id, limit=chunk_size)
+        if not rows:
+            break
+        writer.extend(rows)
+        if text_index is not None:
+            for row in rows:
+                text_index.add(document_text(row))
+        last_id = rows[-1]["id"]
+    if text_index is not None:
+        lengths, terms, offsets, postings, tfs = text_index.dump()
+        writer.add_section("text.doc_lengths", "<u4", lengths)
+        writer.add_section("text.terms", "<u4", array("I", map(writer.intern, terms)))
+        writer.add_section("text.offsets", "<i8", offsets)
+        writer.add_section("text.rows", "<u4", postings)
+        writer.add_section("text.tfs", "<u2", tfs)
+    writer.write(path, meta={"database_id": store.database_id(), "version": version, "last_id": last_id})
+    return writer.rows
+
+
+def is_current(store, kind, meta, rows):
+    """Whether a snapshot with this header still matches the store it was exported from"""
+    if meta.get("database_id") != store.database_id():
+        return False
+    # Versions only grow, so a lower one means the database was restored or rebuilt since the export.
+    version = store.catalog_version() if kind == "internships" else store.candidate_version()
+    if version < meta.get("version", 0):
+        return False
+    # A higher one is fine as long as the rows up to the snapshot's last id are exactly its rows;
+    # anything saved since then is read from SQLite by sync().
+    return store.row_count(kind, meta.get("last_id", 0)) == rows
+
+
+def open_snapshot(store, kind, directory=SNAPSHOT_DIR):
+    """The snapshot of a table if one exists and matches the store, else None"""
+    path = snapshot_path(kind, directory)
+    if not os.path.exists(path):
+        return None
+    table = Table(path)
+    if not is_current(store, kind, table.meta, len(table)):
+        table.close()
+        return None
+    return table
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export postings and candidates to columnar snapshots")
+    parser.add_argument("--db", help="SQLite database (default: the app database)")
+    parser.add_argument("--out", default=SNAPSHOT_DIR, help="snapshot directory")
+    args = parser.parse_args(argv)
+
+    from storage import DB_PATH, CatalogStore
+    store = CatalogStore(args.db or DB_PATH)
+    for kind in SCHEMAS:
+        path = snapshot_path(kind, args.out)
+        rows = export(store, kind, path)
+        print(f"wrote {rows:,} {kind} to {path} ({os.path.getsize(path) / 1e6:.1f} MB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
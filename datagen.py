@@ -0,0 +1,353 @@
+"""Seeded synthetic internships, candidates, courses and applications at any size.
+
+Usage: python datagen.py --internships 1000000 --candidates 200000 --applications 2000000 \
+           [--format jsonl --out fixtures/ | --format db --db internmatch.db] [--seed 0]
+
+Rows are generated and written in chunks, so memory stays flat however many are requested.
+Skill popularity follows a Zipf-like law; locations and stipends are weighted like real postings.
+"""
+import argparse
+import bisect
+import itertools
+import json
+import math
+import os
+import random
+import sys
+from array import array
+from datetime import datetime, timedelta
+
+from locations import CITY_STATES
+
+# Ordered from most to least in demand; rank drives the Zipf weights.
+SKILLS = [
+    "Python", "Communication", "SQL", "Excel", "JavaScript", "Java", "HTML", "CSS", "Data Analysis",
+    "Machine Learning", "React", "Content Writing", "Social Media", "Statistics", "C++", "SEO", "Node.js",
+    "Figma", "Problem Solving", "Algorithms", "Power BI", "Tableau", "Django", "Flask", "NumPy", "Pandas",
+    "MySQL", "MongoDB", "Git", "Docker", "AWS", "Recruitment", "HR Management", "Sales", "Digital Marketing",
+    "Analytics", "Adobe Photoshop", "Illustrator", "UI Design", "UX Research", "Deep Learning", "TensorFlow",
+    "PyTorch", "NLP", "Computer Vision", "Kotlin", "Android", "Swift", "iOS", "Flutter", "TypeScript",
+    "Angular", "Vue.js", "Spring Boot", "REST APIs", "GraphQL", "Linux", "Kubernetes", "Azure", "GCP",
+    "Database Design", "PostgreSQL", "Redis", "Spark", "Hadoop", "Data Visualization", "R", "MATLAB",
+    "Financial Modeling", "Accounting", "Business Analysis", "Market Research", "Email Marketing",
+    "Copywriting", "Video Editing", "Public Speaking", "Project Management", "Agile", "Jira",
+    "Customer Support", "Operations", "Supply Chain", "Event Management", "Graphic Design", "Blender",
+    "Unity", "C#", "Go", "Rust", "Cybersecurity", "Networking", "Embedded C", "IoT", "AutoCAD",
+    "SolidWorks", "Salesforce", "SAP", "Tally", "Negotiation", "Leadership",
+]
+
+DOMAINS = {
+    "Software Development": ["Python", "Java", "JavaScript", "Git", "Algorithms", "REST APIs"],
+    "Web Development": ["HTML", "CSS", "JavaScript", "React", "Node.js", "TypeScript"],
+    "Data Science": ["Python", "Statistics", "Machine Learning", "Pandas", "SQL", "NumPy"],
+    "Data Analytics": ["Excel", "SQL", "Power BI", "Tableau", "Data Analysis", "Statistics"],
+    "Machine Learning": ["Python", "Machine Learning", "Deep Learning", "TensorFlow", "PyTorch", "NLP"],
+    "Mobile App Development": ["Kotlin", "Android", "Swift", "Flutter", "Java", "Git"],
+    "Digital Marketing": ["SEO", "Social Media", "Content Writing", "Analytics", "Email Marketing"],
+    "Content Writing": ["Content Writing", "Copywriting", "SEO", "Communication"],
+    "Human Resources": ["Recruitment", "HR Management", "Communication", "Excel"],
+    "Graphic Design": ["Figma", "Adobe Photoshop", "Illustrator", "Graphic Design", "UI Design"],
+    "Finance": ["Excel", "Financial Modeling", "Accounting", "Tally"],
+    "Business Development": ["Sales", "Communication", "Negotiation", "Market Research"],
+    "Operations": ["Operations", "Excel", "Supply Chain", "Project Management"],
+    "Cloud & DevOps": ["Linux", "Docker", "Kubernetes", "AWS", "Git"],
+    "Cybersecurity": ["Cybersecurity", "Networking", "Linux", "Python"],
+    "Product Management": ["Project Management", "Agile", "Jira", "Market Research", "Communication"],
+}
+DOMAIN_WEIGHTS = [14, 12, 10, 8, 6, 5, 9, 5, 6, 5, 5, 6, 3, 3, 1, 2]
+
+COMPANY_PREFIXES = ["Tech", "Data", "Cloud", "Bright", "Next", "Blue", "Pixel", "Green", "Smart", "Nova",
+                    "Apex", "Quantum", "Urban", "Spark", "Peak", "Zen", "Orbit", "Vertex", "Bharat", "Indus"]
+COMPANY_SUFFIXES = ["Labs", "Systems", "Solutions", "Analytics", "Works", "Corp", "Technologies", "Ventures",
+                    "Digital", "Media", "Capital", "Studio", "Networks", "AI", "Retail", "Health"]
+
+# (location text, weight); cities weighted roughly by internship volume.
+CITY_WEIGHTS = {
+    "Bangalore": 22, "Mumbai": 12, "Delhi": 10, "Pune": 9, "Hyderabad": 9, "Gurugram": 7, "Noida": 6,
+    "Chennai": 7, "Kolkata": 4, "Ahmedabad": 3, "Jaipur": 2, "Kochi": 2, "Chandigarh": 1, "Indore": 1,
+    "Lucknow": 1, "Coimbatore": 1, "Bhubaneswar": 1, "Thiruvananthapuram": 1,
+    "San Francisco": 0.4, "New York": 0.4, "London": 0.4, "Singapore": 0.4,
+}
+TYPE_WEIGHTS = {"On-site": 55, "Remote": 30, "Hybrid": 15}
+DURATIONS = ["1 month", "2 months", "3 months", "6 months"]
+PERSONALITIES = [
+    "Analytical Thinker - Great for Data Science, Research",
+    "People Person - Perfect for HR, Management",
+    "Tech Enthusiast - Ideal for Software Development",
+    "Creative Innovator - Suited for Design, Marketing",
+    "Organized Planner - Excellent for Operations, PM",
+]
+FIRST_NAMES = ["Aarav", "Vivaan", "Aditya", "Ananya", "Diya", "Isha", "Rahul", "Priya", "Amit", "Sneha",
+               "Rohan", "Kavya", "Arjun", "Meera", "Karan", "Pooja", "Vikram", "Neha", "Siddharth", "Riya",
+               "Farhan", "Zoya", "Harpreet", "Lakshmi", "Joseph", "Fatima", "Tenzin", "Nikhil", "Sara", "Dev"]
+LAST_NAMES = ["Sharma", "Patel", "Kumar", "Singh", "Reddy", "Iyer", "Nair", "Gupta", "Das", "Khan",
+              "Mehta", "Joshi", "Rao", "Menon", "Chatterjee", "Bose", "Verma", "Pillai", "Shah", "Kapoor"]
+COURSE_LEVELS = ["Introduction to", "Foundations of", "Applied", "Advanced"]
+APPLICATION_STATUSES = {"pending": 60, "shortlisted": 15, "rejected": 25}
+FOREIGN_CURRENCY = {"United States": "$", "United Kingdom": "£", "Singapore": "$"}
+
+
+def zipf_cum_weights(count, exponent=1.1):
+    """Cumulative weights where rank r is drawn with probability proportional to 1 / r**exponent"""
+    return list(itertools.accumulate(1 / (rank ** exponent) for rank in range(1, count + 1)))
+
+
+def _cum(weights):
+    return list(itertools.accumulate(weights))
+
+
+# Marks a generated (internship, candidate) pair in Generator.applications().
+TAKEN_PAIR = 0xFFFFFFFF
+
+
+class Generator:
+    """Deterministic record streams; the same seed always yields the same rows"""
+
+    def __init__(self, seed=0, zipf_exponent=1.1, start=None):
+        self.seed = seed
+        self.skill_cum = zipf_cum_weights(len(SKILLS), zipf_exponent)
+        self.domains = list(DOMAINS)
+        self.domain_cum = _cum(DOMAIN_WEIGHTS)
+        self.cities = list(CITY_WEIGHTS)
+        self.city_cum = _cum(CITY_WEIGHTS.values())
+        self.types = list(TYPE_WEIGHTS)
+        self.type_cum = _cum(TYPE_WEIGHTS.values())
+        self.statuses = list(APPLICATION_STATUSES)
+        self.status_cum = _cum(APPLICATION_STATUSES.values())
+        self.start = start or datetime(2026, 1, 1)
+        self.courses = self._course_catalog()
+
+    def _rng(self, stream):
+        # One independent stream per record type, so changing one count does not shift the others.
+        return random.Random(f"{self.seed}:{stream}")
+
+    def _pick(self, rng, values, cum):
+        return values[bisect.bisect(cum, rng.random() * cum[-1])]
+
+    def skills(self, rng, count, core=()):
+        """Distinct skills: a few from the domain core, the rest Zipf-distributed"""
+        chosen = dict.fromkeys(rng.sample(core, min(len(core), max(1, count // 2)))) if core else {}
+        while len(chosen) < count:
+            chosen[self._pick(rng, SKILLS, self.skill_cum)] = None
+        return list(chosen)
+
+    def location(self, rng):
+        """A city and how a posting spells its location"""
+        city = self._pick(rng, self.cities, self.city_cum)
+        state, country = CITY_STATES[city]
+        style = rng.random()
+        if style < 0.5:
+            return city, f"{city}, {country}"
+        if style < 0.8 and state:
+            return city, f"{city}, {state}"
+        return city, city
+
+    def stipend(self, rng, country):
+        if rng.random() < 0.06:
+            return "Unpaid"
+        # Monthly stipends are roughly log-normal around ₹12k.
+        monthly = min(max(round(math.exp(rng.gauss(9.4, 0.55)) / 500) * 500, 2000), 150000)
+        symbol = FOREIGN_CURRENCY.get(country)
+        if symbol:
+            return f"{symbol}{round(monthly / 83 / 50) * 50:,}/month"
+        style = rng.random()
+        if style < 0.55:
+            return f"₹{monthly:,}/month"
+        if style < 0.7:
+            return f"Rs. {monthly} per month"
+        if style < 0.82:
+            return f"₹{monthly // 1000}k - {monthly * 3 // 2000}k /month"
+        if style < 0.92:
+            return f"₹{monthly * 12 / 1e5:.1f} LPA"
+        return f"₹{monthly // 4:,}/week"
+
+    def _course_catalog(self):
+        rng = self._rng("courses")
+        courses = []
+        for domain, core in DOMAINS.items():
+            for level in COURSE_LEVELS:
+                courses.append({"name": f"{level} {domain}", "skills": self.skills(rng, rng.randint(3, 5), core)})
+        return courses
+
+    def internships(self, count, first_id=1):
+        rng = self._rng("internships")
+        for n in range(count):
+            domain = self._pick(rng, self.domains, self.domain_cum)
+            city, location = self.location(rng)
+            company = f"{rng.choice(COMPANY_PREFIXES)} {rng.choice(COMPANY_SUFFIXES)}"
+            internship_type = self._pick(rng, self.types, self.type_cum)
+            country = CITY_STATES[city][1]
+            yield {
+                "id": first_id + n,
+                "title": f"{domain} Intern",
+                "company": company,
+                "location": "Remote" if internship_type == "Remote" and rng.random() < 0.5 else location,
+                "type": internship_type,
+                "stipend": self.stipend(rng, country),
+                "required_skills": self.skills(rng, rng.randint(2, 6), DOMAINS[domain]),
+                "description": f"Join {company}'s {domain.lower()} team to work on real projects "
+                               f"using {', '.join(DOMAINS[domain][:3])}.",
+                "duration": rng.choice(DURATIONS),
+                "openings": rng.choices((1, 2, 3, 5, 10), (50, 25, 12, 8, 5))[0],
+                "posted_by": f"hr@{company.lower().replace(' ', '')}.com",
+            }
+
+    def candidates(self, count, first_id=1):
+        rng = self._rng("candidates")
+        for n in range(count):
+            first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            courses = rng.sample(self.courses, rng.randint(1, 4))
+            skills = dict.fromkeys(skill for course in courses for skill in course["skills"])
+            skills.update(dict.fromkeys(self.skills(rng, rng.randint(1, 4))))
+            yield {
+                "id": first_id + n,
+                "name": f"{first} {last}",
+                "email": f"{first.lower()}.{last.lower()}{first_id + n}@example.com",
+                "skills": list(skills),
+                "courses": [course["name"] for course in courses],
+                "personality": rng.choice(PERSONALITIES),
+                "match": rng.randint(35, 99),
+                "resume_url": f"resume{first_id + n}.pdf",
+            }
+
+    def applications(self, count, internships, candidates, days=90):
+        """(internship, candidate) pairs, distinct within any million consecutive rows; popular postings
+        attract more applicants"""
+        rng = self._rng("applications")
+        pairs = internships * candidates
+        count = min(count, pairs)
+        ranks = min(internships, 100000)
+        posting_cum = zipf_cum_weights(ranks, 0.8)
+        # A seeded affine permutation of the postings: any stride coprime with the count is a bijection.
+        stride = rng.randrange(1, internships + 1)
+        while math.gcd(stride, internships) != 1:
+            stride += 1
+        offset = rng.randrange(internships)
+        # Bounded memory: the store ignores the rare repeat from outside the window.
+        window = 1 << 20
+        seen = set()
+        unused = where = None
+        if pairs <= window:
+            # Small grids track their unused pairs, and a repeat takes a random unused one instead
+            # of being redrawn, so even the last free pairs of a full grid cost one step each.
+            unused, where = array("I", range(pairs)), array("I", range(pairs))
+        produced = 0
+        while produced < count:
+            rank = bisect.bisect(posting_cum, rng.random() * posting_cum[-1])
+            # Rank r covers slots r, r + ranks, r + 2 * ranks, ..., so every posting can receive applications.
+            slot = rank + ranks * rng.randrange((internships - 1 - rank) // ranks + 1)
+            pair = ((slot * stride + offset) % internships) * candidates + rng.randrange(candidates)
+            if unused is not None:
+                # count is at most pairs, so an unused pair is always left here.
+                if where[pair] == TAKEN_PAIR:
+                    pair = unused[rng.randrange(len(unused))]
+                last = unused.pop()
+                if last != pair:
+                    unused[where[pair]] = last
+                    where[last] = where[pair]
+                where[pair] = TAKEN_PAIR
+            elif pair in seen:
+                continue
+            else:
+                if len(seen) >= window:
+                    seen.clear()
+                seen.add(pair)
+            applied = self.start + timedelta(seconds=rng.randrange(days * 86400))
+            yield {
+                "internship_id": pair // candidates + 1,
+                "candidate_id": pair % candidates + 1,
+                "status": self._pick(rng, self.statuses, self.status_cum),
+                "applied_at": applied.isoformat(timespec="seconds"),
+            }
+            produced += 1
+
+
+def chunked(rows, size):
+    iterator = iter(rows)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def write_jsonl(rows, path):
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+            count += 1
+    return count
+
+
+def write_store(store, generator, internships, candidates, applications, chunk_size=10000, progress=None):
+    """Load generated rows into an empty CatalogStore, chunk by chunk"""
+    if not store.is_empty():
+        raise ValueError("the store already has postings; generated ids start at 1")
+    for chunk in chunked(generator.internships(internships), chunk_size):
+        store.add_internships(chunk)
+        if progress:
+            progress("internships", chunk[-1]["id"])
+    for chunk in chunked(generator.candidates(candidates), chunk_size):
+        store.add_candidates(chunk)
+        if progress:
+            progress("candidates", chunk[-1]["id"])
+    written = 0
+    for chunk in chunked(generator.applications(applications, internships, candidates), chunk_size):
+        store.add_applications((a["internship_id"], a["candidate_id"], a["applied_at"]) for a in chunk)
+        for status in ("shortlisted", "rejected"):
+            store.set_application_status(
+                [(a["internship_id"], a["candidate_id"]) for a in chunk if a["status"] == status], status
+            )
+        written += len(chunk)
+        if progress:
+            progress("applications", written)
+
+
+def at_least(minimum):
+    """argparse type for a whole number no smaller than minimum"""
+    def parse(value):
+        try:
+            number = int(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"must be a whole number, got {value!r}")
+        if number < minimum:
+            raise argparse.ArgumentTypeError(f"must be at least {minimum}, got {number}")
+        return number
+    return parse
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic InternMatch fixtures")
+    parser.add_argument("--internships", type=at_least(1), default=1000)
+    parser.add_argument("--candidates", type=at_least(1), default=200)
+    parser.add_argument("--applications", type=at_least(0), default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--zipf", type=float, default=1.1, help="skill popularity exponent")
+    parser.add_argument("--format", choices=("jsonl", "db"), default="jsonl")
+    parser.add_argument("--out", default="fixtures", help="output directory for JSONL files")
+    parser.add_argument("--db", help="SQLite database for --format db (default: the app database)")
+    parser.add_argument("--chunk-size", type=at_least(1), default=10000)
+    args = parser.parse_args(argv)
+
+    generator = Generator(args.seed, args.zipf)
+    if args.format == "jsonl":
+        os.makedirs(args.out, exist_ok=True)
+        write_jsonl(generator.courses, os.path.join(args.out, "courses.jsonl"))
+        write_jsonl(generator.internships(args.internships), os.path.join(args.out, "internships.jsonl"))
+        write_jsonl(generator.candidates(args.candidates), os.path.join(args.out, "candidates.jsonl"))
+        write_jsonl(generator.applications(args.applications, args.internships, args.candidates),
+                    os.path.join(args.out, "applications.jsonl"))
+        print(f"wrote fixtures to {args.out}")
+    else:
+        from storage import DB_PATH, CatalogStore
+        store = CatalogStore(args.db or DB_PATH)
+        write_store(store, generator, args.internships, args.candidates, args.applications, args.chunk_size,
+                    progress=lambda kind, n: print(f"{kind}: {n:,}", file=sys.stderr))
+        print(f"loaded {args.internships:,} internships, {args.candidates:,} candidates and "
+              f"{args.applications:,} applications into {args.db or DB_PATH}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
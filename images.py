@@ -0,0 +1,78 @@
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+THUMBNAIL_SIZES = {"small": 64, "medium": 160, "large": 400}
+JPEG_QUALITY = 85
+
+
+def variant_name(size):
+    return f"thumb-{size}.jpg"
+
+
+def make_thumbnails(source, sizes=THUMBNAIL_SIZES):
+    """Downsized JPEG encodings of an image file for each named size"""
+    largest = max(sizes.values())
+    with Image.open(source) as original:
+        # JPEG decoders can scale down while decoding, which is much cheaper than resizing afterwards.
+        original.draft("RGB", (largest, largest))
+        image = ImageOps.exif_transpose(original).convert("RGB")
+    thumbnails = {}
+    for name, size in sorted(sizes.items(), key=lambda item: -item[1]):
+        image.thumbnail((size, size), Image.Resampling.LANCZOS)
+        out = io.BytesIO()
+        image.save(out, "JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True)
+        thumbnails[name] = out.getvalue()
+    return thumbnails
+
+
+class Thumbnailer:
+    """Generates photo thumbnails in a worker pool, once per content hash"""
+
+    def __init__(self, blobs, workers=2, sizes=THUMBNAIL_SIZES):
+        self.blobs = blobs
+        self.sizes = sizes
+        self.lock = threading.Lock()
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="thumbnailer")
+        self._pending = {}
+        self._failed = set()
+
+    def ready(self, digest):
+        return all(self.blobs.exists(digest, variant_name(size)) for size in self.sizes.values())
+
+    def submit(self, ref):
+        """Queue thumbnailing for an uploaded photo unless it is cached or already queued"""
+        if ref.digest in self._failed or self.ready(ref.digest):
+            return None
+        with self.lock:
+            future = self._pending.get(ref.digest)
+            if future is None:
+                future = self._pending[ref.digest] = self.pool.submit(self._generate, ref.digest)
+        return future
+
+    def pending(self, digest):
+        with self.lock:
+            return digest in self._pending
+
+    def _generate(self, digest):
+        try:
+            thumbnails = make_thumbnails(self.blobs.path(digest), self.sizes)
+            for name, data in thumbnails.items():
+                self.blobs.put_variant(digest, variant_name(self.sizes[name]), data)
+            return True
+        except (UnidentifiedImageError, Image.DecompressionBombError, OSError, ValueError):
+            self._failed.add(digest)
+            return False
+        finally:
+            with self.lock:
+                self._pending.pop(digest, None)
+
+    def thumbnail(self, ref, name="medium"):
+        """JPEG bytes of a thumbnail, or None while it is still being generated"""
+        variant = variant_name(self.sizes[name])
+        if self.blobs.exists(ref.digest, variant):
+            return self.blobs.read(ref.digest, variant)
+        self.submit(ref)
+        return None
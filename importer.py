@@ -0,0 +1,186 @@
+"""Bulk import of internship postings from CSV, JSONL or JSON array files.
+
+Usage: python importer.py postings.csv [--format csv|jsonl|json] [--chunk-size 5000] [--db internmatch.db]
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import re
+import sys
+import time
+
+from skills import registry as default_registry
+from storage import DB_PATH, CatalogStore
+
+REQUIRED_FIELDS = ("title", "company", "location", "stipend", "required_skills", "description")
+INTERNSHIP_TYPES = ("Remote", "On-site", "Hybrid")
+OPTIONAL_FIELDS = ("linkedin_url", "duration", "start_date")
+FIELD_ALIASES = {"skills": "required_skills", "job_title": "title", "company_name": "company"}
+MAX_REJECT_SAMPLES = 100
+FORMATS = {".jsonl": "jsonl", ".ndjson": "jsonl", ".json": "json"}
+
+_TYPE_KEYS = {re.sub(r"[^a-z]", "", t.lower()): t for t in INTERNSHIP_TYPES}
+
+
+class ImportReport:
+    """Running totals for one import"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+        self.read = 0
+        self.imported = 0
+        self.rejected = 0
+        self.reject_samples = []
+
+    @property
+    def rows_per_second(self):
+        return self.read / self.elapsed if self.elapsed else 0.0
+
+    def reject(self, line, reason):
+        self.rejected += 1
+        if len(self.reject_samples) < MAX_REJECT_SAMPLES:
+            self.reject_samples.append({"line": line, "reason": reason})
+
+    def tick(self):
+        self.elapsed = time.perf_counter() - self.started
+
+    def summary(self):
+        return (f"{self.imported} imported, {self.rejected} rejected of {self.read} rows "
+                f"in {self.elapsed:.1f}s ({self.rows_per_second:,.0f} rows/s)")
+
+
+def detect_format(name):
+    return FORMATS.get(os.path.splitext(name)[1].lower(), "csv")
+
+
+def _text(source):
+    if isinstance(source, io.TextIOBase):
+        return source
+    return io.TextIOWrapper(source, encoding="utf-8-sig", newline="")
+
+
+def iter_rows(source, fmt):
+    """Yield (line number, row dict or error message) one record at a time; JSON arrays number their items"""
+    source = _text(source)
+    if fmt == "csv":
+        reader = csv.DictReader(source)
+        for row in reader:
+            yield reader.line_num, row
+    elif fmt == "json":
+        # A JSON array has to be parsed whole; JSONL streams and suits large files better.
+        try:
+            rows = json.load(source)
+        except ValueError as e:
+            yield 1, f"invalid JSON: {e}"
+            return
+        if not isinstance(rows, list):
+            yield 1, "expected a JSON array of objects"
+            return
+        for item_num, row in enumerate(rows, start=1):
+            yield item_num, row if isinstance(row, dict) else "expected a JSON object"
+    else:
+        for line_num, line in enumerate(source, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                yield line_num, f"invalid JSON: {e}"
+                continue
+            yield line_num, row if isinstance(row, dict) else "expected a JSON object"
+
+
+def split_skills(value):
+    if isinstance(value, (list, tuple)):
+        return [str(v) for v in value if str(v).strip()]
+    return [s for s in re.split(r"[;|,]", value or "") if s.strip()]
+
+
+def validate(row, registry=default_registry):
+    """Turn a raw row into a posting dict, or return an error message"""
+    row = {FIELD_ALIASES.get(k, k): v for k, v in row.items() if k is not None}
+    missing = [f for f in REQUIRED_FIELDS if not row.get(f) or not str(row.get(f)).strip()]
+    if missing:
+        return f"missing {', '.join(missing)}"
+
+    internship_type = _TYPE_KEYS.get(re.sub(r"[^a-z]", "", str(row.get("type", "")).lower()))
+    if internship_type is None:
+        return f"type must be one of {', '.join(INTERNSHIP_TYPES)}"
+
+    skills = registry.normalize(split_skills(row["required_skills"]))
+    if not skills:
+        return "missing required_skills"
+
+    try:
+        openings = int(row.get("openings") or 1)
+    except (TypeError, ValueError):
+        return "openings must be a whole number"
+
+    internship = {f: str(row[f]).strip() for f in REQUIRED_FIELDS if f != "required_skills"}
+    internship.update({f: str(row[f]).strip() for f in OPTIONAL_FIELDS if row.get(f)})
+    internship["type"] = internship_type
+    internship["required_skills"] = skills
+    internship["openings"] = max(openings, 1)
+    # Only accepted rows register their skills, so later rows reuse their spelling.
+    registry.ids(skills)
+    return internship
+
+
+def import_internships(source, store, fmt="csv", chunk_size=5000, progress=None, registry=default_registry,
+                       posted_by=""):
+    """Stream postings from a file into the store in chunk-sized transactions"""
+    report = ImportReport()
+    batch = []
+    for line_num, row in iter_rows(source, fmt):
+        report.read += 1
+        internship = row if isinstance(row, str) else validate(row, registry)
+        if isinstance(internship, str):
+            report.reject(line_num, internship)
+        else:
+            internship["posted_by"] = posted_by
+            batch.append(internship)
+        if len(batch) >= chunk_size:
+            _flush(batch, store, report, progress)
+    _flush(batch, store, report, progress)
+    return report
+
+
+def _flush(batch, store, report, progress):
+    if batch:
+        store.add_internships(batch)
+        report.imported += len(batch)
+        batch.clear()
+    report.tick()
+    if progress:
+        progress(report)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk import internship postings into the catalog")
+    parser.add_argument("path", help="CSV, JSONL or JSON array file of postings")
+    parser.add_argument("--format", choices=("csv", "jsonl", "json"), help="file format (default: from extension)")
+    parser.add_argument("--chunk-size", type=int, default=5000, help="rows written per transaction")
+    parser.add_argument("--db", default=DB_PATH, help="SQLite database path")
+    args = parser.parse_args(argv)
+
+    store = CatalogStore(args.db)
+    for skill in store.skill_names():
+        default_registry.id(skill)
+    with open(args.path, "rb") as f:
+        report = import_internships(
+            f, store,
+            fmt=args.format or detect_format(args.path),
+            chunk_size=args.chunk_size,
+            progress=lambda r: print(r.summary(), file=sys.stderr)
+        )
+    for sample in report.reject_samples[:20]:
+        print(f"line {sample['line']}: {sample['reason']}", file=sys.stderr)
+    print(report.summary())
+    return 0 if report.imported or not report.read else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,196 @@
+"""Concurrent scripted sessions against app.py, spread over a process pool.
+
+Usage: python loadtest.py [--sessions 48] [--processes 4] [--recruiters 0.25] [--steps 10]
+                          [--size 10000] [--db-dir DIR] [--out loadtest_results.json]
+
+Every process keeps its share of the sessions alive at once and interleaves
+their reruns round-robin, so session state accumulates side by side. AppTest
+installs a process-wide runtime while it runs, so reruns within a process are
+serial and the concurrency comes from the pool. Students add courses and
+browse; recruiters triage new applications. Per-session memory is the growth
+in resident memory after a warm-up session, divided by the sessions in that
+process. It includes the element tree AppTest keeps for each session, so it
+is an upper bound.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+import datagen
+from benchmark import percentiles
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+COURSES = ["Machine Learning", "Web Development", "Database Management", "Business Analytics",
+           "Digital Marketing", "Data Structures and Algorithms", "Human Resource Management"]
+QUERIES = ["data", "python", "marketing", "web", "design", "", "analytics", "intern"]
+TRIAGE_PATTERNS = ["sx", "s-x", "xx-s", "s"]
+
+
+def rss_mb():
+    """Current (not peak) resident set size of this process"""
+    with open("/proc/self/statm") as f:
+        pages = int(f.read().split()[1])
+    return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+class Session:
+    """One scripted user; each step is a single rerun of the app"""
+
+    def __init__(self, role, number):
+        from streamlit.testing.v1 import AppTest
+        self.role = role
+        self.number = number
+        self.at = AppTest.from_file(APP_PATH, default_timeout=600)
+        self.at.session_state["logged_in"] = True
+        self.at.session_state["user_type"] = role
+        self.at.session_state["user_data"] = {"name": f"Load {role} {number}",
+                                              "email": f"{role}{number}@example.com"}
+        self.latencies = {}
+
+    def _timed(self, step, action):
+        started = time.perf_counter()
+        at = action()
+        elapsed = time.perf_counter() - started
+        if at.exception:
+            raise RuntimeError(f"{self.role} {self.number} {step}: " + "; ".join(e.value for e in at.exception))
+        self.latencies.setdefault(step, []).append(elapsed)
+
+    def _navigate(self, page):
+        self._timed(f"open {page}", lambda: self.at.sidebar.radio[0].set_value(page).run())
+
+    def step(self, n):
+        if n == 0:
+            self._timed("first run", self.at.run)
+        elif self.role == "student":
+            self.student_step(n)
+        else:
+            self.recruiter_step(n)
+
+    def student_step(self, n):
+        # Alternate adding a course with a browse search, so state grows as it would for a real user.
+        if n % 2:
+            self._navigate("Add Courses")
+            course = COURSES[(self.number + n // 2) % len(COURSES)]
+            self.at.selectbox(key="course_select").set_value(course)
+            add = next(b for b in self.at.button if b.label == "➕ Add Course")
+            self._timed("add course", lambda: add.click().run())
+        else:
+            self._navigate("Browse Internships")
+            search = next(t for t in self.at.text_input if t.label == "Search")
+            query = QUERIES[(self.number + n) % len(QUERIES)]
+            self._timed("browse search", lambda: search.set_value(query).run())
+
+    def recruiter_step(self, n):
+        if n == 1:
+            self._navigate("Manage Applications")
+        self.at.text_input(key="triage_keys").set_value(TRIAGE_PATTERNS[(self.number + n) % len(TRIAGE_PATTERNS)])
+        apply = next(b for b in self.at.button if b.label == "⌨️ Apply Keys")
+        self._timed("triage", lambda: apply.click().run())
+
+
+def run_worker(sessions, steps):
+    """Run a process's sessions side by side; returns latencies and memory figures"""
+    warmup = Session("student", -1)
+    for n in range(3):
+        warmup.step(n)
+    baseline = rss_mb()
+
+    sessions = [Session(role, number) for role, number in sessions]
+    started = time.perf_counter()
+    for n in range(steps):
+        for session in sessions:
+            session.step(n)
+    elapsed = time.perf_counter() - started
+    # Sessions are still referenced here, so their state is still resident.
+    grown = rss_mb() - baseline
+    latencies = {}
+    for session in sessions:
+        for step, samples in session.latencies.items():
+            latencies.setdefault(f"{session.role}/{step}", []).extend(samples)
+    return {"sessions": len(sessions), "elapsed_s": elapsed, "baseline_rss_mb": baseline,
+            "session_rss_mb": grown / len(sessions), "latencies": latencies}
+
+
+def summarize(workers, wall_s):
+    latencies = {}
+    for worker in workers:
+        for step, samples in worker["latencies"].items():
+            latencies.setdefault(step, []).extend(samples)
+    reruns = sum(len(samples) for samples in latencies.values())
+    # Workers overlap, so throughput adds up per worker; wall time also covers spawning and warm-up.
+    throughput = sum(sum(map(len, w["latencies"].values())) / w["elapsed_s"] for w in workers)
+    per_session = [w["session_rss_mb"] for w in workers]
+    return {
+        "sessions": sum(w["sessions"] for w in workers),
+        "processes": len(workers),
+        "wall_s": round(wall_s, 2),
+        "reruns": reruns,
+        "reruns_per_s": round(throughput, 2),
+        "latency": percentiles([s for samples in latencies.values() for s in samples]),
+        "steps": {step: percentiles(samples) for step, samples in sorted(latencies.items())},
+        "baseline_rss_mb": round(max(w["baseline_rss_mb"] for w in workers), 1),
+        "session_rss_mb": round(sum(per_session) / len(per_session), 2),
+        "session_rss_mb_max": round(max(per_session), 2),
+    }
+
+
+def _init_worker(db_path, blob_root):
+    # storage and blobs read these at import, so set them before the app is loaded.
+    os.environ["INTERNMATCH_DB"] = db_path
+    os.environ["INTERNMATCH_BLOBS"] = blob_root
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test app.py with concurrent scripted sessions")
+    parser.add_argument("--sessions", type=int, default=48, help="concurrent sessions in total")
+    parser.add_argument("--processes", type=int, default=4, help="worker processes sharing the sessions")
+    parser.add_argument("--recruiters", type=float, default=0.25, help="fraction of sessions that are recruiters")
+    parser.add_argument("--steps", type=int, default=10, help="reruns per session after the first run")
+    parser.add_argument("--size", type=int, default=10000, help="generated catalog size")
+    parser.add_argument("--seed", type=int, default=0, help="fixture random seed")
+    parser.add_argument("--db-dir", help="keep the fixture database here and reuse it (default: temporary)")
+    parser.add_argument("--out", default="loadtest_results.json", help="JSON results file")
+    args = parser.parse_args(argv)
+
+    processes = max(1, min(args.processes, args.sessions))
+    recruiters = round(args.sessions * args.recruiters)
+    roles = ["recruiter"] * recruiters + ["student"] * (args.sessions - recruiters)
+    # Interleave roles so every process gets a similar mix.
+    shares = [list(enumerate(roles))[i::processes] for i in range(processes)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_dir = args.db_dir or tmp
+        os.makedirs(db_dir, exist_ok=True)
+        db_path = os.path.join(db_dir, f"load-{args.size}-{args.seed}.db")
+        from storage import CatalogStore
+        store = CatalogStore(db_path)
+        if store.is_empty():
+            print(f"generating {args.size:,} postings...", file=sys.stderr)
+            candidates = max(args.size // 10, 3)
+            datagen.write_store(store, datagen.Generator(args.seed), args.size, candidates, candidates * 5)
+
+        print(f"running {args.sessions} sessions ({recruiters} recruiters) on {processes} processes...",
+              file=sys.stderr)
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(processes, initializer=_init_worker, initargs=(db_path, os.path.join(tmp, "blobs"))) as pool:
+            started = time.perf_counter()
+            pending = [pool.apply_async(run_worker, ([(role, n) for n, role in share], args.steps + 1))
+                       for share in shares]
+            workers = [result.get() for result in pending]
+            wall_s = time.perf_counter() - started
+
+    summary = summarize(workers, wall_s)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2)
+    print(f"{summary['reruns_per_s']} reruns/s, p50 {summary['latency']['p50_ms']}ms, "
+          f"p99 {summary['latency']['p99_ms']}ms, {summary['session_rss_mb']} MB per session "
+          f"(max {summary['session_rss_mb_max']}), wrote {args.out}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
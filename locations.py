@@ -0,0 +1,115 @@
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+Location = namedtuple("Location", ["city", "state", "country", "remote"])
+
+REMOTE = "Remote"
+REMOTE_WORDS = {"remote", "work from home", "wfh", "anywhere", "online", "virtual"}
+
+CITY_ALIASES = {
+    "bengaluru": "Bangalore",
+    "bombay": "Mumbai",
+    "new delhi": "Delhi",
+    "ncr": "Delhi",
+    "delhi ncr": "Delhi",
+    "gurgaon": "Gurugram",
+    "madras": "Chennai",
+    "calcutta": "Kolkata",
+    "trivandrum": "Thiruvananthapuram",
+    "cochin": "Kochi",
+    "poona": "Pune",
+    "navi mumbai": "Mumbai",
+    "sf": "San Francisco",
+    "nyc": "New York",
+}
+
+CITY_STATES = {
+    "Bangalore": ("Karnataka", "India"),
+    "Mumbai": ("Maharashtra", "India"),
+    "Pune": ("Maharashtra", "India"),
+    "Delhi": ("Delhi", "India"),
+    "Gurugram": ("Haryana", "India"),
+    "Noida": ("Uttar Pradesh", "India"),
+    "Hyderabad": ("Telangana", "India"),
+    "Chennai": ("Tamil Nadu", "India"),
+    "Kolkata": ("West Bengal", "India"),
+    "Ahmedabad": ("Gujarat", "India"),
+    "Jaipur": ("Rajasthan", "India"),
+    "Kochi": ("Kerala", "India"),
+    "Thiruvananthapuram": ("Kerala", "India"),
+    "Chandigarh": ("Chandigarh", "India"),
+    "Indore": ("Madhya Pradesh", "India"),
+    "Lucknow": ("Uttar Pradesh", "India"),
+    "Bhubaneswar": ("Odisha", "India"),
+    "Coimbatore": ("Tamil Nadu", "India"),
+    "San Francisco": ("California", "United States"),
+    "New York": ("New York", "United States"),
+    "London": ("", "United Kingdom"),
+    "Singapore": ("", "Singapore"),
+}
+
+COUNTRIES = {
+    "india": "India",
+    "in": "India",
+    "united states": "United States",
+    "usa": "United States",
+    "us": "United States",
+    "united kingdom": "United Kingdom",
+    "uk": "United Kingdom",
+    "singapore": "Singapore",
+    "germany": "Germany",
+    "canada": "Canada",
+    "uae": "United Arab Emirates",
+    "united arab emirates": "United Arab Emirates",
+}
+
+STATES = {state.casefold(): (state, country) for state, country in set(CITY_STATES.values()) if state}
+STATES.update({
+    "ka": ("Karnataka", "India"),
+    "mh": ("Maharashtra", "India"),
+    "tn": ("Tamil Nadu", "India"),
+    "up": ("Uttar Pradesh", "India"),
+    "ca": ("California", "United States"),
+    "ny": ("New York", "United States"),
+})
+
+
+def _fold(text):
+    return re.sub(r"\s+", " ", text).strip().casefold()
+
+
+CITY_KEYS = {_fold(city): city for city in CITY_STATES}
+CITY_KEYS.update(CITY_ALIASES)
+
+
+@lru_cache(maxsize=65536)
+def parse_location(text):
+    """Split a free-text location into city, state, country and a remote flag"""
+    city = state = country = ""
+    remote = False
+    for part in re.split(r"[,/;|()]+|\s[-–]\s", text or ""):
+        folded = _fold(part)
+        if not folded:
+            continue
+        if folded in REMOTE_WORDS or folded.startswith("remote"):
+            remote = True
+        elif folded in COUNTRIES:
+            country = COUNTRIES[folded]
+        elif folded in STATES and (city or folded not in CITY_KEYS):
+            state, country = state or STATES[folded][0], country or STATES[folded][1]
+        elif not city:
+            city = CITY_KEYS.get(folded) or re.sub(r"\s+", " ", part).strip().title()
+    if city in CITY_STATES:
+        known_state, known_country = CITY_STATES[city]
+        state = state or known_state
+        country = country or known_country
+    return Location(city, state, country, remote)
+
+
+def location_keys(location):
+    """Canonical keys a posting is indexed under: city, state, country and Remote"""
+    keys = [k for k in (location.city, location.state, location.country) if k]
+    if location.remote:
+        keys.append(REMOTE)
+    return list(dict.fromkeys(keys))
@@ -0,0 +1,142 @@
+"""Optional timing and memory instrumentation for script reruns.
+
+Enable with INTERNMATCH_PROFILE=1 (timers) or INTERNMATCH_PROFILE=memory (timers
+and tracemalloc). Runs are appended to INTERNMATCH_PROFILE_LOG as JSON lines.
+When disabled, timer() returns a shared no-op context and timed() returns the
+function unchanged.
+"""
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections import OrderedDict, deque
+from contextlib import nullcontext
+
+MODE = os.environ.get("INTERNMATCH_PROFILE", "").strip().lower()
+ENABLED = MODE not in ("", "0", "off", "false")
+TRACE_MEMORY = MODE == "memory"
+LOG_PATH = os.environ.get(
+    "INTERNMATCH_PROFILE_LOG", os.path.join(os.path.dirname(os.path.abspath(__file__)), "profile.jsonl")
+)
+RECENT_RUNS = 20
+RECENT_SESSIONS = 100
+
+_NULL = nullcontext()
+_local = threading.local()
+_log_lock = threading.Lock()
+_recent_lock = threading.Lock()
+# Session id -> its latest runs, least recently active session first; ended sessions age out.
+_recent = OrderedDict()
+
+if TRACE_MEMORY and not tracemalloc.is_tracing():
+    tracemalloc.start()
+
+
+def _session_id():
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+    except ImportError:
+        return None
+    ctx = get_script_run_ctx(suppress_warning=True)
+    return ctx.session_id if ctx else None
+
+
+class RunProfile:
+    """Timings and memory for one full or fragment rerun"""
+
+    def __init__(self, kind):
+        self.kind = kind
+        self.fields = {"session": _session_id()}
+        self.timings = {}
+        self.started = time.time()
+        self.memory_start = 0
+        if TRACE_MEMORY:
+            self.memory_start = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+
+    def add(self, name, seconds):
+        total, count = self.timings.get(name, (0.0, 0))
+        self.timings[name] = (total + seconds, count + 1)
+
+    def record(self):
+        record = dict(self.fields, ts=self.started, kind=self.kind)
+        record["timings"] = {name: {"ms": round(total * 1000, 3), "count": count}
+                             for name, (total, count) in self.timings.items()}
+        if TRACE_MEMORY:
+            # tracemalloc is process-wide, so concurrent sessions show up in each other's numbers.
+            current, peak = tracemalloc.get_traced_memory()
+            record["memory"] = {"retained_kb": round((current - self.memory_start) / 1024, 1),
+                                "peak_kb": round((peak - self.memory_start) / 1024, 1),
+                                "traced_kb": round(current / 1024, 1)}
+        return record
+
+
+def _finish(run):
+    record = run.record()
+    session = record.get("session")
+    with _recent_lock:
+        runs = _recent.pop(session, None) or deque(maxlen=RECENT_RUNS)
+        runs.append(record)
+        _recent[session] = runs
+        while len(_recent) > RECENT_SESSIONS:
+            _recent.popitem(last=False)
+    line = json.dumps(record)
+    with _log_lock:
+        with open(LOG_PATH, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+class _Timer:
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.run = getattr(_local, "run", None)
+        self.owner = self.run is None
+        if self.owner:
+            # A timer outside any run (e.g. a fragment rerun) starts its own.
+            self.run = _local.run = RunProfile(self.name)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.run.add(self.name, time.perf_counter() - self.start)
+        if self.owner:
+            _local.run = None
+            _finish(self.run)
+        return False
+
+
+def timer(name):
+    """Context manager adding its elapsed time to the current run under name"""
+    return _Timer(name) if ENABLED else _NULL
+
+
+def timed(name):
+    """Decorator form of timer(); leaves the function untouched when profiling is off"""
+    def decorate(func):
+        if not ENABLED:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with _Timer(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def annotate(**fields):
+    """Attach fields such as the session id or page to the current run"""
+    run = getattr(_local, "run", None) if ENABLED else None
+    if run is not None:
+        run.fields.update(fields)
+
+
+def recent_runs(session=None):
+    """Most recent finished runs for a session (default: the current one), oldest first"""
+    session = session or _session_id()
+    with _recent_lock:
+        return list(_recent.get(session, ()))
@@ -0,0 +1,106 @@
+"""Compact record types for postings, candidates and resume entries.
+
+Records keep their fields in __slots__ rather than a per-instance dict, with
+skill names as tuples of interned strings and, on postings and candidates,
+skills as tuples of registry IDs. They are also mappings over their fields, so code that still indexes
+them like the dicts they replace keeps working.
+"""
+import sys
+from collections.abc import Mapping
+
+from skills import registry as default_registry
+
+
+def _interned(names):
+    return tuple(sys.intern(name) for name in names or ())
+
+
+class Record(Mapping):
+    """Base for slotted records; subclasses list their fields in __slots__"""
+
+    __slots__ = ()
+    DEFAULTS = {}
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            setattr(self, name, fields.get(name, self.DEFAULTS.get(name)))
+
+    @classmethod
+    def from_dict(cls, data):
+        """Record from a dict such as a store row; keys that are not fields are dropped"""
+        return cls(**{name: data[name] for name in cls.__slots__ if name in data})
+
+    def __getitem__(self, name):
+        if name not in self.FIELDS:
+            raise KeyError(name)
+        return getattr(self, name)
+
+    def __setitem__(self, name, value):
+        if name not in self.FIELDS:
+            raise KeyError(name)
+        setattr(self, name, value)
+
+    def __iter__(self):
+        return iter(self.__slots__)
+
+    def __len__(self):
+        return len(self.__slots__)
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.FIELDS = frozenset(cls.__slots__)
+
+
+class Internship(Record):
+    """A posting with its required skills as names and as registry IDs"""
+
+    __slots__ = ("id", "title", "company", "location", "type", "stipend", "description", "linkedin_url",
+                 "duration", "start_date", "openings", "stipend_amount", "stipend_currency", "stipend_period",
+                 "stipend_monthly", "posted_by", "required_skills", "skill_ids")
+    DEFAULTS = {"linkedin_url": "", "duration": "", "openings": 1, "posted_by": ""}
+
+    @classmethod
+    def from_dict(cls, data, registry=default_registry):
+        record = super().from_dict(data)
+        record.required_skills = _interned(record.required_skills)
+        record.skill_ids = tuple(registry.ids(record.required_skills))
+        return record
+
+
+class Candidate(Record):
+    """A candidate profile with its skills as names and as registry IDs"""
+
+    __slots__ = ("id", "name", "email", "personality", "match", "resume_url", "skills", "courses", "skill_ids")
+    DEFAULTS = {"personality": "", "match": 0, "resume_url": ""}
+
+    @classmethod
+    def from_dict(cls, data, registry=default_registry):
+        record = super().from_dict(data)
+        record.skills = _interned(record.skills)
+        record.courses = _interned(record.courses)
+        record.skill_ids = tuple(registry.ids(record.skills))
+        return record
+
+
+class Education(Record):
+    """One education entry on a student's resume"""
+
+    __slots__ = ("degree", "college", "year", "marks")
+    DEFAULTS = {"year": "", "marks": ""}
+
+
+class Project(Record):
+    """One project on a student's resume"""
+
+    __slots__ = ("name", "description", "tags", "skills")
+
+    @classmethod
+    def create(cls, name, description, tags=(), skills=()):
+        return cls(name=name, description=description, tags=_interned(tags), skills=_interned(skills))
@@ -0,0 +1,105 @@
+from functools import lru_cache
+from html import escape
+
+THEMES = {
+    False: {"bg_color": "#fafafa", "card_bg": "#ffffff", "text_color": "#1a1a1a",
+            "border_color": "#e0e0e0", "accent_color": "#1f77b4"},
+    True: {"bg_color": "#0a1929", "card_bg": "#1a2332", "text_color": "#e0e0e0",
+           "border_color": "#2d3748", "accent_color": "#3b82f6"},
+}
+
+
+@lru_cache(maxsize=len(THEMES))
+def theme_css(dark_mode):
+    """Style block for the light or dark theme, built once per theme"""
+    return """
+<style>
+.stApp {{
+    background-color: {bg_color};
+}}
+.main-header {{
+    font-size: 2.5rem;
+    font-weight: bold;
+    color: {accent_color};
+    text-align: center;
+    margin-bottom: 2rem;
+}}
+.metric-card {{
+    padding: 1.5rem;
+    border-radius: 1rem;
+    background-color: {card_bg};
+    border: 2px solid {border_color};
+    margin-bottom: 1rem;
+    box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+    text-align: center;
+}}
+.metric-value {{
+    font-size: 3rem;
+    font-weight: bold;
+    color: {accent_color};
+    margin: 0.5rem 0;
+}}
+.metric-label {{
+    font-size: 1.1rem;
+    color: {text_color};
+    font-weight: 500;
+}}
+.internship-card {{
+    padding: 1.5rem;
+    border-radius: 0.5rem;
+    background-color: {card_bg};
+    border: 1px solid {border_color};
+    margin-bottom: 1rem;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+}}
+.skill-badge {{
+    display: inline-block;
+    padding: 0.3rem 0.8rem;
+    margin: 0.2rem;
+    border-radius: 1rem;
+    background-color: #e3f2fd;
+    color: #1976d2;
+    font-size: 0.9rem;
+}}
+.theme-toggle {{
+    position: fixed;
+    top: 1rem;
+    right: 1rem;
+    z-index: 999;
+}}
+.candidate-card {{
+    padding: 1rem;
+    border-radius: 0.5rem;
+    background-color: {card_bg};
+    border: 1px solid {border_color};
+    margin-bottom: 1rem;
+}}
+.candidate-card.greyed {{
+    opacity: 0.5;
+    background-color: #f5f5f5;
+}}
+.status-message {{
+    color: #666;
+    font-style: italic;
+    margin-top: 0.5rem;
+}}
+</style>
+""".format(**THEMES[dark_mode])
+
+
+@lru_cache(maxsize=4096)
+def badges(items):
+    """Badge row for a tuple of skills or tags"""
+    return "".join(f'<span class="skill-badge">{escape(item)}</span>' for item in items)
+
+
+@lru_cache(maxsize=1024)
+def metric_card(label, value, color=None):
+    """Metric card with a label and a large value"""
+    style = f' style="color: {color};"' if color else ""
+    return f"""
+<div class="metric-card">
+    <div class="metric-label">{escape(label)}</div>
+    <div class="metric-value"{style}>{escape(str(value))}</div>
+</div>
+"""
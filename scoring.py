@@ -0,0 +1,70 @@
+import heapq
+from collections import namedtuple
+
+import numpy as np
+
+SkillScores = namedtuple("SkillScores", ["percent", "matched", "missing"])
+
+
+class SkillMatrix:
+    """Postings x skill ID matrix stored in CSR form"""
+
+    def __init__(self):
+        self.width = 0
+        self._base = None
+        self._base_rows = 0
+        self._rows = []
+        self._compiled = None
+
+    def __len__(self):
+        return self._base_rows + len(self._rows)
+
+    def load(self, indices, offsets):
+        """Start an empty matrix from CSR arrays, e.g. mapped from a snapshot; add_row() appends after them"""
+        if len(self):
+            raise ValueError("only an empty matrix can be loaded")
+        self._base = (indices, offsets)
+        self._base_rows = len(offsets) - 1
+        if len(indices):
+            self.width = max(self.width, int(indices.max()) + 1)
+        self._compiled = None
+
+    def add_row(self, skill_ids):
+        """Append a posting's unique required skill IDs as a new row"""
+        self._rows.append(skill_ids)
+        if skill_ids:
+            self.width = max(self.width, max(skill_ids) + 1)
+        self._compiled = None
+
+    def compile(self):
+        """CSR indices and row offsets for the rows added so far, rebuilt only after new rows"""
+        if self._compiled is None:
+            lengths = np.fromiter((len(r) for r in self._rows), dtype=np.int64, count=len(self._rows))
+            indices = np.fromiter((c for r in self._rows for c in r), dtype=np.int64, count=int(lengths.sum()))
+            if self._base is None:
+                offsets = np.concatenate([[0], np.cumsum(lengths)])
+            elif not self._rows:
+                indices, offsets = self._base
+            else:
+                base_indices, base_offsets = self._base
+                indices = np.concatenate([base_indices, indices])
+                offsets = np.concatenate([base_offsets, base_offsets[-1] + np.cumsum(lengths)])
+            self._compiled = (indices, offsets, self.width)
+        return self._compiled
+
+    def score(self, skill_ids, compiled=None):
+        """Score a student's skill IDs against every posting at once"""
+        indices, offsets, width = compiled or self.compile()
+        vector = np.zeros(width, dtype=bool)
+        vector[[i for i in skill_ids if i < width]] = True
+        hits = np.concatenate([[0], np.cumsum(vector[indices], dtype=np.int64)])
+        matched = hits[offsets[1:]] - hits[offsets[:-1]]
+        totals = np.diff(offsets)
+        percent = np.divide(matched * 100.0, totals, out=np.zeros(len(totals)), where=totals > 0)
+        return SkillScores(percent, matched, totals - matched)
+
+
+def top_k(positions, percent, k):
+    """Heap-select the k best-scoring rows, ties kept in row order"""
+    values = percent.tolist()
+    return heapq.nlargest(k, positions, key=lambda p: (values[p], -p))
@@ -0,0 +1,131 @@
+import math
+import re
+import threading
+from array import array
+
+import numpy as np
+
+STOPWORDS = frozenset("""
+a an and are as at be by for from in into is it of on or the to with our your you we will this that
+""".split())
+
+TOKEN_RE = re.compile(r"[a-z0-9]+(?:[+#]+|\.[a-z0-9]+)*")
+
+
+def tokenize(text):
+    """Lowercased word tokens without stopwords; keeps terms like c++ and node.js"""
+    return [t for t in TOKEN_RE.findall(text.casefold()) if t not in STOPWORDS]
+
+
+class TextIndex:
+    """Incremental inverted index over document rows with BM25 ranking"""
+
+    def __init__(self, k1=1.2, b=0.75):
+        self.k1 = k1
+        self.b = b
+        self.lock = threading.Lock()
+        self.doc_lengths = array("I")
+        self.total_length = 0
+        self._postings = {}
+        self._compiled = {}
+        self._norm_cache = None
+        # Postings for the first rows when loaded from a snapshot: term -> slot, and CSR arrays.
+        self._base_terms = {}
+        self._base = None
+
+    def __len__(self):
+        return len(self.doc_lengths)
+
+    def add(self, text):
+        """Index the next document row"""
+        tokens = tokenize(text)
+        counts = {}
+        for token in tokens:
+            counts[token] = counts.get(token, 0) + 1
+        with self.lock:
+            row = len(self.doc_lengths)
+            for term, tf in counts.items():
+                rows, tfs = self._postings.setdefault(term, (array("I"), array("H")))
+                rows.append(row)
+                tfs.append(min(tf, 0xFFFF))
+                self._compiled.pop(term, None)
+            self.doc_lengths.append(len(tokens))
+            self.total_length += len(tokens)
+
+    def load(self, doc_lengths, terms, offsets, rows, tfs):
+        """Start an empty index from saved CSR postings; add() continues after their rows"""
+        with self.lock:
+            if len(self.doc_lengths):
+                raise ValueError("only an empty index can be loaded")
+            self.doc_lengths.frombytes(np.asarray(doc_lengths, dtype=np.uint32).tobytes())
+            self.total_length = int(np.sum(doc_lengths, dtype=np.int64))
+            self._base_terms = {term: slot for slot, term in enumerate(terms)}
+            self._base = (offsets, rows, tfs)
+            self._compiled = {}
+            self._norm_cache = None
+
+    def _merged(self, term):
+        parts = []
+        slot = self._base_terms.get(term)
+        if slot is not None:
+            offsets, rows, tfs = self._base
+            start, end = int(offsets[slot]), int(offsets[slot + 1])
+            parts.append((rows[start:end], tfs[start:end]))
+        postings = self._postings.get(term)
+        if postings is not None:
+            parts.append(postings)
+        if not parts:
+            return None
+        return (np.concatenate([np.asarray(r, dtype=np.int64) for r, _ in parts]),
+                np.concatenate([np.asarray(t, dtype=np.float64) for _, t in parts]))
+
+    def dump(self):
+        """Document lengths and term postings as CSR arrays: (doc_lengths, terms, offsets, rows, tfs)"""
+        with self.lock:
+            terms = list(dict.fromkeys([*self._base_terms, *self._postings]))
+            merged = [self._merged(term) for term in terms]
+            lengths = np.array(self.doc_lengths, dtype=np.uint32)
+        offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+        np.cumsum([len(rows) for rows, _ in merged], out=offsets[1:])
+        rows = np.concatenate([r for r, _ in merged]).astype(np.uint32) if merged else np.zeros(0, np.uint32)
+        tfs = np.concatenate([t for _, t in merged]).astype(np.uint16) if merged else np.zeros(0, np.uint16)
+        return lengths, terms, offsets, rows, tfs
+
+    def _norms(self, count):
+        """Per-row BM25 length normalisation, recomputed only after new rows"""
+        norms = self._norm_cache
+        if norms is None or len(norms) != count:
+            with self.lock:
+                lengths = np.array(self.doc_lengths[:count], dtype=np.float64)
+                average = self.total_length / max(len(self.doc_lengths), 1)
+                norms = self.k1 * (1 - self.b + self.b * lengths / (average or 1.0))
+                self._norm_cache = norms
+        return norms
+
+    def _term_weights(self, term, count):
+        """Rows containing a term and their BM25 term-frequency weights"""
+        compiled = self._compiled.get(term)
+        if compiled is None or compiled[2] != count:
+            with self.lock:
+                merged = self._merged(term)
+            if merged is None:
+                return None
+            rows, tfs = merged
+            keep = rows < count
+            rows, tfs = rows[keep], tfs[keep]
+            weights = tfs * (self.k1 + 1) / (tfs + self._norms(count)[rows])
+            compiled = self._compiled[term] = (rows, weights, count)
+        return compiled
+
+    def search(self, query):
+        """BM25 score of every row; rows without any query term score 0"""
+        count = len(self.doc_lengths)
+        scores = np.zeros(count)
+        for term in dict.fromkeys(tokenize(query)):
+            compiled = self._term_weights(term, count)
+            if compiled is None:
+                continue
+            rows, weights, _ = compiled
+            idf = math.log(1 + (count - len(rows) + 0.5) / (len(rows) + 0.5))
+            scores += np.bincount(rows, weights=weights * idf, minlength=count)
+        return scores
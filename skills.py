@@ -0,0 +1,167 @@
+import re
+import threading
+from array import array
+from collections import namedtuple
+
+SKILL_ALIASES = {
+    "ml": "Machine Learning",
+    "ai/ml": "Machine Learning",
+    "js": "JavaScript",
+    "javascript (es6)": "JavaScript",
+    "reactjs": "React",
+    "react.js": "React",
+    "py": "Python",
+    "python3": "Python",
+    "stats": "Statistics",
+    "dsa": "Algorithms",
+    "hr": "HR Management",
+    "human resources": "HR Management",
+    "ms excel": "Excel",
+    "microsoft excel": "Excel",
+    "numpy": "NumPy",
+    "mysql": "MySQL",
+    "sql": "SQL",
+    "seo": "SEO",
+    "css3": "CSS",
+    "html5": "HTML",
+    "social media marketing": "Social Media",
+    "copywriting": "Content Writing",
+}
+
+SkillDelta = namedtuple("SkillDelta", ["added", "removed"])
+
+
+def _fold(name):
+    return re.sub(r"\s+", " ", name).strip().casefold()
+
+
+class SkillRegistry:
+    """Interns canonical skill names as stable integer IDs"""
+
+    def __init__(self, skills=(), aliases=SKILL_ALIASES):
+        self._lock = threading.Lock()
+        self._names = []
+        self._ids = {}
+        # Exact spellings already resolved; postings repeat the same few hundred names.
+        self._seen = {}
+        self._aliases = {_fold(canonical): canonical for canonical in aliases.values()}
+        self._aliases.update((_fold(alias), canonical) for alias, canonical in aliases.items())
+        for skill in skills:
+            self.id(skill)
+
+    def __len__(self):
+        return len(self._names)
+
+    def canonical(self, name):
+        """Canonical spelling for a skill name or alias"""
+        folded = _fold(name)
+        if folded in self._aliases:
+            return self._aliases[folded]
+        skill_id = self._ids.get(folded)
+        if skill_id is not None:
+            return self._names[skill_id]
+        return re.sub(r"\s+", " ", name).strip()
+
+    def id(self, name):
+        """ID for a skill, registering it on first sight"""
+        skill_id = self._seen.get(name)
+        if skill_id is not None:
+            return skill_id
+        raw = name
+        name = self.canonical(name)
+        folded = _fold(name)
+        skill_id = self._ids.get(folded)
+        if skill_id is None:
+            with self._lock:
+                skill_id = self._ids.get(folded)
+                if skill_id is None:
+                    skill_id = len(self._names)
+                    self._names.append(name)
+                    self._ids[folded] = skill_id
+        self._seen[raw] = skill_id
+        return skill_id
+
+    def lookup(self, name):
+        """ID for a known skill, or None without registering it"""
+        folded = _fold(name)
+        if folded in self._aliases:
+            folded = _fold(self._aliases[folded])
+        return self._ids.get(folded)
+
+    def key(self, name):
+        """Spelling-, case- and alias-insensitive key for a skill name, known or not; never registers"""
+        return _fold(self.canonical(name))
+
+    def ids(self, names):
+        """Compact array of unique skill IDs, in first-seen order"""
+        return array("I", dict.fromkeys(self.id(name) for name in names))
+
+    def known_ids(self, names):
+        """Unique IDs of the given skills that are registered, ignoring the rest; never registers"""
+        return list(dict.fromkeys(i for i in map(self.lookup, names) if i is not None))
+
+    def name(self, skill_id):
+        return self._names[skill_id]
+
+    def names(self, skill_ids):
+        return [self._names[i] for i in skill_ids]
+
+    def normalize(self, names):
+        """Canonical, de-duplicated skill names; never registers"""
+        unique = {}
+        for name in names:
+            unique.setdefault(self.key(name), self.canonical(name))
+        return list(unique.values())
+
+    def mask(self, skill_ids):
+        """Bitset with one bit per skill ID"""
+        bits = 0
+        for skill_id in skill_ids:
+            bits |= 1 << skill_id
+        return bits
+
+    def ids_in_mask(self, bits):
+        skill_ids = []
+        while bits:
+            low = bits & -bits
+            skill_ids.append(low.bit_length() - 1)
+            bits ^= low
+        return skill_ids
+
+
+class SkillCounter:
+    """Skill IDs contributed by several sources, reference-counted per skill"""
+
+    def __init__(self):
+        self.counts = {}
+
+    def __iter__(self):
+        return iter(self.counts)
+
+    def __len__(self):
+        return len(self.counts)
+
+    def add(self, skill_ids):
+        """Count one more source for each skill; return the skills that appeared"""
+        added = []
+        for skill_id in skill_ids:
+            count = self.counts.get(skill_id, 0)
+            self.counts[skill_id] = count + 1
+            if not count:
+                added.append(skill_id)
+        return SkillDelta(added, [])
+
+    def remove(self, skill_ids):
+        """Drop one source for each skill; return the skills that disappeared"""
+        removed = []
+        for skill_id in skill_ids:
+            count = self.counts.get(skill_id, 0)
+            if count > 1:
+                self.counts[skill_id] = count - 1
+            elif count:
+                del self.counts[skill_id]
+                removed.append(skill_id)
+        return SkillDelta([], removed)
+
+
+registry = SkillRegistry()
@@ -0,0 +1,61 @@
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+Stipend = namedtuple("Stipend", ["amount", "currency", "period", "monthly_inr"])
+
+CURRENCY_SYMBOLS = {
+    "₹": "INR", "rs": "INR", "rs.": "INR", "inr": "INR",
+    "$": "USD", "usd": "USD",
+    "€": "EUR", "eur": "EUR",
+    "£": "GBP", "gbp": "GBP",
+}
+# Rough conversion rates, only used to compare stipends in different currencies.
+INR_RATES = {"INR": 1.0, "USD": 83.0, "EUR": 90.0, "GBP": 105.0}
+
+PERIODS = {
+    "month": "month", "mo": "month", "pm": "month", "p.m.": "month", "monthly": "month",
+    "week": "week", "wk": "week", "weekly": "week",
+    "year": "year", "yr": "year", "annum": "year", "pa": "year", "p.a.": "year", "annual": "year",
+    "lpa": "year",
+    "day": "day", "daily": "day",
+    "hour": "hour", "hr": "hour", "hourly": "hour",
+    "lump sum": "total", "total": "total", "one-time": "total",
+}
+MONTHLY_FACTORS = {"month": 1.0, "week": 52 / 12, "year": 1 / 12, "day": 22.0, "hour": 176.0, "total": 1 / 3}
+MULTIPLIERS = {"k": 1e3, "thousand": 1e3, "l": 1e5, "lakh": 1e5, "lakhs": 1e5, "lac": 1e5, "lpa": 1e5}
+
+AMOUNT_RE = re.compile(r"(\d[\d,]*(?:\.\d+)?)\s*(k|thousand|lakhs?|lac|lpa|l)?\b", re.IGNORECASE)
+UNPAID_RE = re.compile(r"\b(unpaid|no stipend|nil|none)\b", re.IGNORECASE)
+
+
+@lru_cache(maxsize=65536)
+def parse_stipend(text):
+    """Amount, currency and period from free text like '₹15,000/month', or None"""
+    text = (text or "").strip()
+    if UNPAID_RE.search(text):
+        return Stipend(0.0, "INR", "month", 0.0)
+    amounts = AMOUNT_RE.findall(text)
+    if not amounts:
+        return None
+    # Ranges such as "10,000 - 15,000" are stored at their lower bound.
+    number, suffix = amounts[0]
+    amount = float(number.replace(",", "")) * MULTIPLIERS.get(suffix.lower(), 1.0)
+
+    folded = text.casefold()
+    currency = "INR"
+    for symbol, code in CURRENCY_SYMBOLS.items():
+        if (symbol in folded) if not symbol.isalpha() else re.search(rf"\b{re.escape(symbol)}", folded):
+            currency = code
+            break
+
+    period = "month"
+    for word, name in PERIODS.items():
+        if re.search(rf"(?<![a-z]){re.escape(word)}(?![a-z])", folded):
+            period = name
+            break
+    if suffix.lower() == "lpa":
+        period = "year"
+
+    monthly_inr = amount * MONTHLY_FACTORS[period] * INR_RATES[currency]
+    return Stipend(amount, currency, period, round(monthly_inr, 2))
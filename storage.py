@@ -0,0 +1,545 @@
+import json
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+from stipends import parse_stipend
+
+DB_PATH = os.environ.get("INTERNMATCH_DB", os.path.join(os.path.dirname(os.path.abspath(__file__)), "internmatch.db"))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS internships (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    company TEXT NOT NULL,
+    location TEXT NOT NULL,
+    type TEXT NOT NULL,
+    stipend TEXT NOT NULL,
+    description TEXT NOT NULL,
+    linkedin_url TEXT NOT NULL DEFAULT '',
+    duration TEXT NOT NULL DEFAULT '',
+    start_date TEXT,
+    openings INTEGER NOT NULL DEFAULT 1,
+    created_at TEXT NOT NULL,
+    stipend_amount REAL,
+    stipend_currency TEXT,
+    stipend_period TEXT,
+    stipend_monthly REAL,
+    posted_by TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_internships_type ON internships (type);
+CREATE INDEX IF NOT EXISTS idx_internships_location ON internships (location);
+
+CREATE TABLE IF NOT EXISTS internship_skills (
+    internship_id INTEGER NOT NULL REFERENCES internships (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    skill TEXT NOT NULL,
+    PRIMARY KEY (internship_id, position)
+);
+CREATE INDEX IF NOT EXISTS idx_internship_skills_skill ON internship_skills (skill, internship_id);
+
+CREATE TABLE IF NOT EXISTS candidates (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    personality TEXT NOT NULL DEFAULT '',
+    match INTEGER NOT NULL DEFAULT 0,
+    resume_url TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_candidates_personality ON candidates (personality);
+
+CREATE TABLE IF NOT EXISTS candidate_skills (
+    candidate_id INTEGER NOT NULL REFERENCES candidates (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    skill TEXT NOT NULL,
+    PRIMARY KEY (candidate_id, position)
+);
+CREATE INDEX IF NOT EXISTS idx_candidate_skills_skill ON candidate_skills (skill, candidate_id);
+
+CREATE TABLE IF NOT EXISTS candidate_courses (
+    candidate_id INTEGER NOT NULL REFERENCES candidates (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    course TEXT NOT NULL,
+    PRIMARY KEY (candidate_id, position)
+);
+CREATE INDEX IF NOT EXISTS idx_candidate_courses_course ON candidate_courses (course, candidate_id);
+
+CREATE TABLE IF NOT EXISTS applications (
+    internship_id INTEGER NOT NULL REFERENCES internships (id) ON DELETE CASCADE,
+    candidate_id INTEGER NOT NULL REFERENCES candidates (id) ON DELETE CASCADE,
+    status TEXT NOT NULL DEFAULT 'pending',
+    applied_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    version INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (internship_id, candidate_id)
+);
+CREATE INDEX IF NOT EXISTS idx_applications_status ON applications (status, internship_id, candidate_id);
+CREATE INDEX IF NOT EXISTS idx_applications_candidate ON applications (candidate_id);
+
+-- Dashboard aggregates per scope ('' for all recruiters, else a recruiter's email).
+-- day is '' for all-time totals or YYYY-MM-DD for daily buckets.
+CREATE TABLE IF NOT EXISTS stats (
+    scope TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    day TEXT NOT NULL,
+    value INTEGER NOT NULL,
+    PRIMARY KEY (scope, metric, day)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_stats_day ON stats (scope, day);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO meta (key, value) VALUES ('catalog_version', 0);
+INSERT OR IGNORE INTO meta (key, value) VALUES ('candidate_version', 0);
+INSERT OR IGNORE INTO meta (key, value) VALUES ('application_version', 0);
+INSERT OR IGNORE INTO meta (key, value) VALUES ('database_id', abs(random()));
+"""
+
+# Columns added after the first release, created on older databases at startup.
+MIGRATIONS = {
+    "internships": [
+        ("stipend_amount", "REAL"),
+        ("stipend_currency", "TEXT"),
+        ("stipend_period", "TEXT"),
+        ("stipend_monthly", "REAL"),
+        ("posted_by", "TEXT NOT NULL DEFAULT ''"),
+    ],
+    "applications": [
+        ("version", "INTEGER NOT NULL DEFAULT 0"),
+    ],
+}
+POST_MIGRATION = """
+-- Stipend ranges are filtered in memory from the catalog's sorted stipends.
+DROP INDEX IF EXISTS idx_internships_stipend;
+CREATE INDEX IF NOT EXISTS idx_applications_version ON applications (version);
+CREATE INDEX IF NOT EXISTS idx_internships_unparsed ON internships (id) WHERE stipend_period IS NULL;
+"""
+
+
+def _count(scope, metric, day="''", delta=1, when="1"):
+    return f"""
+    INSERT INTO stats (scope, metric, day, value) SELECT {scope}, {metric}, {day}, {delta} WHERE {when}
+    ON CONFLICT (scope, metric, day) DO UPDATE SET value = value + excluded.value;"""
+
+
+_OWNER = "(SELECT posted_by FROM internships WHERE id = NEW.internship_id)"
+_SCOPES = (("''", "1"), ("NEW.posted_by", "NEW.posted_by != ''"))
+_APPLICATION_SCOPES = (("''", "1"), (_OWNER, f"{_OWNER} != ''"))
+
+# Triggers keep the stats table current inside the same transaction as each write,
+# so the dashboard reads a handful of rows instead of scanning applications.
+STATS_TRIGGERS = (f"""
+CREATE TRIGGER IF NOT EXISTS stats_internship_added AFTER INSERT ON internships BEGIN
+{"".join(_count(scope, "'internships'", when=when) + _count(scope, "'internships'", "substr(NEW.created_at, 1, 10)", when=when)
+         for scope, when in _SCOPES)}
+END""", f"""
+CREATE TRIGGER IF NOT EXISTS stats_application_added AFTER INSERT ON applications BEGIN
+{"".join(_count(scope, "'applications'", when=when)
+         + _count(scope, "'applications'", "substr(NEW.applied_at, 1, 10)", when=when)
+         + _count(scope, "'status:' || NEW.status", when=when)
+         for scope, when in _APPLICATION_SCOPES)}
+END""", f"""
+CREATE TRIGGER IF NOT EXISTS stats_application_moved AFTER UPDATE OF status ON applications
+WHEN OLD.status != NEW.status BEGIN
+{"".join(_count(scope, "'status:' || OLD.status", delta=-1, when=when)
+         + _count(scope, "'status:' || NEW.status", when=when)
+         + _count(scope, "'moved:' || NEW.status", "substr(NEW.updated_at, 1, 10)", when=when)
+         for scope, when in _APPLICATION_SCOPES)}
+END""")
+
+# Rebuilds the aggregates from scratch for databases created before the stats table.
+BACKFILL_STATS = """
+WITH scoped_internships AS (
+    SELECT '' AS scope, created_at FROM internships
+    UNION ALL SELECT posted_by, created_at FROM internships WHERE posted_by != ''
+), owned AS (
+    SELECT a.status, a.applied_at, a.updated_at, i.posted_by
+    FROM applications a JOIN internships i ON i.id = a.internship_id
+), scoped_applications AS (
+    SELECT '' AS scope, status, applied_at, updated_at FROM owned
+    UNION ALL SELECT posted_by, status, applied_at, updated_at FROM owned WHERE posted_by != ''
+)
+INSERT OR IGNORE INTO stats (scope, metric, day, value)
+SELECT scope, metric, day, COUNT(*) FROM (
+    SELECT scope, 'internships' AS metric, '' AS day FROM scoped_internships
+    UNION ALL SELECT scope, 'internships', substr(created_at, 1, 10) FROM scoped_internships
+    UNION ALL SELECT scope, 'applications', '' FROM scoped_applications
+    UNION ALL SELECT scope, 'applications', substr(applied_at, 1, 10) FROM scoped_applications
+    UNION ALL SELECT scope, 'status:' || status, '' FROM scoped_applications
+    UNION ALL SELECT scope, 'moved:' || status, substr(updated_at, 1, 10) FROM scoped_applications
+    WHERE status != 'pending'
+) GROUP BY scope, metric, day
+"""
+# Two bounded lookups on (scope, day): the all-time rows, then the daily rows in the window. Without
+# the hint the planner walks every row of the scope through the primary key to group by metric.
+SELECT_STATS = """
+SELECT metric, 1 AS total, value FROM stats INDEXED BY idx_stats_day WHERE scope = :scope AND day = ''
+UNION ALL
+SELECT metric, 0, SUM(value) FROM stats INDEXED BY idx_stats_day
+WHERE scope = :scope AND day >= :since AND day <= :until GROUP BY metric
+"""
+
+INTERNSHIP_COLUMNS = ("id", "title", "company", "location", "type", "stipend", "description",
+                      "linkedin_url", "duration", "start_date", "openings",
+                      "stipend_amount", "stipend_currency", "stipend_period", "stipend_monthly", "posted_by")
+
+INTERNSHIP_DEFAULTS = {"id": None, "linkedin_url": "", "duration": "", "start_date": None, "openings": 1,
+                       "posted_by": ""}
+
+INSERT_INTERNSHIP = f"""
+INSERT INTO internships ({", ".join(INTERNSHIP_COLUMNS)}, created_at)
+VALUES ({", ".join("?" * len(INTERNSHIP_COLUMNS))}, ?)
+"""
+INSERT_INTERNSHIP_SKILL = "INSERT INTO internship_skills (internship_id, position, skill) VALUES (?, ?, ?)"
+SELECT_INTERNSHIPS = f"SELECT {', '.join(INTERNSHIP_COLUMNS)} FROM internships WHERE id > ? ORDER BY id LIMIT ?"
+SELECT_INTERNSHIP_SKILLS = """
+SELECT internship_id, skill FROM internship_skills
+WHERE internship_id > ? AND internship_id <= ? ORDER BY internship_id, position
+"""
+SELECT_VERSION = "SELECT value FROM meta WHERE key = ?"
+BUMP_VERSION = "UPDATE meta SET value = value + 1 WHERE key = ?"
+
+APPLICATION_STATUSES = ("pending", "shortlisted", "rejected")
+INSERT_APPLICATION = """
+INSERT OR IGNORE INTO applications (internship_id, candidate_id, status, applied_at, updated_at, version)
+VALUES (?, ?, 'pending', ?, ?, ?)
+"""
+UPDATE_APPLICATION_STATUS = """
+UPDATE applications SET status = ?, updated_at = ?, version = ?
+WHERE internship_id = ? AND candidate_id = ? AND status != ?
+"""
+SELECT_APPLICATIONS = """
+SELECT internship_id, candidate_id, status, applied_at, updated_at, version FROM applications
+WHERE version > ? ORDER BY version, applied_at, internship_id, candidate_id
+"""
+SELECT_APPLICATION_STATUSES = """
+SELECT internship_id, candidate_id, status, version FROM applications
+WHERE version > ? ORDER BY version, applied_at, internship_id, candidate_id
+"""
+# One probe of the status index per requested key, returned in the order the keys were given.
+SELECT_APPLICATIONS_BY_KEY = """
+SELECT a.internship_id, a.candidate_id, a.status, a.applied_at, a.updated_at, a.version
+FROM json_each(:keys) AS k JOIN applications AS a INDEXED BY idx_applications_status
+ON a.status = :status AND a.internship_id = json_extract(k.value, '$[0]')
+AND a.candidate_id = json_extract(k.value, '$[1]')
+ORDER BY k.key
+"""
+
+# Filter clauses bind a JSON array so each statement's text stays fixed and
+# sqlite3's per-connection statement cache can reuse the prepared query.
+LOCATION_CLAUSE = "EXISTS (SELECT 1 FROM json_each(?) AS loc WHERE instr(i.location, loc.value) > 0)"
+TYPE_CLAUSE = "i.type IN (SELECT value FROM json_each(?))"
+SKILL_CLAUSE = """i.id IN (
+    SELECT s.internship_id FROM internship_skills AS s
+    WHERE s.skill IN (SELECT value FROM json_each(?))
+)"""
+
+INSERT_CANDIDATE = """
+INSERT INTO candidates (id, name, email, personality, match, resume_url)
+VALUES (?, ?, ?, ?, ?, ?)
+"""
+INSERT_CANDIDATE_SKILL = "INSERT INTO candidate_skills (candidate_id, position, skill) VALUES (?, ?, ?)"
+INSERT_CANDIDATE_COURSE = "INSERT INTO candidate_courses (candidate_id, position, course) VALUES (?, ?, ?)"
+SELECT_CANDIDATES = """
+SELECT id, name, email, personality, match, resume_url FROM candidates
+WHERE id > ? ORDER BY id LIMIT ?
+"""
+SELECT_CANDIDATE_SKILLS = """
+SELECT candidate_id, skill FROM candidate_skills
+WHERE candidate_id > ? AND candidate_id <= ? ORDER BY candidate_id, position
+"""
+SELECT_CANDIDATE_COURSES = """
+SELECT candidate_id, course FROM candidate_courses
+WHERE candidate_id > ? AND candidate_id <= ? ORDER BY candidate_id, position
+"""
+
+
+# stipend_period of a stipend that did not parse, so startup does not try it again.
+UNPARSED = ""
+
+
+def _now():
+    return datetime.now().isoformat(timespec="seconds")
+
+
+def stipend_columns(text):
+    """Parsed stipend fields stored alongside the free-text stipend"""
+    stipend = parse_stipend(text)
+    if stipend is None:
+        return {"stipend_amount": None, "stipend_currency": None, "stipend_period": UNPARSED, "stipend_monthly": None}
+    return {
+        "stipend_amount": stipend.amount,
+        "stipend_currency": stipend.currency,
+        "stipend_period": stipend.period,
+        "stipend_monthly": stipend.monthly_inr,
+    }
+
+
+def _json_list(values):
+    return json.dumps(list(values))
+
+
+class ConnectionPool:
+    """Bounded pool of SQLite connections shared across sessions"""
+
+    def __init__(self, path, size=8):
+        self.path = path
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, cached_statements=256)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+
+    @contextmanager
+    def connection(self):
+        self._slots.acquire()
+        try:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = self._connect()
+            try:
+                yield conn
+            finally:
+                self._idle.put(conn)
+        finally:
+            self._slots.release()
+
+
+class CatalogStore:
+    """SQLite-backed store for internships, candidates and applications"""
+
+    def __init__(self, path=DB_PATH, pool_size=8):
+        self.pool = ConnectionPool(path, pool_size)
+        with self.pool.connection() as conn:
+            conn.executescript(SCHEMA)
+            for table, columns in MIGRATIONS.items():
+                existing = {row["name"] for row in conn.execute(f"PRAGMA table_info({table})")}
+                for column, column_type in columns:
+                    if column not in existing:
+                        conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+            conn.executescript(POST_MIGRATION)
+            self._backfill_stipends(conn)
+            # One write transaction, so two processes starting together cannot both backfill
+            # and no write lands between the backfill and the triggers that take over from it.
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                if conn.execute("SELECT 1 FROM stats LIMIT 1").fetchone() is None:
+                    conn.execute(BACKFILL_STATS)
+                for trigger in STATS_TRIGGERS:
+                    conn.execute(trigger)
+
+    def _backfill_stipends(self, conn):
+        """Parse stipends saved before the parsed columns existed; each row is tried once"""
+        rows = conn.execute("SELECT id, stipend FROM internships WHERE stipend_period IS NULL").fetchall()
+        with conn:
+            conn.executemany(
+                """UPDATE internships SET stipend_amount = :stipend_amount, stipend_currency = :stipend_currency,
+                   stipend_period = :stipend_period, stipend_monthly = :stipend_monthly WHERE id = :id""",
+                [dict(stipend_columns(stipend), id=internship_id) for internship_id, stipend in rows]
+            )
+
+    def is_empty(self):
+        with self.pool.connection() as conn:
+            return conn.execute("SELECT NOT EXISTS (SELECT 1 FROM internships)").fetchone()[0] == 1
+
+    def seed(self, internships, candidates, applications=()):
+        """Load sample data into an empty database"""
+        if self.is_empty():
+            self.add_internships(internships)
+            self.add_candidates(candidates)
+            self.add_applications(applications)
+
+    def add_internship(self, internship):
+        """Save one posting and return its id"""
+        return self.add_internships([internship])[0]
+
+    def add_internships(self, internships):
+        """Save a batch of postings in one transaction and return their ids"""
+        ids = []
+        created_at = _now()
+        with self.pool.connection() as conn, conn:
+            for internship in internships:
+                if "stipend_monthly" not in internship:
+                    internship = dict(internship, **stipend_columns(internship["stipend"]))
+                row = [internship.get(column, INTERNSHIP_DEFAULTS.get(column)) for column in INTERNSHIP_COLUMNS]
+                internship_id = conn.execute(INSERT_INTERNSHIP, row + [created_at]).lastrowid
+                conn.executemany(INSERT_INTERNSHIP_SKILL, [
+                    (internship_id, position, skill)
+                    for position, skill in enumerate(internship["required_skills"])
+                ])
+                ids.append(internship_id)
+            conn.execute(BUMP_VERSION, ("catalog_version",))
+        return ids
+
+    def _version(self, key):
+        with self.pool.connection() as conn:
+            return conn.execute(SELECT_VERSION, (key,)).fetchone()[0]
+
+    def _next_version(self, conn, key):
+        conn.execute(BUMP_VERSION, (key,))
+        return conn.execute(SELECT_VERSION, (key,)).fetchone()[0]
+
+    def database_id(self):
+        """Random number chosen when the database was created, to tell databases apart"""
+        return self._version("database_id")
+
+    def catalog_version(self):
+        """Counter bumped by every transaction that adds postings"""
+        return self._version("catalog_version")
+
+    def candidate_version(self):
+        """Counter bumped by every transaction that adds candidates"""
+        return self._version("candidate_version")
+
+    def application_version(self):
+        """Counter bumped on every application write"""
+        return self._version("application_version")
+
+    def internships(self, after_id=0, limit=-1):
+        """Postings with an id above after_id as dicts, in id order, at most limit of them"""
+        with self.pool.connection() as conn:
+            rows = conn.execute(SELECT_INTERNSHIPS, (after_id, limit)).fetchall()
+            if not rows:
+                return []
+            # Skills commit with their posting, so bounding by the last row read
+            # keeps the two queries consistent without a read transaction.
+            skills = {}
+            for internship_id, skill in conn.execute(SELECT_INTERNSHIP_SKILLS, (after_id, rows[-1]["id"])):
+                skills.setdefault(internship_id, []).append(skill)
+            return [dict(row, required_skills=skills.get(row["id"], [])) for row in rows]
+
+    def skill_names(self):
+        """Distinct skill names used by saved postings"""
+        with self.pool.connection() as conn:
+            return [row[0] for row in conn.execute("SELECT DISTINCT skill FROM internship_skills ORDER BY skill")]
+
+    def filter_internship_ids(self, locations=(), types=(), skills=()):
+        """IDs of postings passing the Browse Internships filters"""
+        clauses, params = [], []
+        for clause, values in ((LOCATION_CLAUSE, locations), (TYPE_CLAUSE, types), (SKILL_CLAUSE, skills)):
+            if values:
+                clauses.append(clause)
+                params.append(_json_list(values))
+        sql = "SELECT i.id FROM internships AS i"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        with self.pool.connection() as conn:
+            return [row[0] for row in conn.execute(sql + " ORDER BY i.id", params)]
+
+    def add_candidates(self, candidates):
+        """Save a batch of candidate profiles in one transaction"""
+        with self.pool.connection() as conn, conn:
+            for candidate in candidates:
+                candidate_id = conn.execute(INSERT_CANDIDATE, (
+                    candidate.get("id"), candidate["name"], candidate["email"],
+                    candidate.get("personality", ""), candidate.get("match", 0), candidate.get("resume_url", "")
+                )).lastrowid
+                conn.executemany(INSERT_CANDIDATE_SKILL, [
+                    (candidate_id, position, skill) for position, skill in enumerate(candidate["skills"])
+                ])
+                conn.executemany(INSERT_CANDIDATE_COURSE, [
+                    (candidate_id, position, course) for position, course in enumerate(candidate["courses"])
+                ])
+            conn.execute(BUMP_VERSION, ("candidate_version",))
+
+    def candidates(self, after_id=0, limit=-1):
+        """Candidate profiles with an id above after_id as dicts, in id order, at most limit of them"""
+        with self.pool.connection() as conn:
+            rows = conn.execute(SELECT_CANDIDATES, (after_id, limit)).fetchall()
+            if not rows:
+                return []
+            bounds = (after_id, rows[-1]["id"])
+            skills, courses = {}, {}
+            for candidate_id, skill in conn.execute(SELECT_CANDIDATE_SKILLS, bounds):
+                skills.setdefault(candidate_id, []).append(skill)
+            for candidate_id, course in conn.execute(SELECT_CANDIDATE_COURSES, bounds):
+                courses.setdefault(candidate_id, []).append(course)
+            return [dict(row, skills=skills.get(row["id"], []), courses=courses.get(row["id"], [])) for row in rows]
+
+    def row_count(self, table, up_to_id):
+        """Postings or candidates with an id up to up_to_id"""
+        if table not in ("internships", "candidates"):
+            raise ValueError(f"unknown table: {table}")
+        with self.pool.connection() as conn:
+            return conn.execute(f"SELECT COUNT(*) FROM {table} WHERE id <= ?", (up_to_id,)).fetchone()[0]
+
+    def add_applications(self, applications):
+        """Record (internship_id, candidate_id[, applied_at]) applications as pending; repeats are ignored"""
+        applications = list(applications)
+        if not applications:
+            return 0
+        now = _now()
+        with self.pool.connection() as conn, conn:
+            version = self._next_version(conn, "application_version")
+            cursor = conn.executemany(INSERT_APPLICATION, [
+                (key[0], key[1], key[2] if len(key) > 2 else now, now, version) for key in applications
+            ])
+            return cursor.rowcount
+
+    def set_application_status(self, keys, status):
+        """Move (internship_id, candidate_id) applications to a status in one transaction"""
+        return self.update_application_statuses((key, status) for key in keys)
+
+    def update_application_statuses(self, changes):
+        """Apply ((internship_id, candidate_id), status) changes in one transaction"""
+        changes = list(changes)
+        for _, status in changes:
+            if status not in APPLICATION_STATUSES:
+                raise ValueError(f"unknown application status: {status}")
+        if not changes:
+            return 0
+        now = _now()
+        with self.pool.connection() as conn, conn:
+            version = self._next_version(conn, "application_version")
+            cursor = conn.executemany(UPDATE_APPLICATION_STATUS, [
+                (status, now, version, internship_id, candidate_id, status)
+                for (internship_id, candidate_id), status in changes
+            ])
+            return cursor.rowcount
+
+    def applications(self, after_version=0):
+        """Applications written after the given version, oldest write first"""
+        with self.pool.connection() as conn:
+            return [dict(row) for row in conn.execute(SELECT_APPLICATIONS, (after_version,))]
+
+    def application_statuses(self, after_version=0, chunk_size=10000):
+        """(internship_id, candidate_id, status, version) of applications written after the given version,
+        oldest write first, streamed a chunk at a time"""
+        with self.pool.connection() as conn:
+            cursor = conn.execute(SELECT_APPLICATION_STATUSES, (after_version,))
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    return
+                yield from map(tuple, rows)
+
+    def applications_by_key(self, status, keys):
+        """Applications with a status among the given (internship_id, candidate_id) keys, in key order"""
+        keys = [list(key) for key in keys]
+        if not keys:
+            return []
+        with self.pool.connection() as conn:
+            return [dict(row) for row in conn.execute(SELECT_APPLICATIONS_BY_KEY,
+                                                      {"keys": json.dumps(keys), "status": status})]
+
+    def dashboard_stats(self, scope="", days=7):
+        """All-time totals and totals over the last few days, read from the stats aggregates"""
+        today = datetime.now().date()
+        window = {"scope": scope, "since": (today - timedelta(days=days - 1)).isoformat(), "until": today.isoformat()}
+        totals, recent = {}, {}
+        with self.pool.connection() as conn:
+            for metric, total, value in conn.execute(SELECT_STATS, window):
+                (totals if total else recent)[metric] = value
+        return totals, recent
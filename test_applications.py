@@ -0,0 +1,53 @@
+from applications import ApplicationIndex
+from storage import CatalogStore
+
+
+def posting(title):
+    return {"title": title, "company": "Acme", "location": "Pune", "type": "Remote", "stipend": "₹8,000/month",
+            "description": "", "required_skills": ["Python"]}
+
+
+def make_store(tmp_path):
+    store = CatalogStore(str(tmp_path / "test.db"), pool_size=2)
+    store.add_internships([posting("A"), posting("B")])
+    store.add_candidates([{"name": name, "email": f"{name}@x", "skills": [], "courses": []} for name in "abc"])
+    store.add_applications([(1, 1, "2026-01-01"), (1, 2, "2026-01-02"), (2, 3, "2026-01-03")])
+    return store
+
+
+def test_apply_keeps_one_ordered_set_per_status():
+    index = ApplicationIndex()
+    index.apply([(1, 1, "pending"), (1, 2, "pending"), (2, 1, "pending")])
+    index.apply([(1, 1, "shortlisted"), (2, 1, "rejected"), (1, 1, "rejected")])
+    assert index.counts() == {"pending": 1, "shortlisted": 0, "rejected": 2}
+    assert len(index) == 3
+    assert index.page_keys("rejected") == [(2, 1), (1, 1)]
+    assert index.page_keys("pending", page=1, per_page=1) == []
+
+
+def test_sync_pulls_writes_from_any_session(tmp_path):
+    store = make_store(tmp_path)
+    index, other = ApplicationIndex(), ApplicationIndex()
+    index.sync(store)
+    assert index.page_keys("pending") == [(1, 1), (1, 2), (2, 3)]
+    other.sync(store)
+    store.set_application_status([(1, 2)], "shortlisted")
+    store.add_applications([(2, 1)])
+    index.sync(store)
+    other.sync(store)
+    for synced in (index, other):
+        assert synced.page_keys("pending") == [(1, 1), (2, 3), (2, 1)]
+        assert synced.page_keys("shortlisted") == [(1, 2)]
+    assert index.store_version == store.application_version()
+
+
+def test_page_reads_rows_from_the_store(tmp_path):
+    store = make_store(tmp_path)
+    index = ApplicationIndex()
+    index.sync(store)
+    rows = index.page(store, "pending", page=0, per_page=2)
+    assert [(r["internship_id"], r["candidate_id"], r["applied_at"]) for r in rows] == [
+        (1, 1, "2026-01-01"), (1, 2, "2026-01-02")]
+    # A key another session has moved since the last sync is left off the page.
+    store.set_application_status([(1, 1)], "rejected")
+    assert [r["candidate_id"] for r in index.page(store, "pending", per_page=2)] == [2]
@@ -0,0 +1,51 @@
+from candidates import CandidateIndex
+from columnar import Table, TableWriter
+from skills import SkillRegistry
+
+CANDIDATES = [
+    {"id": 1, "name": "A", "email": "a@x", "personality": "Analytical Thinker - Loves data",
+     "skills": ["Python", "SQL"], "courses": ["DBMS"]},
+    {"id": 2, "name": "B", "email": "b@x", "personality": "Creative Builder",
+     "skills": ["py", "React", "SQL"], "courses": ["Web Development", "DBMS"]},
+    {"id": 3, "name": "C", "email": "c@x", "personality": "Analytical Thinker",
+     "skills": ["React"], "courses": []},
+]
+
+
+def names(page):
+    return [candidate.name for candidate in page.candidates]
+
+
+def check_search(index):
+    assert names(index.search(["python", "SQL"])) == ["A", "B"]
+    page = index.search(["Python", "React"], match_all_skills=False)
+    assert names(page) == ["B", "A", "C"]
+    assert page.scores == [100.0, 50.0, 50.0]
+    assert names(index.search(personalities=["Analytical Thinker"])) == ["A", "C"]
+    assert names(index.search(courses=["DBMS", "Web Development"], match_all_courses=True)) == ["B"]
+    assert index.search(["Python"], per_page=1, page=1).candidates[0].name == "B"
+    assert index.search(["Rust"]).total == 0
+
+
+def test_search_all_and_any():
+    check_search(CandidateIndex(CANDIDATES, registry=SkillRegistry()))
+
+
+def test_search_over_a_snapshot_and_later_rows(tmp_path):
+    writer = TableWriter("candidates")
+    writer.extend(CANDIDATES[:2])
+    writer.write(tmp_path / "candidates.col")
+    index = CandidateIndex(registry=SkillRegistry())
+    index.load_snapshot(Table(tmp_path / "candidates.col"))
+    index.add_many(CANDIDATES[2:])
+    assert index.get(2).skills == ("py", "React", "SQL")
+    assert index.get(4) is None
+    check_search(index)
+
+
+def test_candidate_skills_are_registered():
+    registry = SkillRegistry(["Python"])
+    index = CandidateIndex(CANDIDATES[:1], registry=registry)
+    assert index.get(1).skill_ids == (registry.lookup("Python"), registry.lookup("SQL"))
+    assert names(index.search(["sql"])) == ["A"]
+    assert index.search(["Rust", "Go"], match_all_skills=False).total == 0
@@ -0,0 +1,84 @@
+from catalog import InternshipCatalog
+from columnar import Table, export
+from datagen import Generator
+from skills import SkillRegistry
+from storage import CatalogStore
+
+
+def posting(internship_id, skills, stipend="₹10,000/month", location="Pune"):
+    return {"id": internship_id, "title": f"Intern {internship_id}", "company": "Acme", "location": location,
+            "type": "Remote", "stipend": stipend, "description": "", "required_skills": skills}
+
+
+def test_skill_mask_matches_canonical_names():
+    catalog = InternshipCatalog([posting(1, ["Copywriting", "ML"]), posting(2, ["Python"])], registry=SkillRegistry())
+    assert catalog.skill_options() == ["Content Writing", "Machine Learning", "Python"]
+    assert catalog.skill_mask(["Content Writing"]).tolist() == [True, False]
+    assert catalog.skill_mask(["machine learning", "Python"]).tolist() == [True, True]
+    assert not catalog.skill_mask(["Rust"]).any()
+
+
+def test_stipend_ranges_and_ranks():
+    stipends = ["₹8,000/month", "Unpaid", "₹20,000/month", "Performance based", "₹8,000/month", "$200/month"]
+    catalog = InternshipCatalog([posting(i + 1, ["Python"], stipend) for i, stipend in enumerate(stipends)],
+                                registry=SkillRegistry())
+    assert catalog.stipend_range() == (0.0, 20000.0)
+    assert catalog.stipend_positions(5000, 16600).tolist() == [0, 4, 5]
+    assert catalog.stipend_mask(8000, 8000).tolist() == [True, False, False, False, True, False]
+    assert catalog.stipend_positions(low=30000).tolist() == []
+    high_first = catalog.stipend_ranks(descending=True)
+    assert catalog.top_k(range(6), high_first, 6) == [2, 5, 0, 4, 1, 3]
+    assert catalog.top_k(range(6), catalog.stipend_ranks(), 6) == [1, 0, 4, 5, 2, 3]
+
+
+def test_skill_positions_span_snapshot_and_added_postings(tmp_path):
+    store = CatalogStore(str(tmp_path / "test.db"))
+    store.add_internships([posting(1, ["Python", "SQL"]), posting(2, ["SQL"]), posting(3, ["py", "React"])])
+    export(store, "internships", tmp_path / "internships.col")
+    registry = SkillRegistry()
+    catalog = InternshipCatalog(registry=registry)
+    catalog.load_snapshot(Table(tmp_path / "internships.col"))
+    catalog.add_many([posting(4, ["Python"]), posting(5, ["Go"])])
+    assert catalog.skill_positions(registry.lookup("Python")).tolist() == [0, 2, 3]
+    assert catalog.skill_positions(registry.lookup("SQL")).tolist() == [0, 1]
+    assert catalog.skill_positions(registry.lookup("Go")).tolist() == [4]
+    assert catalog.skill_mask(["React", "Go"]).tolist() == [False, False, True, False, True]
+
+
+def test_match_counts_patch_in_place():
+    registry = SkillRegistry()
+    catalog = InternshipCatalog([posting(1, ["Python", "SQL"]), posting(2, ["SQL"]), posting(3, ["React"])],
+                                registry=registry)
+    counts = catalog.match_counts(["python", "SQL"])
+    assert counts.tolist() == [2, 1, 0] and counts.dtype.itemsize == 2
+    assert catalog.recommend_from_counts(counts).tolist() == [0, 1]
+    catalog.patch_match_counts(counts, [registry.lookup("SQL")], -1)
+    catalog.add(posting(4, ["Python"]))
+    catalog.patch_match_counts(counts, [registry.lookup("Python")], -1)
+    assert counts.tolist() == [0, 0, 0]
+    assert catalog.recommend_from_counts(counts).tolist() == [0, 1, 2]
+
+
+def test_recommend_matches_the_linear_scan():
+    registry = SkillRegistry()
+    internships = list(Generator(seed=3).internships(400))
+    catalog = InternshipCatalog(internships, registry=registry)
+    for skills in (["python", "SQL"], ["ML", "Figma", "Rust"], ["Rust"], []):
+        wanted = set(registry.normalize(skills))
+        expected = [p for p, i in enumerate(internships) if wanted & set(registry.normalize(i["required_skills"]))]
+        assert catalog.recommend(skills).tolist() == (expected or list(range(len(internships))))
+
+
+def test_top_k_pages_follow_a_full_sort():
+    internships = list(Generator(seed=5).internships(300))
+    catalog = InternshipCatalog(internships, registry=SkillRegistry())
+    percent = catalog.score(["Python", "SQL", "Excel"]).percent
+    positions = catalog.recommend(["Python", "SQL", "Excel"])
+    expected = sorted(positions.tolist(), key=lambda p: (-percent[p], p))
+    ranked = []
+    for page in range(len(expected) // 10 + 1):
+        end = min((page + 1) * 10, len(expected))
+        if len(ranked) < end:
+            ranked = catalog.top_k(positions, percent, max(end, 2 * len(ranked)))
+        assert ranked[page * 10:end] == expected[page * 10:end]
+    assert catalog.top_k(positions, percent, len(expected) + 5) == expected
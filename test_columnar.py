@@ -0,0 +1,37 @@
+import pytest
+
+from columnar import Table, TableWriter
+
+INTERNSHIP = {
+    "id": 7, "title": "Data Intern", "company": "Acme", "location": "Pune", "type": "Remote",
+    "stipend": "₹10,000/month", "description": "Dashboards", "linkedin_url": "", "duration": "3 months",
+    "start_date": None, "openings": 2, "stipend_amount": 10000.0, "stipend_currency": "INR",
+    "stipend_period": "month", "stipend_monthly": 10000.0, "posted_by": "r@x",
+    "required_skills": ["SQL", "Python", "SQL"],
+}
+
+
+def test_rows_round_trip(tmp_path):
+    other = dict(INTERNSHIP, id=8, title="Web Intern", stipend_amount=None, stipend_monthly=None,
+                 required_skills=["React"])
+    writer = TableWriter("internships")
+    writer.extend([INTERNSHIP, other])
+    writer.write(tmp_path / "internships.col", meta={"version": 3})
+
+    table = Table(tmp_path / "internships.col")
+    assert (len(table), table.meta) == (2, {"version": 3})
+    assert table.row(0) == dict(INTERNSHIP, required_skills=["SQL", "Python"])
+    row = table.row(1)
+    assert row["stipend_amount"] is None and row["required_skills"] == ["React"]
+    assert table.column("id").tolist() == [7, 8]
+    assert table.row(0)["company"] is table.row(1)["company"]
+    react = writer.intern("React")
+    assert table.rows_containing("required_skills", [react]).tolist() == [1]
+    table.close()
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "junk.col"
+    path.write_bytes(b"not a snapshot" * 8)
+    with pytest.raises(ValueError):
+        Table(path)
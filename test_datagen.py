@@ -0,0 +1,23 @@
+from collections import Counter
+
+from datagen import Generator
+
+
+def pairs(count, internships, candidates):
+    return [(a["internship_id"], a["candidate_id"]) for a in Generator().applications(count, internships, candidates)]
+
+
+def test_applications_reach_every_posting():
+    # 7919 postings once sent every application to posting 1.
+    applications = pairs(79190, 7919, 10)
+    assert len(set(applications)) == len(applications) == 79190
+    assert set(Counter(i for i, _ in applications).values()) == {10}
+
+
+def test_applications_stop_when_pairs_run_out():
+    assert sorted(pairs(100, 5, 2)) == [(i, c) for i in range(1, 6) for c in (1, 2)]
+
+
+def test_applications_favour_popular_postings():
+    counts = Counter(i for i, _ in pairs(5000, 1000, 1000)).most_common()
+    assert counts[0][1] > 10 * counts[-1][1]
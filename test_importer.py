@@ -0,0 +1,54 @@
+import io
+import json
+
+from importer import import_internships, validate
+from skills import SkillRegistry
+from storage import CatalogStore
+
+ROW = {"job_title": "Data Intern", "company_name": "Acme", "location": "Pune", "type": "on site",
+       "stipend": "₹8,000/month", "skills": "py; ML, rust |", "description": "Clean data", "openings": "2"}
+
+
+def test_validate_normalizes_a_row():
+    registry = SkillRegistry()
+    internship = validate(dict(ROW, duration="3 months"), registry)
+    assert internship["title"] == "Data Intern" and internship["company"] == "Acme"
+    assert internship["type"] == "On-site"
+    assert internship["required_skills"] == ["Python", "Machine Learning", "rust"]
+    assert internship["openings"] == 2 and internship["duration"] == "3 months"
+    assert registry.lookup("RUST") is not None
+    assert validate(dict(ROW, openings="0"), registry)["openings"] == 1
+
+
+def test_validate_rejects_without_registering_skills():
+    registry = SkillRegistry()
+    assert validate(dict(ROW, company_name=" ", location=""), registry) == "missing company, location"
+    assert validate(dict(ROW, type="Freelance"), registry).startswith("type must be one of")
+    assert validate(dict(ROW, skills=";,"), registry) == "missing required_skills"
+    assert validate(dict(ROW, openings="two"), registry) == "openings must be a whole number"
+    assert len(registry) == 0
+
+
+def test_import_csv_jsonl_and_json(tmp_path):
+    store = CatalogStore(str(tmp_path / "test.db"), pool_size=2)
+    registry = SkillRegistry()
+    bad = dict(ROW, type="")
+    csv_text = "\n".join(",".join(f'"{v}"' for v in row) for row in (ROW, ROW.values(), bad.values()))
+    report = import_internships(io.BytesIO(csv_text.encode()), store, "csv", chunk_size=1, registry=registry)
+    assert (report.read, report.imported, report.rejected) == (2, 1, 1)
+    assert report.reject_samples == [{"line": 3, "reason": "type must be one of Remote, On-site, Hybrid"}]
+
+    jsonl = "\n".join([json.dumps(ROW), "", "{oops", json.dumps([ROW])]).encode()
+    report = import_internships(io.BytesIO(jsonl), store, "jsonl", registry=registry, posted_by="r@x")
+    assert (report.read, report.imported, report.rejected) == (3, 1, 2)
+    assert [s["line"] for s in report.reject_samples] == [3, 4]
+    assert report.reject_samples[1]["reason"] == "expected a JSON object"
+
+    report = import_internships(io.BytesIO(json.dumps([ROW, bad, ROW]).encode()), store, "json", registry=registry)
+    assert (report.read, report.imported, report.rejected) == (3, 2, 1)
+    assert report.reject_samples[0]["line"] == 2
+
+    internships = store.internships()
+    assert len(internships) == 4
+    assert [i["posted_by"] for i in internships] == ["", "r@x", "", ""]
+    assert sorted(internships[0]["required_skills"]) == ["Machine Learning", "Python", "rust"]
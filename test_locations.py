@@ -0,0 +1,25 @@
+from locations import REMOTE, location_keys, parse_location
+
+
+def test_known_city_fills_state_and_country():
+    location = parse_location("Bengaluru")
+    assert (location.city, location.country) == ("Bangalore", "India")
+    assert location.state == "Karnataka"
+    assert not location.remote
+
+
+def test_remote_with_city():
+    location = parse_location("Remote / Mumbai")
+    assert location.remote
+    assert location.city == "Mumbai"
+    assert location_keys(location) == ["Mumbai", "Maharashtra", "India", REMOTE]
+
+
+def test_state_abbreviation_after_city():
+    location = parse_location("San Jose, CA")
+    assert (location.city, location.state, location.country) == ("San Jose", "California", "United States")
+
+
+def test_unknown_city_is_title_cased():
+    assert parse_location("  springfield  ").city == "Springfield"
+    assert location_keys(parse_location("")) == []
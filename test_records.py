@@ -0,0 +1,37 @@
+import pytest
+
+from records import Candidate, Education, Internship, Project
+from skills import SkillRegistry
+
+
+def test_internship_from_a_store_row():
+    registry = SkillRegistry(["SQL"])
+    row = {"id": 7, "title": "Data Intern", "company": "Acme", "location": "Pune", "type": "Remote",
+           "stipend": "₹8,000/month", "description": "", "required_skills": ["Python", "SQL"], "extra": 1}
+    internship = Internship.from_dict(row, registry)
+    assert internship.skill_ids == (registry.lookup("Python"), 0)
+    other = Internship.from_dict(dict(row, required_skills=["".join(["Pyt", "hon"])]), registry)
+    assert other.required_skills[0] is internship.required_skills[0]
+    assert internship["title"] == "Data Intern" and internship.get("extra") is None
+    assert internship.openings == 1 and internship.posted_by == "" and internship.start_date is None
+    with pytest.raises(KeyError):
+        internship["extra"] = 1
+    internship["location"] = "Remote"
+    assert dict(internship) == internship.to_dict()
+    assert internship.to_dict()["location"] == "Remote" and "extra" not in internship.to_dict()
+
+
+def test_candidate_registers_its_skills():
+    registry = SkillRegistry()
+    candidate = Candidate.from_dict({"id": 1, "name": "A", "email": "a@x", "skills": ["py", "React"],
+                                     "courses": None}, registry)
+    assert candidate.skill_ids == (registry.lookup("Python"), registry.lookup("react"))
+    assert candidate.courses == () and candidate.personality == "" and candidate.match == 0
+    assert len(candidate) == len(Candidate.__slots__)
+
+
+def test_resume_entries():
+    project = Project.create("Bot", "A chat bot", tags=["nlp"], skills=["Python"])
+    assert project.to_dict() == {"name": "Bot", "description": "A chat bot", "tags": ("nlp",), "skills": ("Python",)}
+    assert Education(degree="B.Tech", college="IIT").to_dict() == {"degree": "B.Tech", "college": "IIT",
+                                                                   "year": "", "marks": ""}
@@ -0,0 +1,40 @@
+import numpy as np
+
+from search import TextIndex, tokenize
+
+
+def make_index():
+    index = TextIndex()
+    for text in ("Python developer", "Python and Django developer, Python backend", "React frontend", ""):
+        index.add(text)
+    return index
+
+
+def test_tokenize_keeps_symbols_and_drops_stopwords():
+    assert tokenize("The C++ and Node.js intern") == ["c++", "node.js", "intern"]
+
+
+def test_bm25_ranks_by_term_frequency_and_rarity():
+    scores = make_index().search("python django")
+    assert scores[1] > scores[0] > 0
+    assert scores[2] == scores[3] == 0
+    assert make_index().search("golang").sum() == 0
+
+
+def test_dump_load_round_trip():
+    index = make_index()
+    loaded = TextIndex()
+    loaded.load(*index.dump())
+    for query in ("python", "react frontend", "developer"):
+        np.testing.assert_allclose(loaded.search(query), index.search(query))
+
+
+def test_loaded_index_keeps_adding_rows():
+    index = make_index()
+    loaded = TextIndex()
+    loaded.load(*index.dump())
+    for target in (index, loaded):
+        target.add("Senior Python engineer")
+    assert len(loaded) == 5
+    np.testing.assert_allclose(loaded.search("python engineer"), index.search("python engineer"))
+    assert loaded.dump()[2].tolist() == index.dump()[2].tolist()
@@ -0,0 +1,32 @@
+from skills import SkillCounter, SkillRegistry
+
+
+def test_aliases_share_an_id():
+    registry = SkillRegistry()
+    assert registry.id("ML") == registry.id("machine  learning") == registry.id("Machine Learning")
+    assert registry.name(registry.id("js")) == "JavaScript"
+    assert len(registry) == 2
+
+
+def test_lookups_never_register():
+    registry = SkillRegistry(["Python"])
+    assert registry.lookup("Rust") is None
+    assert registry.known_ids(["python3", "Rust", "Python"]) == [registry.id("Python")]
+    assert registry.normalize(["py", "Python", "rust ", "RUST"]) == ["Python", "rust"]
+    assert registry.key("Py") == registry.key("python") == "python"
+    assert len(registry) == 1
+
+
+def test_ids_are_unique_in_first_seen_order():
+    registry = SkillRegistry(["SQL", "Python"])
+    assert list(registry.ids(["Python", "sql", "python"])) == [1, 0]
+    assert registry.ids_in_mask(registry.mask([0, 3])) == [0, 3]
+
+
+def test_counter_reports_only_first_and_last_source():
+    counter = SkillCounter()
+    assert counter.add([1, 2]).added == [1, 2]
+    assert counter.add([2, 3]).added == [3]
+    assert counter.remove([2]).removed == []
+    assert counter.remove([1, 2, 9]).removed == [1, 2]
+    assert list(counter) == [3]
@@ -0,0 +1,27 @@
+from stipends import parse_stipend
+
+
+def test_monthly_rupees():
+    assert parse_stipend("₹15,000/month") == (15000.0, "INR", "month", 15000.0)
+
+
+def test_range_uses_lower_bound():
+    assert parse_stipend("10,000 - 15,000 per month").amount == 10000.0
+
+
+def test_suffix_and_period():
+    stipend = parse_stipend("3 LPA")
+    assert (stipend.amount, stipend.period) == (300000.0, "year")
+    assert stipend.monthly_inr == 25000.0
+
+
+def test_foreign_currency_is_converted():
+    stipend = parse_stipend("$500 per week")
+    assert (stipend.currency, stipend.period) == ("USD", "week")
+    assert stipend.monthly_inr == round(500 * 52 / 12 * 83.0, 2)
+
+
+def test_unpaid_and_unparsed():
+    assert parse_stipend("Unpaid").monthly_inr == 0.0
+    assert parse_stipend("Performance based") is None
+    assert parse_stipend("") is None
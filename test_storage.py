@@ -0,0 +1,55 @@
+import sqlite3
+
+from storage import CatalogStore
+
+
+def posting(title, posted_by=""):
+    return {"title": title, "company": "Acme", "location": "Pune", "type": "Remote", "stipend": "₹8,000/month",
+            "description": "", "required_skills": ["Python"], "posted_by": posted_by}
+
+
+def make_store(tmp_path):
+    store = CatalogStore(str(tmp_path / "test.db"), pool_size=2)
+    store.add_internships([posting("Mine", "r@x"), posting("Theirs", "s@x")])
+    store.add_candidates([{"name": "A", "email": "a@x", "skills": ["SQL"], "courses": []},
+                          {"name": "B", "email": "b@x", "skills": [], "courses": []}])
+    store.add_applications([(1, 1), (1, 2), (2, 1)])
+    return store
+
+
+def test_versions_count_write_transactions(tmp_path):
+    store = make_store(tmp_path)
+    assert (store.catalog_version(), store.candidate_version(), store.application_version()) == (1, 1, 1)
+    store.set_application_status([(1, 1), (2, 1)], "shortlisted")
+    assert store.application_version() == 2
+    assert [a["version"] for a in store.applications(after_version=1)] == [2, 2]
+    assert store.catalog_version() == 1
+
+
+def test_database_id_survives_reopening(tmp_path):
+    store = make_store(tmp_path)
+    assert CatalogStore(str(tmp_path / "test.db")).database_id() == store.database_id()
+    assert CatalogStore(str(tmp_path / "other.db")).database_id() != store.database_id()
+
+
+def test_stats_triggers_track_writes_per_recruiter(tmp_path):
+    store = make_store(tmp_path)
+    store.set_application_status([(1, 1)], "shortlisted")
+    store.set_application_status([(1, 1)], "shortlisted")
+    store.set_application_status([(2, 1)], "rejected")
+    totals, recent = store.dashboard_stats()
+    assert totals == {"internships": 2, "applications": 3, "status:pending": 1,
+                      "status:shortlisted": 1, "status:rejected": 1}
+    assert recent == {"internships": 2, "applications": 3, "moved:shortlisted": 1, "moved:rejected": 1}
+    totals, recent = store.dashboard_stats("r@x")
+    assert totals == {"internships": 1, "applications": 2, "status:pending": 1, "status:shortlisted": 1}
+    assert recent["moved:shortlisted"] == 1 and "moved:rejected" not in recent
+
+
+def test_stats_backfill_matches_triggers(tmp_path):
+    store = make_store(tmp_path)
+    store.set_application_status([(1, 2)], "rejected")
+    expected = store.dashboard_stats("r@x")
+    with sqlite3.connect(tmp_path / "test.db") as conn:
+        conn.execute("DELETE FROM stats")
+    assert CatalogStore(str(tmp_path / "test.db")).dashboard_stats("r@x") == expected